@@ -0,0 +1,67 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wall time of submitting a batch of orders one by one vs create_orders_bulk.
+
+Each create_order costs a simulated round trip of `latency` seconds. Order
+entry is limited to `rate` orders per second by a TokenBucket, as the
+client's RateLimiter would do, so added concurrency helps only up to that rate.
+
+    python benchmarks/bench_bulk.py [orders] [latency] [rate]
+"""
+
+import sys
+import time
+
+from prime_sdk.bulk import create_orders_bulk
+from prime_sdk.create_order import CreateOrderRequest, CreateOrderResponse
+from prime_sdk.enums import OrderSide, OrderType
+from prime_sdk.rate_limit import TokenBucket
+
+
+def simulated_create_order(latency: float, rate: float):
+    bucket = TokenBucket(rate=rate, capacity=rate)
+
+    def create_order(request):
+        bucket.acquire()
+        time.sleep(latency)
+        return CreateOrderResponse(order_id="order-" + request.client_order_id)
+    return create_order
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 50
+    requests = [CreateOrderRequest(portfolio_id="portfolio", side=OrderSide.BUY, client_order_id=f"child-{i}",
+                                   product_id="BTC-USD", type=OrderType.MARKET, base_quantity="0.001")
+                for i in range(orders)]
+
+    create_order = simulated_create_order(latency, rate)
+    start = time.perf_counter()
+    for request in requests:
+        create_order(request)
+    print(f"sequential        {time.perf_counter() - start:6.2f} s for {orders} orders")
+
+    for concurrency in (4, 8, 16):
+        create_order = simulated_create_order(latency, rate)
+        start = time.perf_counter()
+        results = create_orders_bulk(create_order, requests, concurrency=concurrency)
+        assert all(result.ok for result in results)
+        print(f"concurrency={concurrency:<3}   {time.perf_counter() - start:6.2f} s for {orders} orders")
+
+
+if __name__ == "__main__":
+    main()
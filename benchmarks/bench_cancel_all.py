@@ -0,0 +1,67 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time to flatten a book of open orders with cancel_all_open_orders at several concurrencies.
+
+Every list_open_orders and cancel_order costs a simulated round trip of
+`latency` seconds, and a cancelled order leaves the book once it has been
+acknowledged. concurrency=1 is the same as cancelling the orders one by one.
+
+    python benchmarks/bench_cancel_all.py [orders] [latency]
+"""
+
+import sys
+import threading
+import time
+
+from prime_sdk.cancel_all import cancel_all_open_orders
+from prime_sdk.cancel_order import CancelOrderResponse
+from prime_sdk.list_open_orders import ListOpenOrdersResponse
+from prime_sdk.model import Order
+
+
+def simulated_book(orders: int, latency: float):
+    fields = dict.fromkeys(Order.__dataclass_fields__)
+    book = {f"order-{i}": Order(**dict(fields, id=f"order-{i}")) for i in range(orders)}
+    lock = threading.Lock()
+
+    def list_open_orders(request):
+        time.sleep(latency)
+        with lock:
+            return ListOpenOrdersResponse(orders=list(book.values()))
+
+    def cancel_order(request):
+        time.sleep(latency)
+        with lock:
+            book.pop(request.order_id, None)
+        return CancelOrderResponse(id=request.order_id)
+    return list_open_orders, cancel_order
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+
+    for concurrency in (1, 8, 32, 64):
+        list_open_orders, cancel_order = simulated_book(orders, latency)
+        result = cancel_all_open_orders(list_open_orders, cancel_order, "portfolio", concurrency=concurrency,
+                                        deadline=None, verify_interval=0)
+        assert result.flat and len(result.cancelled) == orders
+        print(f"concurrency={concurrency:<3}   {result.time_to_flatten:6.2f} s to flatten {orders} orders "
+              f"({result.rounds} listings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Decimal conversion of fill money fields: naive Decimal(str) per access vs the
+<field>_decimal accessors vs decimal_columns().
+
+Each loop reads price, filled_quantity and commission `reads` times per fill,
+as reconciliation code that revisits the same records does.
+
+    python benchmarks/bench_decimals.py [fills] [reads]
+"""
+
+import sys
+import time
+from decimal import Decimal
+
+from prime_sdk.decimals import decimal_columns
+from prime_sdk.model import Fill
+
+
+def fills(count: int) -> list:
+    return [Fill(id=f"fill-{i}", order_id=f"order-{i}", product_id="BTC-USD", client_product_id="BTC-USD",
+                 side="BUY", filled_quantity=f"0.{i % 997:04d}", filled_value=f"{i % 10007}.{i % 100:02d}",
+                 price=f"{60000 + i % 500}.25", time="2025-01-01T00:00:00Z", commission="0.61", venue="COINBASE")
+            for i in range(count)]
+
+
+def naive(records: list, reads: int) -> Decimal:
+    total = Decimal(0)
+    for _ in range(reads):
+        for fill in records:
+            total += Decimal(fill.price) * Decimal(fill.filled_quantity) - Decimal(fill.commission)
+    return total
+
+
+def accessors(records: list, reads: int) -> Decimal:
+    total = Decimal(0)
+    for _ in range(reads):
+        for fill in records:
+            total += fill.price_decimal * fill.filled_quantity_decimal - fill.commission_decimal
+    return total
+
+
+def columns(records: list, reads: int) -> Decimal:
+    converted = decimal_columns(records, ("price", "filled_quantity", "commission"))
+    rows = list(zip(converted["price"], converted["filled_quantity"], converted["commission"]))
+    total = Decimal(0)
+    for _ in range(reads):
+        for price, quantity, commission in rows:
+            total += price * quantity - commission
+    return total
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    reads = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    for name, run in (("naive Decimal(str)", naive), ("accessors", accessors),
+                      ("decimal_columns", columns)):
+        records = fills(count)
+        start = time.perf_counter()
+        total = run(records, reads)
+        print(f"{name:<20} {time.perf_counter() - start:6.3f} s   total={total}")
+
+
+if __name__ == "__main__":
+    main()
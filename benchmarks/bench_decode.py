@@ -0,0 +1,117 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-row cost of decoding list responses into model dataclasses.
+
+"legacy" reproduces the original BaseResponse.__post_init__, which resolved
+type hints and walked dataclass fields on every instantiation and converted
+only one level, leaving nested models as dicts. "current" reuses a decode plan
+computed once per class and converts the same level. "full depth" is the
+opt-in full_depth_decoding(), which builds the whole typed tree and so does
+strictly more work on payloads with nested models.
+
+    python benchmarks/bench_decode.py [rows]
+"""
+
+import dataclasses
+import sys
+import timeit
+from typing import get_type_hints
+
+from prime_sdk.base_response import BaseResponse, full_depth_decoding
+from prime_sdk.get_margin_information import GetMarginInformationResponse
+from prime_sdk.get_order import GetOrderResponse
+from prime_sdk.list_margin_call_summaries import ListMarginCallSummariesResponse
+from prime_sdk.list_orders import ListOrdersResponse
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsResponse
+from prime_sdk.list_portfolio_transactions import ListPortfolioTransactionsResponse
+from prime_sdk.model import Fill, MarginInformation, MarginSummaryRecord, Order, Transaction
+
+
+def legacy_post_init(self):
+    type_hints = get_type_hints(self.__class__)
+    for f in dataclasses.fields(self):
+        value = getattr(self, f.name)
+        if value is None:
+            continue
+        expected_type = type_hints.get(f.name)
+        if hasattr(expected_type, '__origin__') and expected_type.__origin__ is list:
+            inner_type = expected_type.__args__[0]
+            if dataclasses.is_dataclass(inner_type) and isinstance(value, list):
+                setattr(self, f.name, [inner_type(**v) if isinstance(v, dict) else v for v in value])
+        elif dataclasses.is_dataclass(expected_type) and isinstance(value, dict):
+            setattr(self, f.name, expected_type(**value))
+
+
+def row(model: type) -> dict:
+    """A JSON object for model with every field set, recursing into nested models."""
+    payload = {}
+    for name, hint in get_type_hints(model).items():
+        is_list = getattr(hint, '__origin__', None) is list
+        inner = hint.__args__[0] if is_list else hint
+        value = row(inner) if dataclasses.is_dataclass(inner) else "2025-01-01T00:00:00.000Z"
+        payload[name] = [value] if is_list else value
+    return payload
+
+
+PAGINATION = {"next_cursor": "abc", "sort_direction": "DESC", "has_next": True}
+
+CASES = (
+    ("Order", ListOrdersResponse, "orders", Order),
+    ("Fill", ListPortfolioFillsResponse, "fills", Fill),
+    ("Transaction", ListPortfolioTransactionsResponse, "transactions", Transaction),
+    ("MarginSummaryRecord", ListMarginCallSummariesResponse, "margin_summaries", MarginSummaryRecord),
+)
+SINGLE_CASES = (
+    ("GetOrderResponse", GetOrderResponse, "order", Order),
+    ("GetMarginInformationResponse", GetMarginInformationResponse, "margin_information", MarginInformation),
+)
+
+
+def measure(response_type: type, payload: dict, rows: int, number: int) -> float:
+    seconds = min(timeit.repeat(lambda: response_type(**payload), number=number, repeat=5))
+    return seconds / number / rows * 1e9
+
+
+def compare(response_type: type, payload: dict, rows: int, number: int):
+    current_post_init = BaseResponse.__post_init__
+    BaseResponse.__post_init__ = legacy_post_init
+    try:
+        legacy = measure(response_type, payload, rows, number)
+    finally:
+        BaseResponse.__post_init__ = current_post_init
+    with full_depth_decoding():
+        full_depth = measure(response_type, payload, rows, number)
+    return legacy, measure(response_type, payload, rows, number), full_depth
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    number = max(1, 20000 // rows)
+    for name, response_type, field, model in CASES:
+        payload = {field: [row(model) for _ in range(rows)]}
+        if "pagination" in response_type.__dataclass_fields__:
+            payload["pagination"] = PAGINATION
+        legacy, current, full_depth = compare(response_type, payload, rows, number)
+        print(f"{name:<30} legacy {legacy:8.0f} ns/row        current {current:8.0f} ns/row"
+              f"        full depth {full_depth:8.0f} ns/row")
+    for name, response_type, field, model in SINGLE_CASES:
+        legacy, current, full_depth = compare(response_type, {field: row(model)}, 1, 20000)
+        print(f"{name:<30} legacy {legacy / 1000:8.2f} us/response   current {current / 1000:8.2f} us/response"
+              f"   full depth {full_depth / 1000:8.2f} us/response")
+
+
+if __name__ == "__main__":
+    main()
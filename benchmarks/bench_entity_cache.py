@@ -0,0 +1,72 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cost of looking up a filled order: a simulated round trip vs an EntityCache
+hit from memory, from an SQLite store and from a shelve store.
+
+    python benchmarks/bench_entity_cache.py [orders] [latency]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from prime_sdk.entity_cache import EntityCache, ShelveEntityStore, SqliteEntityStore
+from prime_sdk.get_order import GetOrderResponse
+from prime_sdk.model import Order
+
+
+def filled_order(order_id: str) -> GetOrderResponse:
+    return GetOrderResponse(order=Order(**dict(dict.fromkeys(Order.__dataclass_fields__), id=order_id,
+                                               status="FILLED", product_id="BTC-USD", base_quantity="0.1")))
+
+
+def per_lookup(cache: EntityCache, ids) -> float:
+    start = time.perf_counter()
+    for order_id in ids:
+        assert cache.get("order", order_id) is not None
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.03
+    ids = [f"order-{i}" for i in range(orders)]
+    print(f"round trip      {latency * 1e6:10.1f} us/lookup (simulated)")
+
+    cache = EntityCache()
+    for order_id in ids:
+        cache.put("order", order_id, filled_order(order_id))
+    print(f"memory          {per_lookup(cache, ids):10.1f} us/lookup")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, store_type in (("sqlite", SqliteEntityStore), ("shelve", ShelveEntityStore)):
+            path = os.path.join(directory, name)
+            cache = EntityCache(store=store_type(path))
+            start = time.perf_counter()
+            for order_id in ids:
+                cache.put("order", order_id, filled_order(order_id))
+            write = (time.perf_counter() - start) / orders * 1e6
+            cache.close()
+            # A new cache starts with empty memory, as after a restart
+            cache = EntityCache(store=store_type(path))
+            print(f"{name:<6} (disk)   {per_lookup(cache, ids):10.1f} us/lookup  {write:8.1f} us/write")
+            print(f"{name:<6} (warm)   {per_lookup(cache, ids):10.1f} us/lookup")
+            cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wall time of looking up a list of order ids one by one vs with fetch_many.
+
+Each get_order costs a simulated round trip of `latency` seconds and is limited
+to `rate` requests per second by a TokenBucket, as the client's RateLimiter
+would do. A tenth of the ids are repeated, and fetch_many looks those up once.
+
+    python benchmarks/bench_fetch.py [ids] [latency] [rate]
+"""
+
+import sys
+import time
+
+from prime_sdk.fetch import fetch_many
+from prime_sdk.get_order import GetOrderResponse
+from prime_sdk.rate_limit import TokenBucket
+
+
+def simulated_get_order(latency: float, rate: float):
+    bucket = TokenBucket(rate=rate, capacity=rate)
+
+    def get_order(request):
+        bucket.acquire()
+        time.sleep(latency)
+        return GetOrderResponse(order=None)
+    return get_order
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 25
+    ids = [f"order-{i}" for i in range(count - count // 10)]
+    ids += ids[:count // 10]
+
+    get_order = simulated_get_order(latency, rate)
+    start = time.perf_counter()
+    for order_id in ids:
+        get_order(order_id)
+    print(f"sequential        {time.perf_counter() - start:6.2f} s for {len(ids)} ids")
+
+    for concurrency in (4, 16, 32):
+        start = time.perf_counter()
+        results = fetch_many(simulated_get_order(latency, rate), "order", ids, "portfolio", concurrency=concurrency)
+        assert all(result.ok for result in results.values())
+        print(f"concurrency={concurrency:<3}   {time.perf_counter() - start:6.2f} s for {len(ids)} ids "
+              f"({len(results)} distinct)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Notional by product over decoded fills: per-record conversion vs FillFrame.
+
+"per-record" converts filled_value with float() fill by fill and accumulates
+in a dict, as analytics code does today. "FillFrame" converts the columns in
+bulk and aggregates with NumPy; its time includes building the frame.
+
+    python benchmarks/bench_frames.py [fills]
+"""
+
+import sys
+import time
+
+from prime_sdk.frames import FillFrame
+from prime_sdk.model import Fill
+
+PRODUCTS = ("BTC-USD", "ETH-USD", "SOL-USD", "AVAX-USD")
+
+
+def fills(count: int) -> list:
+    return [Fill(id=f"fill-{i}", order_id=f"order-{i // 4}", product_id=PRODUCTS[i % 4],
+                 client_product_id=PRODUCTS[i % 4], side="BUY" if i % 3 else "SELL",
+                 filled_quantity=f"0.{i % 997:04d}", filled_value=f"{i % 10007}.{i % 100:02d}",
+                 price=f"{60000 + i % 500}.25", time=f"2025-01-01T00:{i % 60:02d}:00.{i % 1000:03d}Z",
+                 commission="0.61", venue="COINBASE")
+            for i in range(count)]
+
+
+def per_record(records: list) -> dict:
+    totals = {}
+    for fill in records:
+        totals[fill.product_id] = totals.get(fill.product_id, 0.0) + float(fill.filled_value)
+    return totals
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    records = fills(count)
+    _, loop = timed(per_record, records)
+    frame, build = timed(FillFrame.from_records, records)
+    _, aggregate = timed(frame.notional_by_product)
+    print(f"per-record         {loop:6.3f} s  (one column)")
+    print(f"FillFrame build    {build:6.3f} s  (all {len(frame.columns)} columns)")
+    print(f"FillFrame notional {aggregate:6.3f} s")
+    _, sums = timed(lambda: [frame.sum_by(column, "product_id") for column in FillFrame.NUMERIC])
+    _, loops = timed(lambda: [per_record(records) for _ in FillFrame.NUMERIC])
+    print(f"{len(FillFrame.NUMERIC)} aggregations: per-record {loops:6.3f} s   FillFrame {sums:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
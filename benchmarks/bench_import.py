@@ -0,0 +1,74 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Startup cost of the SDK, measured in fresh interpreters.
+
+"eager" loads every endpoint module and builds every endpoint client, which is
+what importing and constructing PrimeClient used to do. The other scenarios
+show what a short-lived job that calls a single endpoint pays now.
+
+    python benchmarks/bench_import.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+SETUP = (
+    "from prime_sdk.credentials import Credentials\n"
+    "credentials = Credentials('key', 'passphrase', 'secret', 'portfolio', 'entity', 'account')\n"
+)
+
+SCENARIOS = {
+    "import prime_sdk": "import prime_sdk",
+    "construct PrimeClient": SETUP + "from prime_sdk import PrimeClient\nPrimeClient(credentials)",
+    "construct + one endpoint": SETUP + (
+        "from prime_sdk import PrimeClient\n"
+        "PrimeClient(credentials).list_orders\n"
+    ),
+    "eager (all endpoints)": SETUP + (
+        "from prime_sdk import PrimeClient, prime_client\n"
+        "client = PrimeClient(credentials)\n"
+        "for module in prime_client._MODULE_EXPORTS:\n"
+        "    getattr(client, '_' + module)\n"
+        "    for name in prime_client._MODULE_EXPORTS[module]:\n"
+        "        getattr(prime_client, name)\n"
+    ),
+}
+
+TIMED = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "{code}\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def measure(code: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", TIMED.format(code=code)])
+        timings.append(float(output))
+    return statistics.median(timings)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, code in SCENARIOS.items():
+        print(f"{name:<28} {measure(code, runs) * 1000:8.1f} ms (median of {runs})")
+
+
+if __name__ == "__main__":
+    main()
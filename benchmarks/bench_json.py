@@ -0,0 +1,86 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON encode/decode throughput of each installed codec on representative payloads.
+
+Encoding is measured on a create_order body, the request bodies the SDK
+signs and sends. Decoding is measured on a 1,000-fill list_portfolio_fills page
+and a 500-order list_orders page. Install orjson or ujson to compare them
+with the standard library.
+
+    python benchmarks/bench_json.py [repeat]
+"""
+
+import json
+import sys
+import timeit
+
+from prime_sdk import json_codec
+from prime_sdk.enums import OrderSide, OrderType
+
+ORDER_BODY = {
+    "portfolio_id": "3e1fe27e-4b4a-4d3c-9c9c-6a8c5f1c2b3a",
+    "side": OrderSide.BUY,
+    "client_order_id": "c0e4a0f0-1d5e-4b8e-9b7a-2f4a1c3d5e6f",
+    "product_id": "BTC-USD",
+    "type": OrderType.LIMIT,
+    "base_quantity": "0.015",
+    "limit_price": "61234.56",
+    "time_in_force": "GOOD_UNTIL_CANCELLED",
+}
+
+
+def fills_page(count: int) -> bytes:
+    fills = [dict(id=f"fill-{i}", order_id=f"order-{i // 4}", product_id="BTC-USD", client_product_id="BTC-USD",
+                  side="BUY" if i % 3 else "SELL", filled_quantity=f"0.{i % 997:04d}",
+                  filled_value=f"{i % 10007}.{i % 100:02d}", price=f"{60000 + i % 500}.25",
+                  time=f"2025-01-01T00:{i % 60:02d}:00.{i % 1000:03d}Z", commission="0.61", venue="COINBASE")
+             for i in range(count)]
+    return json.dumps({"fills": fills, "pagination": {"next_cursor": "abc", "has_next": True}}).encode()
+
+
+def orders_page(count: int) -> bytes:
+    orders = [dict(id=f"order-{i}", user_id="user-1", portfolio_id="portfolio-1", product_id="ETH-USD",
+                   side="SELL", client_order_id=f"client-{i}", type="LIMIT", base_quantity="1.5", quote_value="",
+                   limit_price="3012.5", start_time="", expiry_time="", status="FILLED",
+                   time_in_force="GOOD_UNTIL_CANCELLED", created_at="2025-01-01T00:00:00.123Z",
+                   filled_quantity="1.5", filled_value="4518.75", average_filled_price="3012.5", commission="2.25",
+                   exchange_fee="0", historical_pov="", stop_price="", net_average_filled_price="3014",
+                   user_context="", client_product_id="ETH-USD", post_only=False,
+                   edit_history=[{"price": "3000", "size": "1.5", "accept_time": "2025-01-01T00:00:00Z"}])
+              for i in range(count)]
+    return json.dumps({"orders": orders, "pagination": {"next_cursor": "", "has_next": False}}).encode()
+
+
+def best(statement, number: int, repeat: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    fills, orders = fills_page(1000), orders_page(500)
+    print(f"payloads: order body {len(json_codec.StdlibCodec().dumps(ORDER_BODY))} B, "
+          f"fills page {len(fills) / 1e3:.0f} kB, orders page {len(orders) / 1e3:.0f} kB")
+    for name, codec in json_codec.available().items():
+        encode = best(lambda: codec.dumps(ORDER_BODY), 20000, repeat)
+        decode_fills = best(lambda: codec.loads(fills), 50, repeat)
+        decode_orders = best(lambda: codec.loads(orders), 50, repeat)
+        print(f"{name:7} encode order {encode * 1e6:6.2f} us   "
+              f"decode fills {decode_fills * 1e3:6.2f} ms ({len(fills) / decode_fills / 1e6:5.0f} MB/s)   "
+              f"decode orders {decode_orders * 1e3:6.2f} ms ({len(orders) / decode_orders / 1e6:5.0f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Eager vs lazy decoding when callers read only a few fields.
+
+Each case builds the response from parsed JSON and then reads the fields a
+typical caller touches: status and filled_quantity of every order, or the
+margin equity and first call record of a margin response. The margin case
+builds the nested models under full_depth_decoding(), in both modes, since
+by default they stay dicts.
+
+    python benchmarks/bench_lazy.py [orders]
+"""
+
+import dataclasses
+import sys
+import timeit
+from typing import get_type_hints
+
+from prime_sdk.base_response import full_depth_decoding
+from prime_sdk.get_margin_information import GetMarginInformationResponse
+from prime_sdk.lazy import lazy_decoding
+from prime_sdk.list_orders import ListOrdersResponse
+from prime_sdk.model import MarginInformation, Order
+
+
+def row(model: type) -> dict:
+    """A JSON object for model with every field set, recursing into nested models."""
+    payload = {}
+    for name, hint in get_type_hints(model).items():
+        is_list = getattr(hint, '__origin__', None) is list
+        inner = hint.__args__[0] if is_list else hint
+        value = row(inner) if dataclasses.is_dataclass(inner) else "2025-01-01T00:00:00.000Z"
+        payload[name] = [value, value] if is_list else value
+    return payload
+
+
+def read_orders(payload: dict) -> list:
+    response = ListOrdersResponse(**payload)
+    return [(order.status, order.filled_quantity) for order in response.orders]
+
+
+def read_margin(payload: dict) -> tuple:
+    with full_depth_decoding():
+        information = GetMarginInformationResponse(**payload).margin_information
+    return information.margin_summary.margin_equity, information.margin_call_records[0]
+
+
+def lazily(read):
+    def run(payload):
+        with lazy_decoding():
+            return read(payload)
+    return run
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cases = (
+        (f"list_orders ({orders} orders)", read_orders, {"orders": [row(Order) for _ in range(orders)]}, 20),
+        ("get_margin_information", read_margin, {"margin_information": row(MarginInformation)}, 20000),
+    )
+    for name, read, payload, number in cases:
+        eager = min(timeit.repeat(lambda: read(payload), number=number, repeat=5)) / number
+        lazy = min(timeit.repeat(lambda: lazily(read)(payload), number=number, repeat=5)) / number
+        print(f"{name:<28} eager {eager * 1e6:9.1f} us   lazy {lazy * 1e6:9.1f} us   {eager / lazy:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
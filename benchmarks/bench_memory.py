@@ -0,0 +1,64 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory held by decoded fills, in bytes per record, with and without __slots__.
+
+"dict" is a dataclass with the same fields as Fill and a per-instance
+__dict__, as Fill was before it was slotted. Each row carries distinct id,
+order_id and time strings, as decoded JSON would; the remaining values are
+shared, so the difference between the two lines is the per-instance overhead.
+
+    python benchmarks/bench_memory.py [rows]
+"""
+
+import dataclasses
+import gc
+import sys
+import tracemalloc
+
+from prime_sdk.model import Fill
+
+DictFill = dataclasses.make_dataclass(
+    "Fill", [(f.name, f.type) if f.default is dataclasses.MISSING else (f.name, f.type, f.default)
+             for f in dataclasses.fields(Fill)])
+
+
+def build(model: type, rows: int) -> list:
+    return [
+        model(id=f"fill-{i:08d}", order_id=f"order-{i // 4:08d}", product_id="BTC-USD", client_product_id="BTC-USD",
+              side="BUY", filled_quantity="0.01", filled_value="612.34", price="61234.00",
+              time=f"2025-01-01T00:00:{i % 60:02d}.{i % 1000000:06d}Z", commission="0.61", venue="COINBASE")
+        for i in range(rows)
+    ]
+
+
+def measure(model: type, rows: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    records = build(model, rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current / rows
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for name, model in (("dict", DictFill), ("slotted", Fill)):
+        print(f"{name:<8} {measure(model, rows):7.1f} bytes/record over {rows} fills")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wall time of a paginated fill export with and without page prefetching.
+
+Each page costs a simulated round trip of `latency` seconds and the consumer
+spends `work` seconds processing it. Without prefetching the two add up per
+page; with prefetching the next request overlaps the current page's processing.
+
+    python benchmarks/bench_prefetch.py [pages] [latency] [work]
+"""
+
+import sys
+import time
+
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsRequest, ListPortfolioFillsResponse
+from prime_sdk.pagination import iter_pages
+from prime_sdk.utils import Pagination
+
+
+def simulated_endpoint(pages: int, latency: float):
+    def fetch(request):
+        time.sleep(latency)
+        index = int(request.pagination.cursor or 0) + 1
+        has_next = index < pages
+        return ListPortfolioFillsResponse(fills=[], pagination=Pagination(next_cursor=str(index), has_next=has_next))
+    return fetch
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    work = float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+    request = ListPortfolioFillsRequest(portfolio_id="portfolio", start_date="2025-01-01T00:00:00Z")
+    for prefetch in (0, 1, 4):
+        start = time.perf_counter()
+        for _ in iter_pages(simulated_endpoint(pages, latency), request, prefetch=prefetch):
+            time.sleep(work)
+        print(f"prefetch={prefetch}  {time.perf_counter() - start:6.2f} s for {pages} pages")
+
+
+if __name__ == "__main__":
+    main()
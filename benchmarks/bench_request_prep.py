@@ -0,0 +1,89 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-request preparation overhead: URL, signed headers and encoded body.
+
+"legacy" reproduces the previous path, which serialized the body once for the
+signature and again in requests (json=body), and encoded the signing key on
+every signature. "current" is the single-encoding path of Client.request.
+
+    python benchmarks/bench_request_prep.py [iterations]
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import sys
+import time
+import timeit
+
+from requests.models import PreparedRequest
+
+from prime_sdk.client import Client, encode_body
+from prime_sdk.credentials import Credentials
+
+CREDENTIALS = Credentials("key", "passphrase", "s" * 64, "portfolio", "entity", "account")
+
+ORDER_BODY = {
+    "portfolio_id": "3e1fe27e-4b4a-4d3c-9c9c-6a8c5f1c2b3a",
+    "side": "BUY",
+    "client_order_id": "c0e4a0f0-1d5e-4b8e-9b7a-2f4a1c3d5e6f",
+    "product_id": "BTC-USD",
+    "type": "LIMIT",
+    "base_quantity": "0.015",
+    "limit_price": "61234.56",
+    "time_in_force": "GOOD_UNTIL_CANCELLED",
+}
+
+
+def legacy_prepare(client: Client, method: str, path: str, body: dict):
+    timestamp = str(int(time.time()))
+    message = f"{timestamp}{method}/v1{path}{json.dumps(body)}"
+    digest = hmac.new(CREDENTIALS.signing_key.encode(), message.encode(), hashlib.sha256).digest()
+    headers = {
+        "Accept": "application/json",
+        "X-CB-ACCESS-KEY": CREDENTIALS.access_key,
+        "X-CB-ACCESS-PASSPHRASE": CREDENTIALS.passphrase,
+        "X-CB-ACCESS-SIGNATURE": base64.b64encode(digest).decode(),
+        "X-CB-ACCESS-TIMESTAMP": timestamp,
+    }
+    prepared = PreparedRequest()
+    prepared.prepare_headers(headers)
+    prepared.prepare_body(data=None, files=None, json=body)
+    return client.build_url(path), headers, prepared.body
+
+
+def current_prepare(client: Client, method: str, path: str, body: dict):
+    data = encode_body(body)
+    url = client.build_url(path)
+    headers = client.generate_headers_for_bytes(method, f"/v1{path}", data)
+    prepared = PreparedRequest()
+    prepared.prepare_headers(headers)
+    prepared.prepare_body(data=data, files=None)
+    return url, headers, prepared.body
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    client = Client(CREDENTIALS)
+    path = f"/portfolios/{ORDER_BODY['portfolio_id']}/order"
+    for name, prepare in (("legacy", legacy_prepare), ("current", current_prepare)):
+        seconds = min(timeit.repeat(lambda: prepare(client, "POST", path, ORDER_BODY), number=iterations, repeat=5))
+        print(f"{name:<16} {seconds / iterations * 1e6:7.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cost per call of a reference-data lookup, sent every time vs through a ResponseCache.
+
+Each request costs a simulated round trip of `latency` seconds. Lookups are
+spread over `keys` distinct requests, e.g. portfolios.
+
+    python benchmarks/bench_response_cache.py [calls] [keys] [latency]
+"""
+
+import sys
+import time
+
+from prime_sdk.get_portfolio import GetPortfolioRequest, GetPortfolioResponse
+from prime_sdk.response_cache import ResponseCache
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+    requests = [GetPortfolioRequest(f"portfolio-{i}") for i in range(keys)]
+
+    def get_portfolio(request, deadline=None):
+        time.sleep(latency)
+        return GetPortfolioResponse(portfolio=None)
+
+    uncached_calls = min(calls, 100)
+    start = time.perf_counter()
+    for i in range(uncached_calls):
+        get_portfolio(requests[i % keys])
+    print(f"uncached  {(time.perf_counter() - start) / uncached_calls * 1e6:10.1f} us/call")
+
+    cache = ResponseCache()
+    start = time.perf_counter()
+    for i in range(calls):
+        cache.fetch("get_portfolio", get_portfolio, requests[i % keys])
+    print(f"cached    {(time.perf_counter() - start) / calls * 1e6:10.1f} us/call  {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
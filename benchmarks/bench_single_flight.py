@@ -0,0 +1,65 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Requests sent and wall time when many threads repeatedly fetch the same resource,
+with and without a SingleFlight.
+
+Every request costs a simulated round trip of `latency` seconds and is limited
+to `rate` requests per second by a TokenBucket, as the client's RateLimiter
+would do. Each of `threads` threads makes `calls` fetches.
+
+    python benchmarks/bench_single_flight.py [threads] [calls] [latency] [rate]
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from prime_sdk.rate_limit import TokenBucket
+from prime_sdk.single_flight import SingleFlight
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.05
+    rate = float(sys.argv[4]) if len(sys.argv) > 4 else 25
+
+    for flight in (None, SingleFlight()):
+        bucket = TokenBucket(rate=rate, capacity=rate)
+        sent = []
+
+        def get_buying_power():
+            bucket.acquire()
+            sent.append(1)
+            time.sleep(latency)
+            return {"buying_power": "1000"}
+
+        def worker(_):
+            for _ in range(calls):
+                if flight is None:
+                    get_buying_power()
+                else:
+                    flight.do("/portfolios/p1/buying_power", get_buying_power)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, range(threads)))
+        label = "single flight" if flight else "independent  "
+        print(f"{label}  {len(sent):5d} requests for {threads * calls} calls in {time.perf_counter() - start:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Decoding one large fills page: buffered response.json() vs streamed parsing.
+
+"buffered" joins the body, parses it with json.loads and builds a
+ListPortfolioFillsResponse, as every endpoint does today. "streamed" feeds the
+same body in 64 KiB chunks to iter_json_array and decodes each fill as it is
+parsed. Both touch every fill; the streamed consumer keeps none of them, as an
+exporter would. Peak Python heap is measured with tracemalloc in a second run.
+
+    python benchmarks/bench_streaming.py [fills]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from prime_sdk.base_response import model_decoder
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsResponse
+from prime_sdk.model import Fill
+from prime_sdk.streaming import DEFAULT_CHUNK_SIZE, iter_json_array
+
+
+def body(count: int) -> bytes:
+    fills = [dict(id=f"fill-{i}", order_id=f"order-{i // 4}", product_id="BTC-USD", client_product_id="BTC-USD",
+                  side="BUY" if i % 3 else "SELL", filled_quantity=f"0.{i % 997:04d}",
+                  filled_value=f"{i % 10007}.{i % 100:02d}", price=f"{60000 + i % 500}.25",
+                  time=f"2025-01-01T00:{i % 60:02d}:00.{i % 1000:03d}Z", commission="0.61", venue="COINBASE")
+             for i in range(count)]
+    return json.dumps({"fills": fills, "pagination": {"next_cursor": "", "has_next": False}}).encode()
+
+
+def chunks(data: bytes):
+    for start in range(0, len(data), DEFAULT_CHUNK_SIZE):
+        yield data[start:start + DEFAULT_CHUNK_SIZE]
+
+
+def buffered(data: bytes, first: list) -> int:
+    response = ListPortfolioFillsResponse(**json.loads(b"".join(chunks(data))))
+    count = 0
+    for fill in response.fills:
+        if not count:
+            first.append(time.perf_counter())
+        count += 1
+    return count
+
+
+def streamed(data: bytes, first: list) -> int:
+    decode = model_decoder(Fill)
+    count = 0
+    for item in iter_json_array(chunks(data), "fills"):
+        decode(item)
+        if not count:
+            first.append(time.perf_counter())
+        count += 1
+    return count
+
+
+def measured(label, function, data):
+    first = []
+    start = time.perf_counter()
+    count = function(data, first)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(data, [])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:9} {elapsed:6.3f} s  first item after {(first[0] - start) * 1000:8.2f} ms  "
+          f"{count} fills  peak heap {peak / 1e6:7.2f} MB")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = body(count)
+    print(f"body {len(data) / 1e6:.1f} MB")
+    measured("buffered", buffered, data)
+    measured("streamed", streamed, data)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from prime_sdk.prime_client import PrimeClient
+__all__ = ["PrimeClient", "AsyncPrimeClient"]
 
-__all__ = ["PrimeClient"]
+
+def __getattr__(name: str):
+    # Resolved on first access so that "import prime_sdk" does not load the HTTP stack
+    if name == "PrimeClient":
+        from prime_sdk.prime_client import PrimeClient
+        return PrimeClient
+    if name == "AsyncPrimeClient":
+        from prime_sdk.async_prime_client import AsyncPrimeClient
+        return AsyncPrimeClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass, asdict
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 from prime_sdk.enums import OrderSide
@@ -37,11 +37,11 @@ class AcceptQuoteResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def accept_quote(self, request: AcceptQuoteRequest) -> AcceptQuoteResponse:
         path = f"/portfolios/{request.portfolio_id}/accept_quote"
         body = {k: v for k, v in asdict(request).items() if v is not None}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return AcceptQuoteResponse(**response.json())
+        return AcceptQuoteResponse(**response_json(response))
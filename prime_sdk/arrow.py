@@ -0,0 +1,198 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Arrow record batches and Parquet files from Prime list results.
+
+The Arrow schema of a model is derived from its dataclass fields. Money
+fields become exact decimal128(38, 18) columns, timestamps become
+timestamp[us, UTC] and low-cardinality strings such as side, status and
+product_id are dictionary-encoded. Lists of strings become list<string>, and
+nested objects are stored as JSON text. Records are consumed batch_size at a
+time, so paginated results are archived in bounded memory:
+
+    fills = client.iter_list_portfolio_fills(request, page_size=1000)
+    write_parquet(fills, "fills.parquet", Fill)
+
+PyArrow is optional: pip install prime-sdk-py[arrow]
+"""
+
+import dataclasses
+import enum
+import json
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from prime_sdk.decimals import money_fields
+from prime_sdk.sharding import naive_utc_text
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+DEFAULT_BATCH_SIZE = 10000
+
+# string fields with few distinct values, stored dictionary-encoded
+CATEGORICAL_FIELDS = frozenset((
+    "benchmark", "category", "client_product_id", "currency_symbol", "destination_symbol", "fee_symbol",
+    "hierarchy_type", "loan_type", "network", "portfolio_id", "product_id", "rate_type", "secondary_type", "side",
+    "status", "symbol", "time_in_force", "type", "venue", "wallet_id",
+))
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("arrow export requires pyarrow: pip install prime-sdk-py[arrow]")
+
+
+def _is_timestamp(name: str) -> bool:
+    return name in ("time", "date") or name.endswith(("_at", "_time", "_date"))
+
+
+def _column_type(model: type, field: dataclasses.Field, decimal_type: 'pa.DataType') -> 'pa.DataType':
+    kind = field.type
+    if field.name in money_fields(model):
+        return decimal_type
+    if kind is str or (isinstance(kind, type) and issubclass(kind, enum.Enum)):
+        if _is_timestamp(field.name):
+            return pa.timestamp("us", tz="UTC")
+        if field.name in CATEGORICAL_FIELDS or kind is not str:
+            return pa.dictionary(pa.int32(), pa.string())
+        return pa.string()
+    if kind is bool:
+        return pa.bool_()
+    if kind is int:
+        return pa.int64()
+    if kind is float:
+        return pa.float64()
+    if getattr(kind, "__args__", None) == (str,) and getattr(kind, "__origin__", None) is list:
+        return pa.list_(pa.string())
+    return pa.string()
+
+
+def schema_for(model: type, decimal_type: Optional['pa.DataType'] = None) -> 'pa.Schema':
+    """
+    Derive the Arrow schema of a model class, e.g. Fill or Accrual.
+
+    Args:
+        model: A dataclass from prime_sdk.model
+        decimal_type: Type of money columns; defaults to decimal128(38, 18)
+    """
+    _require_pyarrow()
+    decimal_type = decimal_type or pa.decimal128(38, 18)
+    columns = []
+    for field in dataclasses.fields(model):
+        column_type = _column_type(model, field, decimal_type)
+        metadata = {"encoding": "json"} if column_type == pa.string() and field.type is not str else None
+        columns.append(pa.field(field.name, column_type, metadata=metadata))
+    return pa.schema(columns)
+
+
+def _values(records: List[Any], name: str) -> List[Any]:
+    if records and isinstance(records[0], dict):
+        return [record.get(name) for record in records]
+    return [getattr(record, name, None) for record in records]
+
+
+def _jsonable(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _to_json(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, default=_jsonable, separators=(",", ":"))
+
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value if value != "" else None
+
+
+def _converter(field: 'pa.Field') -> Callable[[List[Any]], 'pa.Array']:
+    column_type = field.type
+    if pa.types.is_decimal(column_type):
+        return lambda values: pa.array(list(map(_text, values)), pa.string()).cast(column_type)
+    if pa.types.is_timestamp(column_type):
+        naive = pa.timestamp(column_type.unit)
+        return lambda values: pa.array(list(map(naive_utc_text, values)), pa.string()).cast(naive).cast(column_type)
+    if pa.types.is_dictionary(column_type):
+        return lambda values: pa.array(list(map(_text, values)), pa.string()).dictionary_encode()
+    if field.metadata and field.metadata.get(b"encoding") == b"json":
+        return lambda values: pa.array(list(map(_to_json, values)), pa.string())
+    return lambda values: pa.array(values, column_type)
+
+
+def record_batches(records: Iterable[Any], model: type, batch_size: int = DEFAULT_BATCH_SIZE,
+                   decimal_type: Optional['pa.DataType'] = None) -> Iterator['pa.RecordBatch']:
+    """
+    Convert records to Arrow record batches of up to batch_size rows.
+
+    Args:
+        records: Models or parsed JSON objects, such as a response's list or an iter_* generator
+        model: The model class of the records, which determines the schema
+        batch_size: Maximum rows per batch; at most this many records are held at once
+        decimal_type: Type of money columns; defaults to decimal128(38, 18)
+
+    Raises pyarrow.ArrowInvalid if a money value has more decimal places than decimal_type holds.
+    """
+    schema = schema_for(model, decimal_type)
+    converters = [(field.name, _converter(field)) for field in schema]
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        arrays = [convert(_values(batch, name)) for name, convert in converters]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_table(records: Iterable[Any], model: type, decimal_type: Optional['pa.DataType'] = None) -> 'pa.Table':
+    """Convert records to an Arrow table."""
+    schema = schema_for(model, decimal_type)
+    return pa.Table.from_batches(list(record_batches(records, model, decimal_type=decimal_type)), schema=schema)
+
+
+def write_parquet(records: Iterable[Any], path: Any, model: type, batch_size: int = DEFAULT_BATCH_SIZE,
+                  decimal_type: Optional['pa.DataType'] = None, compression: str = "zstd",
+                  **writer_options: Any) -> int:
+    """
+    Stream records into a Parquet file, one row group per batch.
+
+    Args:
+        records: Models or parsed JSON objects, such as an iter_* generator
+        path: File path or writable file object
+        model: The model class of the records, which determines the schema
+        batch_size: Rows per row group; at most this many records are held at once
+        decimal_type: Type of money columns; defaults to decimal128(38, 18)
+        compression: Parquet compression codec
+        **writer_options: Passed to pyarrow.parquet.ParquetWriter
+
+    Returns the number of rows written.
+    """
+    schema = schema_for(model, decimal_type)
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression=compression, **writer_options) as writer:
+        for batch in record_batches(records, model, batch_size, decimal_type):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
@@ -0,0 +1,111 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Optional, Dict, List
+from prime_sdk.client import BaseClient, encode_body
+from prime_sdk.credentials import Credentials
+from prime_sdk.errors import DeadlineExceededError
+from prime_sdk.rate_limit import RateLimiter
+from prime_sdk.retry import RetryPolicy
+from prime_sdk.timeouts import Timeout, DEFAULT_TIMEOUT, current_call_options, clamp_timeout
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+def new_async_http_client(max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                          max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS) -> 'httpx.AsyncClient':
+    """
+    Build an httpx.AsyncClient with a sized connection pool.
+
+    Requests beyond max_connections wait for a free connection instead of failing,
+    so any number of calls can be awaited concurrently on one event loop. Connect
+    and read timeouts are applied per request by AsyncClient.
+
+    Args:
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+    """
+    if httpx is None:
+        raise ImportError("the async client requires httpx: pip install prime-sdk-py[async]")
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+    return httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(None))
+
+
+class AsyncClient(BaseClient):
+    def __init__(self, credentials: Credentials, http_client: Optional['httpx.AsyncClient'] = None,
+                 retry_policy: Optional[RetryPolicy] = None, rate_limiter: Optional[RateLimiter] = None,
+                 timeout: Optional[Timeout] = DEFAULT_TIMEOUT):
+        super().__init__(credentials, retry_policy, rate_limiter, timeout)
+        self.http_client = http_client if http_client else new_async_http_client()
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> 'AsyncClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def request(self, method: str, path: str, query: Optional[str] = "", body: Optional[Dict] = None,
+                      allowed_status_codes: Optional[List[int]] = None) -> 'httpx.Response':
+        if allowed_status_codes is None:
+            allowed_status_codes = [200]
+        url = self.build_url(path, query)
+        data = encode_body(body)
+        retry = self.retry_policy.start() if self.retry_policy else None
+        options = current_call_options()
+        deadline = options.deadline
+        timeout = options.timeout if options.timeout is not None else self.timeout
+
+        while True:
+            if deadline:
+                deadline.check()
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(method, path, deadline)
+            # Signed per attempt so that retries carry a fresh timestamp
+            headers = self.generate_headers_for_bytes(method, f"/v1{path}", data)
+            connect, read = clamp_timeout(timeout, deadline)
+            attempt_timeout = httpx.Timeout(connect=connect, read=read, write=read,
+                                            pool=deadline.remaining() if deadline else None)
+            try:
+                send = self.http_client.request(method, url, headers=headers, content=data, timeout=attempt_timeout)
+                response = await (asyncio.wait_for(send, deadline.remaining()) if deadline else send)
+            except (httpx.TransportError, asyncio.TimeoutError) as e:
+                if deadline and deadline.expired():
+                    raise DeadlineExceededError(f"{method} {path} did not complete before the deadline") from e
+                request_sent = not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                delay = retry.on_error(method, request_sent, options.idempotent) if retry else None
+                if delay is None or (deadline and not deadline.allows(delay)):
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code not in allowed_status_codes and retry:
+                delay = retry.on_status(method, response.status_code, response.headers.get("Retry-After"),
+                                        options.idempotent)
+                if delay is not None and (deadline is None or deadline.allows(delay)):
+                    await response.aclose()
+                    await asyncio.sleep(delay)
+                    continue
+
+            self.check_response(response, allowed_status_codes)
+            return response
@@ -0,0 +1,233 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Asyncio counterpart of the unified Prime SDK client.
+
+AsyncPrimeClient exposes the same operations as PrimeClient as coroutines:
+    async with AsyncPrimeClient(credentials) as client:
+        orders = await client.list_orders(ListOrdersRequest(portfolio_id="..."))
+
+Requests are built by the same endpoint modules as the synchronous client and
+decoded into the same response dataclasses; only the transport differs.
+"""
+
+import functools
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from prime_sdk.async_client import AsyncClient, new_async_http_client, DEFAULT_MAX_CONNECTIONS, \
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+from prime_sdk import bulk, cancel_all, fetch, json_codec
+from prime_sdk.client import record_request
+from prime_sdk.credentials import Credentials
+from prime_sdk.lazy import lazy_decoding
+from prime_sdk.pagination import aiter_items
+from prime_sdk.prime_client import PrimeClient, _Endpoint, _Paginator, _Sharded
+from prime_sdk.rate_limit import RateLimiter, default_bucket
+from prime_sdk.response_cache import ResponseCache
+from prime_sdk.retry import RetryPolicy
+from prime_sdk.sharding import aiter_sharded, TIME_RANGE_ENDPOINTS, DEFAULT_MAX_WORKERS, DEFAULT_MIN_WINDOW, \
+    DEFAULT_SHARDS
+from prime_sdk.timeouts import Deadline, Timeout, DEFAULT_TIMEOUT, call_options
+
+if TYPE_CHECKING:
+    from prime_sdk.entity_cache import EntityCache
+
+
+class AsyncPrimeClient:
+    """
+    Unified asyncio client for Coinbase Prime SDK operations.
+
+    Every coroutine method mirrors the PrimeClient method of the same name and
+    shares one pooled httpx.AsyncClient.
+    """
+
+    def __init__(self, credentials: Credentials, http_client: Optional['httpx.AsyncClient'] = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None, timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+                 endpoint_timeouts: Optional[Dict[str, Timeout]] = None, lazy_decoding: bool = False,
+                 response_cache: Optional[ResponseCache] = None, entity_cache: Optional['EntityCache'] = None):
+        """
+        Initialize the async Prime client with credentials.
+
+        Args:
+            credentials: Coinbase Prime API credentials
+            http_client: Optional httpx.AsyncClient to send requests with; pool settings are ignored when given
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept open
+            retry_policy: Optional policy for retrying throttled, failed or unreachable requests
+            rate_limiter: Optional client-side rate limiter; share one instance to limit several clients together
+            timeout: Connect and read timeout in seconds, or a (connect, read) tuple; None waits forever
+            endpoint_timeouts: Timeouts for individual operations, keyed by method name (e.g. "list_portfolio_fills")
+            lazy_decoding: If True, response models are decoded field by field on first access
+            response_cache: Optional ResponseCache for the responses of slow-changing endpoints
+            entity_cache: Optional EntityCache for orders, transactions, allocations and activities
+                in a terminal state
+        """
+        self.credentials = credentials
+        self.endpoint_timeouts = dict(endpoint_timeouts) if endpoint_timeouts else {}
+        self.lazy_decoding = lazy_decoding
+        self.response_cache = response_cache
+        self.entity_cache = entity_cache
+        # A session given by the caller may carry transport settings (proxies, TLS) that
+        # httpx does not expose, so priority calls only get a pool of their own otherwise
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = new_async_http_client(max_connections=max_connections,
+                                                max_keepalive_connections=max_keepalive_connections)
+        self.client = AsyncClient(credentials, http_client, retry_policy=retry_policy, rate_limiter=rate_limiter,
+                                  timeout=timeout)
+        self._priority_client: Optional[AsyncClient] = None
+        self._priority_max_connections = 0
+        self._retired_clients: List[AsyncClient] = []
+
+    async def close(self) -> None:
+        """Close the shared connection pool."""
+        await self.client.close()
+        if self._priority_client is not None:
+            self._retired_clients.append(self._priority_client)
+            self._priority_client = None
+        while self._retired_clients:
+            await self._retired_clients.pop().close()
+
+    async def __aenter__(self) -> 'AsyncPrimeClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def create_orders_bulk(self, requests: Iterable[Any], concurrency: int = bulk.DEFAULT_BULK_CONCURRENCY,
+                                 deadline: Union[Deadline, float, None] = None) -> List[bulk.BulkOrderResult]:
+        """Async variant of PrimeClient.create_orders_bulk; orders are sent by concurrent tasks."""
+        bucket = default_bucket() if self.client.rate_limiter is None else None
+        return await bulk.acreate_orders_bulk(self.create_order, requests, concurrency, deadline, bucket)
+
+    async def cancel_all_open_orders(self, portfolio_id: str, product_ids: Union[str, Iterable[str], None] = None,
+                                     side: Any = None, concurrency: int = cancel_all.DEFAULT_CANCEL_CONCURRENCY,
+                                     deadline: Union[Deadline, float, None] = cancel_all.DEFAULT_FLATTEN_DEADLINE,
+                                     verify_interval: float = cancel_all.DEFAULT_VERIFY_INTERVAL
+                                     ) -> cancel_all.CancelAllResult:
+        """
+        Async variant of PrimeClient.cancel_all_open_orders; cancels are sent by concurrent tasks.
+
+        When the client was created with its own http_client, requests are sent
+        through that client rather than over a reserved connection pool.
+        """
+        return await cancel_all.acancel_all_open_orders(
+            self._priority_endpoint("list_open_orders", concurrency),
+            self._priority_endpoint("cancel_order", concurrency), portfolio_id, product_ids=product_ids,
+            side=side, concurrency=concurrency, deadline=deadline, verify_interval=verify_interval)
+
+    async def fetch_many(self, kind: str, ids: Iterable[str], portfolio_id: Optional[str] = None,
+                         concurrency: int = fetch.DEFAULT_FETCH_CONCURRENCY,
+                         deadline: Union[Deadline, float, None] = None) -> Dict[str, fetch.FetchResult]:
+        """Async variant of PrimeClient.fetch_many; lookups are sent by concurrent tasks."""
+        endpoint = vars(PrimeClient)[fetch.entity_kind(kind).endpoint]
+        bucket = default_bucket() if self.client.rate_limiter is None else None
+        return await fetch.afetch_many(functools.partial(self._send, endpoint), kind, ids,
+                                       portfolio_id or self.credentials.portfolio_id, concurrency=concurrency,
+                                       deadline=deadline, cache=self.entity_cache, bucket=bucket,
+                                       scope=self.credentials.access_key)
+
+    def _priority_endpoint(self, name: str, max_connections: int):
+        # Endpoint coroutines sent through a second AsyncClient with its own connection pool, rebuilt
+        # when a larger max_connections is requested; the pools it replaces are closed with the client
+        if self._owns_http_client and max_connections > self._priority_max_connections:
+            if self._priority_client is not None:
+                self._retired_clients.append(self._priority_client)
+            priority = AsyncClient(self.credentials,
+                                   new_async_http_client(max_connections=max_connections,
+                                                         max_keepalive_connections=max_connections),
+                                   retry_policy=self.client.retry_policy, rate_limiter=self.client.rate_limiter,
+                                   timeout=self.client.timeout)
+            priority.http_base_url = self.client.http_base_url
+            self._priority_client = priority
+            self._priority_max_connections = max_connections
+        client = self._priority_client
+        endpoint = vars(PrimeClient)[name]
+
+        async def call(request: Any) -> Any:
+            with call_options(timeout=self.endpoint_timeouts.get(endpoint.module)):
+                return await self._call(endpoint.module, endpoint.method, request, client)
+
+        return call
+
+    async def _send(self, endpoint: _Endpoint, request: Any, deadline: Union[Deadline, float, None] = None) -> Any:
+        # An endpoint call without the client's caches
+        with call_options(deadline=deadline, timeout=self.endpoint_timeouts.get(endpoint.module)):
+            return await self._call(endpoint.module, endpoint.method, request)
+
+    async def _call(self, module: str, method: str, request: Any, client: Optional[AsyncClient] = None) -> Any:
+        recorded, response_type = record_request(self.credentials, module, method, request)
+        response = await (client or self.client).request(recorded.method, recorded.path, query=recorded.query,
+                                             body=recorded.body, allowed_status_codes=recorded.allowed_status_codes)
+        payload = json_codec.loads(response.content)
+        if self.lazy_decoding:
+            with lazy_decoding():
+                return response_type(**payload)
+        return response_type(**payload)
+
+
+def _async_endpoint(name: str, endpoint: _Endpoint):
+    async def call(self: AsyncPrimeClient, request: Any, deadline: Union[Deadline, float, None] = None) -> Any:
+        method = functools.partial(self._send, endpoint)
+        if self.response_cache is not None and self.response_cache.caches(endpoint.module):
+            method = functools.partial(self.response_cache.afetch, endpoint.module, method,
+                                       scope=self.credentials.access_key)
+        if self.entity_cache is not None and self.entity_cache.caches(endpoint.module):
+            method = functools.partial(self.entity_cache.afetch, endpoint.module, method,
+                                       scope=self.credentials.access_key)
+        return await method(request, deadline)
+
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f"Async variant of PrimeClient.{name}."
+    return call
+
+
+def _async_paginator(name: str, paginator: _Paginator):
+    def iterate(self: AsyncPrimeClient, request: Any, page_size: Optional[int] = None,
+                max_items: Optional[int] = None, deadline: Union[Deadline, float, None] = None,
+                prefetch: int = 0) -> AsyncIterator[Any]:
+        return aiter_items(getattr(self, paginator.endpoint), request, paginator.items_field,
+                           page_size=page_size, max_items=max_items, deadline=deadline, prefetch=prefetch)
+
+    iterate.__name__ = iterate.__qualname__ = name
+    iterate.__doc__ = f"Async variant of PrimeClient.{name}; use with async for."
+    return iterate
+
+
+def _async_sharded(name: str, sharded: _Sharded):
+    def iterate(self: AsyncPrimeClient, request: Any, shards: int = DEFAULT_SHARDS,
+                max_workers: int = DEFAULT_MAX_WORKERS, page_size: Optional[int] = None,
+                min_window: timedelta = DEFAULT_MIN_WINDOW,
+                deadline: Union[Deadline, float, None] = None) -> AsyncIterator[Any]:
+        return aiter_sharded(getattr(self, sharded.endpoint), request, TIME_RANGE_ENDPOINTS[sharded.endpoint],
+                             shards=shards, max_workers=max_workers, page_size=page_size,
+                             min_window=min_window, deadline=deadline)
+
+    iterate.__name__ = iterate.__qualname__ = name
+    iterate.__doc__ = f"Async variant of PrimeClient.{name}; use with async for."
+    return iterate
+
+
+for _name, _attribute in vars(PrimeClient).items():
+    if isinstance(_attribute, _Endpoint):
+        setattr(AsyncPrimeClient, _name, _async_endpoint(_name, _attribute))
+    elif isinstance(_attribute, _Paginator):
+        setattr(AsyncPrimeClient, _name, _async_paginator(_name, _attribute))
+    elif isinstance(_attribute, _Sharded):
+        setattr(AsyncPrimeClient, _name, _async_sharded(_name, _attribute))
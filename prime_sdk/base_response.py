@@ -12,29 +12,215 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import dataclasses
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, fields, asdict
-from typing import get_type_hints
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union, get_type_hints
+
+from prime_sdk import json_codec
+from prime_sdk.lazy import LazyList, lazy_decoding_enabled, lazy_model
+
+DecodePlan = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+_decode_plans: Dict[Tuple[type, bool, bool], DecodePlan] = {}
+_model_decoders: Dict[type, Callable[[Any], Any]] = {}
+_full_depth_decoders: Dict[Tuple[type, bool], Callable[[Any], Any]] = {}
+_lazy_model_decoders: Dict[Tuple[type, bool], Callable[[Any], Any]] = {}
+
+_full_depth_decoding = ContextVar("prime_sdk_full_depth_decoding", default=False)
+
+
+def full_depth_decoding_enabled() -> bool:
+    """Return whether responses built in the current context decode nested models to full depth."""
+    return _full_depth_decoding.get()
+
+
+@contextmanager
+def full_depth_decoding(enabled: bool = True) -> Iterator[None]:
+    """
+    Decode nested models of responses built inside the block to any depth.
+
+    By default only the records a response holds directly are built, and
+    objects nested inside them stay dicts. Building the whole typed tree
+    costs several times as much per record on wide models such as
+    Transaction and MarginSummaryRecord.
+    """
+    token = _full_depth_decoding.set(enabled)
+    try:
+        yield
+    finally:
+        _full_depth_decoding.reset(token)
+
+
+def model_decoder(model: type) -> Callable[[Any], Any]:
+    """Return the cached converter that turns a JSON object into an instance of model."""
+    decoder = _model_decoders.get(model)
+    if decoder is None:
+        def decoder(value):
+            return model(**value) if isinstance(value, dict) else value
+        _model_decoders[model] = decoder
+    return decoder
+
+
+def full_depth_model_decoder(model: type, strict: bool = True) -> Callable[[Any], Any]:
+    """
+    Return the cached converter that turns a JSON object into an instance of model, nested models included.
+
+    Nested model fields are decoded first, to any depth, and the model is then
+    built with model(**value). With strict=True unknown or missing keys raise
+    TypeError as model_decoder does; nested objects are decoded with
+    strict=False, which skips keys that are not fields of their model. The
+    model's own plan is resolved on first use, which keeps recursive models finite.
+    """
+    decoder = _full_depth_decoders.get((model, strict))
+    if decoder is not None:
+        return decoder
+    plan = () if issubclass(model, BaseResponse) else None
+    names = frozenset(f.name for f in fields(model))
+
+    def decoder(value):
+        nonlocal plan
+        if not isinstance(value, dict):
+            return value
+        if plan is None:
+            plan = decode_plan(model, full_depth=True)
+        if not strict and not names.issuperset(value):
+            value = {name: item for name, item in value.items() if name in names}
+        elif plan:
+            value = dict(value)
+        for name, convert in plan:
+            field_value = value.get(name)
+            if field_value is not None:
+                value[name] = convert(field_value)
+        return model(**value)
+
+    _full_depth_decoders[(model, strict)] = decoder
+    return decoder
+
+
+def lazy_model_decoder(model: type, full_depth: bool = False) -> Callable[[Any], Any]:
+    """
+    Return the cached converter that wraps a JSON object as a lazily decoded instance of model.
+
+    As with model_decoder, objects nested in the model stay dicts unless
+    full_depth is set, in which case they are wrapped lazily too.
+    """
+    decoder = _lazy_model_decoders.get((model, full_depth))
+    if decoder is not None:
+        return decoder
+    if issubclass(model, BaseResponse):
+        return model_decoder(model)
+    wrap = None
+
+    def decoder(value):
+        nonlocal wrap
+        if not isinstance(value, dict):
+            return value
+        if wrap is None:
+            wrap = lazy_model(model, dict(decode_plan(model, lazy=True, full_depth=True)) if full_depth else {})
+        return wrap(value)
+
+    _lazy_model_decoders[(model, full_depth)] = decoder
+    return decoder
+
+
+def _lazy_list_converter(convert_item: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value):
+        if not isinstance(value, list):
+            return value
+        return LazyList(value, convert_item)
+    return convert
+
+
+def _list_converter(convert_item: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value):
+        if not isinstance(value, list):
+            return value
+        return [convert_item(item) for item in value]
+    return convert
+
+
+def _model_list_converter(model: type) -> Callable[[Any], Any]:
+    # model_decoder inlined, as this runs once per record of every list response
+    def convert(value):
+        if not isinstance(value, list):
+            return value
+        return [model(**item) if isinstance(item, dict) else item for item in value]
+    return convert
+
+
+def _dict_converter(convert_value: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value):
+        if not isinstance(value, dict):
+            return value
+        return {key: convert_value(item) for key, item in value.items()}
+    return convert
+
+
+def _field_converter(expected_type: Any, lazy: bool = False, full_depth: bool = False,
+                     strict: bool = True) -> Optional[Callable[[Any], Any]]:
+    """Return a converter for values annotated expected_type, or None if they are used as-is."""
+    if dataclasses.is_dataclass(expected_type) and isinstance(expected_type, type):
+        if lazy:
+            return lazy_model_decoder(expected_type, full_depth)
+        return full_depth_model_decoder(expected_type, strict) if full_depth else model_decoder(expected_type)
+    origin = getattr(expected_type, '__origin__', None)
+    args = getattr(expected_type, '__args__', None) or ()
+    if origin is Union:
+        options = [arg for arg in args if arg is not type(None)]
+        return _field_converter(options[0], lazy, full_depth, strict) if len(options) == 1 else None
+    if origin is list and args:
+        convert_item = _field_converter(args[0], lazy, full_depth, strict)
+        if convert_item is None:
+            return None
+        if lazy:
+            return _lazy_list_converter(convert_item)
+        if not full_depth and dataclasses.is_dataclass(args[0]):
+            return _model_list_converter(args[0])
+        return _list_converter(convert_item)
+    if origin is dict and len(args) == 2:
+        convert_value = _field_converter(args[1], lazy, full_depth, strict)
+        return _dict_converter(convert_value) if convert_value else None
+    return None
+
+
+def decode_plan(cls: type, lazy: bool = False, full_depth: bool = False) -> DecodePlan:
+    """
+    Return the (field name, converter) pairs applied when cls is instantiated.
+
+    Type hints are resolved once per class and cached; fields that hold plain
+    values have no converter and are skipped. Models, lists and dicts of models,
+    and Optional forms of those are converted. By default the models are built
+    from their JSON objects as they are, leaving objects nested inside them as
+    dicts; with full_depth=True they are decoded at every depth. With lazy=True
+    the same models are wrapped for decoding on first access instead, and their
+    lists become LazyLists.
+    """
+    plan = _decode_plans.get((cls, lazy, full_depth))
+    if plan is None:
+        type_hints = get_type_hints(cls)
+        # Records held by a response keep the constructor's checks; objects nested in them skip unknown keys
+        strict = issubclass(cls, BaseResponse)
+        steps = []
+        for f in fields(cls):
+            converter = _field_converter(type_hints.get(f.name), lazy, full_depth, strict)
+            if converter is not None:
+                steps.append((f.name, converter))
+        plan = _decode_plans[(cls, lazy, full_depth)] = tuple(steps)
+    return plan
+
 
 @dataclass
 class BaseResponse:
     def __post_init__(self):
-        type_hints = get_type_hints(self.__class__)
-        for f in fields(self):
-            value = getattr(self, f.name)
-            if value is None:
-                continue
-            expected_type = type_hints.get(f.name)
-            if hasattr(expected_type, '__origin__') and expected_type.__origin__ is list:
-                inner_type = expected_type.__args__[0]
-                if dataclasses.is_dataclass(inner_type) and isinstance(value, list):
-                    setattr(self, f.name, [inner_type(**v) if isinstance(v, dict) else v for v in value])
-            elif dataclasses.is_dataclass(expected_type) and isinstance(value, dict):
-                setattr(self, f.name, expected_type(**value))
+        for name, convert in decode_plan(self.__class__, lazy_decoding_enabled(), full_depth_decoding_enabled()):
+            value = getattr(self, name)
+            if value is not None:
+                setattr(self, name, convert(value))
 
     def __str__(self):
-        return json.dumps(asdict(self), indent=2)
+        return json_codec.dumps_pretty(asdict(self))
 
     def __repr__(self):
         return self.__str__()
\ No newline at end of file
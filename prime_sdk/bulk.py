@@ -0,0 +1,134 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Concurrent submission of many orders.
+
+create_orders_bulk sends create_order requests from a pool of `concurrency`
+workers. Every request waits for the client's rate limiter, or, when the
+client has none, for an order-entry TokenBucket at Prime's documented rate, so
+the workers wait for tokens instead of provoking 429s. Results come back in
+input order, one BulkOrderResult per request, and a failed order does not
+stop the rest of the batch.
+
+Each order carries a client_order_id, generated when the request leaves it
+empty, which Prime uses to reject duplicates. The orders are therefore sent as
+idempotent calls: the client's RetryPolicy may resend an order whose first
+attempt could have reached the server (a read timeout or a 5xx), which it
+never does for other POSTs.
+"""
+
+import contextvars
+import uuid
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Union
+
+from prime_sdk.rate_limit import TokenBucket, check_concurrency
+from prime_sdk.timeouts import Deadline, call_options
+
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+@dataclass
+class BulkOrderResult:
+    """The outcome of one order of a bulk submission."""
+    request: Any
+    response: Optional[Any] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def order_id(self) -> Optional[str]:
+        return self.response.order_id if self.response is not None else None
+
+
+def with_client_order_id(request: Any) -> Any:
+    """Return the request with a random client_order_id if it has none."""
+    if request.client_order_id:
+        return request
+    return replace(request, client_order_id=str(uuid.uuid4()))
+
+
+def _results(requests: Iterable[Any]) -> List[BulkOrderResult]:
+    return [BulkOrderResult(with_client_order_id(request)) for request in requests]
+
+
+def create_orders_bulk(create_order: Callable[[Any], Any], requests: Iterable[Any],
+                       concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                       deadline: Union[Deadline, float, None] = None,
+                       bucket: Optional[TokenBucket] = None) -> List[BulkOrderResult]:
+    """
+    Submit orders concurrently and return one result per request, in input order.
+
+    Args:
+        create_order: The endpoint method, e.g. client.create_order
+        requests: CreateOrderRequests; those without a client_order_id are given one
+        concurrency: Maximum number of orders in flight at once
+        deadline: Optional deadline, in seconds or as a Deadline, for the whole batch; orders not
+            sent by then fail with DeadlineExceededError
+        bucket: Optional TokenBucket every order waits on before it is sent; pass one when
+            create_order is not already rate limited
+
+    A failed order is reported in its result's error rather than raised. If it was
+    resent, check its client_order_id before submitting it again: an earlier attempt
+    may have been accepted.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    check_concurrency(concurrency)
+    results = _results(requests)
+    if not results:
+        return results
+    deadline = Deadline.of(deadline)
+
+    def submit(result: BulkOrderResult) -> None:
+        try:
+            if bucket is not None:
+                bucket.acquire(deadline=deadline)
+            with call_options(deadline=deadline, idempotent=True):
+                result.response = create_order(result.request)
+        except Exception as e:
+            result.error = e
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(results)), thread_name_prefix="prime-sdk-bulk") as pool:
+        for result in results:
+            pool.submit(contextvars.copy_context().run, submit, result)
+    return results
+
+
+async def acreate_orders_bulk(create_order: Callable[[Any], Awaitable[Any]], requests: Iterable[Any],
+                              concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                              deadline: Union[Deadline, float, None] = None,
+                              bucket: Optional[TokenBucket] = None) -> List[BulkOrderResult]:
+    """Async variant of create_orders_bulk for AsyncPrimeClient.create_order; orders are sent by concurrent tasks."""
+    import asyncio
+    check_concurrency(concurrency)
+    results = _results(requests)
+    deadline = Deadline.of(deadline)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def submit(result: BulkOrderResult) -> None:
+        async with slots:
+            try:
+                if bucket is not None:
+                    await bucket.acquire_async(deadline=deadline)
+                with call_options(deadline=deadline, idempotent=True):
+                    result.response = await create_order(result.request)
+            except Exception as e:
+                result.error = e
+
+    await asyncio.gather(*(submit(result) for result in results))
+    return results
@@ -0,0 +1,213 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cancelling every open order of a portfolio as fast as possible.
+
+cancel_all_open_orders lists the open orders, optionally narrowed to some
+products or one side, and sends a cancel_order for each of them from a pool of
+`concurrency` workers. It then lists the open orders again, cancelling any that
+are new or whose cancel failed, until none are left or the deadline passes.
+The result reports what was cancelled, what could not be, and the time it
+took for the book to be verified empty.
+
+PrimeClient.cancel_all_open_orders sends these requests over a connection pool
+of its own, so a kill switch does not wait for connections held by other
+traffic on the same client. Cancels are resent by the client's RetryPolicy
+when their outcome is unknown; cancelling an order twice is harmless.
+"""
+
+import contextvars
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
+
+from prime_sdk.errors import DeadlineExceededError
+from prime_sdk.rate_limit import check_concurrency
+from prime_sdk.timeouts import Deadline, call_options
+
+DEFAULT_CANCEL_CONCURRENCY = 32
+DEFAULT_FLATTEN_DEADLINE = 30.0
+DEFAULT_VERIFY_INTERVAL = 0.25
+
+
+@dataclass
+class CancelAllResult:
+    """The outcome of cancel_all_open_orders."""
+    cancelled: List[str] = field(default_factory=list)
+    failed: Dict[str, Exception] = field(default_factory=dict)
+    remaining: List[Any] = field(default_factory=list)
+    rounds: int = 0
+    time_to_flatten: Optional[float] = None
+    elapsed: float = 0.0
+
+    @property
+    def flat(self) -> bool:
+        """Whether the last listing found no open orders."""
+        return self.time_to_flatten is not None
+
+    def __str__(self) -> str:
+        outcome = f"flat after {self.time_to_flatten:.3f}s" if self.flat else f"{len(self.remaining)} still open"
+        return (f"{outcome}: {len(self.cancelled)} cancelled, {len(self.failed)} failed, "
+                f"{self.rounds} rounds in {self.elapsed:.3f}s")
+
+
+def open_orders_request(portfolio_id: str, product_ids: Union[str, Sequence[str], None] = None,
+                        side: Union[Enum, str, None] = None) -> Any:
+    """Build the ListOpenOrdersRequest for a portfolio, optionally filtered by products and side."""
+    from prime_sdk.list_open_orders import ListOpenOrdersRequest
+    if product_ids is not None and not isinstance(product_ids, str):
+        product_ids = list(product_ids)
+    return ListOpenOrdersRequest(portfolio_id=portfolio_id, product_ids=product_ids or None,
+                                 order_side=side.value if isinstance(side, Enum) else side)
+
+
+def _cancel_request(portfolio_id: str, order_id: str) -> Any:
+    from prime_sdk.cancel_order import CancelOrderRequest
+    return CancelOrderRequest(portfolio_id=portfolio_id, order_id=order_id)
+
+
+class _Rounds:
+    """Bookkeeping shared by the sync and async loops."""
+
+    def __init__(self, deadline: Union[Deadline, float, None]):
+        self.started_at = time.monotonic()
+        self.deadline = Deadline.of(deadline)
+        self.result = CancelAllResult()
+        self.accepted = set()
+
+    def listed(self, orders: Optional[List[Any]]) -> List[str]:
+        """Record a listing and return the ids of the orders that need a cancel sent."""
+        self.result.rounds += 1
+        self.result.remaining = list(orders or [])
+        if not self.result.remaining:
+            self.result.time_to_flatten = time.monotonic() - self.started_at
+        return [order.id for order in self.result.remaining if order.id not in self.accepted]
+
+    def cancelled(self, order_id: str, error: Optional[Exception]) -> None:
+        if error is None:
+            self.accepted.add(order_id)
+            self.result.cancelled.append(order_id)
+            self.result.failed.pop(order_id, None)
+        elif isinstance(error, DeadlineExceededError):
+            # Keep the reason an earlier attempt failed, if there was one
+            self.result.failed.setdefault(order_id, error)
+        else:
+            self.result.failed[order_id] = error
+
+    def can_wait(self, seconds: float) -> bool:
+        """Whether the deadline leaves time to wait `seconds` and list again."""
+        return self.deadline is None or self.deadline.allows(seconds)
+
+    def finish(self) -> CancelAllResult:
+        self.result.elapsed = time.monotonic() - self.started_at
+        return self.result
+
+
+def cancel_all_open_orders(list_open_orders: Callable[[Any], Any], cancel_order: Callable[[Any], Any],
+                           portfolio_id: str, product_ids: Union[str, Sequence[str], None] = None,
+                           side: Union[Enum, str, None] = None, concurrency: int = DEFAULT_CANCEL_CONCURRENCY,
+                           deadline: Union[Deadline, float, None] = DEFAULT_FLATTEN_DEADLINE,
+                           verify_interval: float = DEFAULT_VERIFY_INTERVAL) -> CancelAllResult:
+    """
+    Cancel the open orders of a portfolio and re-list until none are left or the deadline passes.
+
+    Args:
+        list_open_orders: The endpoint method, e.g. client.list_open_orders
+        cancel_order: The endpoint method, e.g. client.cancel_order
+        portfolio_id: The portfolio to flatten
+        product_ids: Only cancel orders for these products
+        side: Only cancel orders on this side (OrderSide or "BUY"/"SELL")
+        concurrency: Maximum number of cancels in flight at once
+        deadline: Deadline, in seconds or as a Deadline, for cancelling and verifying
+        verify_interval: Seconds to wait between a round of cancels and the next listing
+
+    Errors from cancel_order are collected in the result. Errors listing the orders are raised,
+    except when the deadline passes during a verifying listing; the result then holds the orders
+    still open at the previous one.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    check_concurrency(concurrency)
+    rounds = _Rounds(deadline)
+    request = open_orders_request(portfolio_id, product_ids, side)
+
+    def cancel(order_id: str) -> None:
+        try:
+            with call_options(deadline=rounds.deadline, idempotent=True):
+                cancel_order(_cancel_request(portfolio_id, order_id))
+        except Exception as e:
+            rounds.cancelled(order_id, e)
+        else:
+            rounds.cancelled(order_id, None)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="prime-sdk-cancel") as pool:
+        while True:
+            try:
+                with call_options(deadline=rounds.deadline):
+                    pending = rounds.listed(list_open_orders(request).orders)
+            except DeadlineExceededError:
+                if not rounds.result.rounds:
+                    raise
+                break
+            if rounds.result.flat:
+                break
+            futures = [pool.submit(contextvars.copy_context().run, cancel, order_id) for order_id in pending]
+            for future in futures:
+                future.result()
+            if not rounds.can_wait(verify_interval):
+                break
+            time.sleep(verify_interval)
+    return rounds.finish()
+
+
+async def acancel_all_open_orders(list_open_orders: Callable[[Any], Awaitable[Any]],
+                                  cancel_order: Callable[[Any], Awaitable[Any]], portfolio_id: str,
+                                  product_ids: Union[str, Sequence[str], None] = None,
+                                  side: Union[Enum, str, None] = None,
+                                  concurrency: int = DEFAULT_CANCEL_CONCURRENCY,
+                                  deadline: Union[Deadline, float, None] = DEFAULT_FLATTEN_DEADLINE,
+                                  verify_interval: float = DEFAULT_VERIFY_INTERVAL) -> CancelAllResult:
+    """Async variant of cancel_all_open_orders for AsyncPrimeClient methods; cancels are sent by concurrent tasks."""
+    import asyncio
+    check_concurrency(concurrency)
+    rounds = _Rounds(deadline)
+    request = open_orders_request(portfolio_id, product_ids, side)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def cancel(order_id: str) -> None:
+        async with slots:
+            try:
+                with call_options(deadline=rounds.deadline, idempotent=True):
+                    await cancel_order(_cancel_request(portfolio_id, order_id))
+            except Exception as e:
+                rounds.cancelled(order_id, e)
+            else:
+                rounds.cancelled(order_id, None)
+
+    while True:
+        try:
+            with call_options(deadline=rounds.deadline):
+                pending = rounds.listed((await list_open_orders(request)).orders)
+        except DeadlineExceededError:
+            if not rounds.result.rounds:
+                raise
+            break
+        if rounds.result.flat:
+            break
+        await asyncio.gather(*(cancel(order_id) for order_id in pending))
+        if not rounds.can_wait(verify_interval):
+            break
+        await asyncio.sleep(verify_interval)
+    return rounds.finish()
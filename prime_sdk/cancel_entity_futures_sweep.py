@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 
@@ -33,10 +33,10 @@ class CancelEntityFuturesSweepResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def cancel_entity_futures_sweep(self, request: CancelEntityFuturesSweepRequest) -> CancelEntityFuturesSweepResponse:
         path = f"/entities/{request.entity_id}/futures/sweeps"
         response = self.client.request("DELETE", path, allowed_status_codes=request.allowed_status_codes)
-        return CancelEntityFuturesSweepResponse(**response.json())
+        return CancelEntityFuturesSweepResponse(**response_json(response))
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass, asdict
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 
@@ -32,10 +32,10 @@ class CancelOrderResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def cancel_order(self, request: CancelOrderRequest) -> CancelOrderResponse:
         path = f"/portfolios/{request.portfolio_id}/orders/{request.order_id}/cancel"
         response = self.client.request("POST", path, allowed_status_codes=request.allowed_status_codes)
-        return CancelOrderResponse(**response.json())
+        return CancelOrderResponse(**response_json(response))
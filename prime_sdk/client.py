@@ -15,54 +15,268 @@
 import hmac
 import hashlib
 import base64
+import copy
+import importlib
 import requests
 import time
-import json
-from typing import Optional, Dict, List
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from typing import Optional, Dict, List, Tuple, Any
+from prime_sdk import json_codec
 from prime_sdk.credentials import Credentials
+from prime_sdk.errors import PrimeAPIError, DeadlineExceededError
+from prime_sdk.rate_limit import RateLimiter
+from prime_sdk.retry import RetryPolicy
+from prime_sdk.single_flight import SingleFlight
+from prime_sdk.timeouts import CallOptions, Timeout, DEFAULT_TIMEOUT, current_call_options, clamp_timeout
 
 DEFAULT_V1_API_BASE_URL = "https://api.prime.coinbase.com/v1"
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
 
 
-class Client:
-    def __init__(self, credentials: Credentials, http_client: Optional[requests.Session] = None):
+def new_http_client(pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                    keep_alive: bool = True) -> requests.Session:
+    """
+    Build a requests.Session with a sized connection pool.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum number of connections kept per host pool
+        keep_alive: If False, ask the server to close the connection after every request
+    """
+    session = requests.Session()
+    mount_pool(session, pool_connections, pool_maxsize)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def copy_http_client(session: requests.Session, pool_maxsize: int) -> requests.Session:
+    """
+    Build a session with the settings of another but a connection pool of its own.
+
+    Headers (including Connection: close), auth, cookies, proxies, verify, cert,
+    trust_env and hooks are copied, and the new pool keeps the retry settings of
+    the original https:// adapter.
+
+    Args:
+        session: The session whose settings are copied
+        pool_maxsize: Maximum number of connections kept per host pool
+    """
+    copied = requests.Session()
+    for name in ("headers", "params", "proxies", "hooks", "verify", "cert", "max_redirects", "trust_env"):
+        setattr(copied, name, copy.deepcopy(getattr(session, name)))
+    copied.auth = session.auth
+    copied.cookies = session.cookies.copy()
+    adapter = session.get_adapter("https://")
+    mount_pool(copied, 1, pool_maxsize, getattr(adapter, "max_retries", 0))
+    return copied
+
+
+def mount_pool(session: requests.Session, pool_connections: int, pool_maxsize: int, max_retries: Any = 0) -> None:
+    """Mount a new HTTPAdapter for http:// and https:// on a session, closing the adapters it replaces."""
+    replaced = {session.adapters.get(prefix) for prefix in ("https://", "http://")}
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    for old in replaced - {None}:
+        old.close()
+
+
+def _request_sent(error: requests.RequestException) -> bool:
+    """Whether a request that failed with a connection error may have reached the server."""
+    if isinstance(error, requests.ConnectTimeout):
+        return False
+    cause = error.args[0] if error.args else None
+    reason = getattr(cause, "reason", cause)
+    # Refused, unreachable or unresolved: the connection was never established
+    return not isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def encode_body(body: Optional[Dict]) -> Optional[bytes]:
+    """Serialize a request body to the exact bytes that are signed and sent."""
+    return json_codec.dumps(body) if body else None
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a response body with the configured JSON codec."""
+    return json_codec.loads(response.content)
+
+
+class BaseClient:
+    """Request signing and response checks shared by Client and AsyncClient."""
+
+    def __init__(self, credentials: Credentials, retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None, timeout: Optional[Timeout] = DEFAULT_TIMEOUT):
         self.http_base_url = DEFAULT_V1_API_BASE_URL
         self.credentials = credentials
-        self.http_client = http_client if http_client else requests.Session()
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
 
     def generate_headers(self, method: str, path: str, body: Optional[Dict] = None) -> Dict[str, str]:
+        return self.generate_headers_for_bytes(method, path, encode_body(body))
+
+    def generate_headers_for_bytes(self, method: str, path: str, body: Optional[bytes] = None) -> Dict[str, str]:
         timestamp = str(int(time.time()))
-        body_string = json.dumps(body) if body else ""
-        message = f"{timestamp}{method}{path}{body_string}"
-        signature = self.sign(message)
+        message = f"{timestamp}{method}{path}".encode()
+        if body:
+            message += body
+        signature = self.sign_bytes(message)
 
-        return {
+        headers = {
             "Accept": "application/json",
             "X-CB-ACCESS-KEY": self.credentials.access_key,
             "X-CB-ACCESS-PASSPHRASE": self.credentials.passphrase,
             "X-CB-ACCESS-SIGNATURE": signature,
             "X-CB-ACCESS-TIMESTAMP": timestamp,
         }
+        if body:
+            headers["Content-Type"] = "application/json"
+        return headers
 
     def sign(self, message: str) -> str:
-        h = hmac.new(self.credentials.signing_key.encode(), message.encode(), hashlib.sha256)
+        return self.sign_bytes(message.encode())
+
+    def sign_bytes(self, message: bytes) -> str:
+        h = hmac.new(self.credentials.signing_key_bytes, message, hashlib.sha256)
         return base64.b64encode(h.digest()).decode()
 
-    def request(self, method: str, path: str, query: Optional[str] = "", body: Optional[Dict] = None,
-                allowed_status_codes: Optional[List[int]] = None) -> requests.Response:
-        if allowed_status_codes is None:
-            allowed_status_codes = [200]
+    def build_url(self, path: str, query: Optional[str] = "") -> str:
         full_path = f"{self.http_base_url}{path}"
-        url = f"{full_path}?{query}" if query else full_path
-
-        headers = self.generate_headers(method, f"/v1{path}", body)
-        response = self.http_client.request(method, url, headers=headers, json=body)
+        return f"{full_path}?{query}" if query else full_path
 
+    def check_response(self, response: Any, allowed_status_codes: List[int]) -> None:
         if response.status_code not in allowed_status_codes:
             try:
                 error_details = response.json()
                 error_message = error_details.get('message', response.text)
             except ValueError:
                 error_message = response.text
-            raise Exception(f"Request failed with status {response.status_code}: {error_message}")
-        return response
+            raise PrimeAPIError(response.status_code, error_message, response.headers.get("Retry-After"))
+
+
+class Client(BaseClient):
+    def __init__(self, credentials: Credentials, http_client: Optional[requests.Session] = None,
+                 retry_policy: Optional[RetryPolicy] = None, rate_limiter: Optional[RateLimiter] = None,
+                 timeout: Optional[Timeout] = DEFAULT_TIMEOUT, single_flight: Optional[SingleFlight] = None):
+        super().__init__(credentials, retry_policy, rate_limiter, timeout)
+        self.http_client = http_client if http_client else requests.Session()
+        self.single_flight = single_flight
+
+    def close(self) -> None:
+        self.http_client.close()
+
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def request(self, method: str, path: str, query: Optional[str] = "", body: Optional[Dict] = None,
+                allowed_status_codes: Optional[List[int]] = None, stream: bool = False) -> requests.Response:
+        """
+        Send a signed request and return the checked response.
+
+        With stream=True the body is not read up front; the caller reads it, e.g. with
+        response.iter_content(), and must close the response.
+
+        With a single_flight, a GET identical to one already in flight waits for and
+        returns that request's response instead of sending its own.
+        """
+        if allowed_status_codes is None:
+            allowed_status_codes = [200]
+        url = self.build_url(path, query)
+        options = current_call_options()
+        if self.single_flight is not None and method == "GET" and body is None and not stream:
+            key = (self.credentials.access_key, url, tuple(allowed_status_codes))
+            return self.single_flight.do(key, lambda: self._send(method, path, url, None, allowed_status_codes,
+                                                                 stream, options), options.deadline)
+        return self._send(method, path, url, encode_body(body), allowed_status_codes, stream, options)
+
+    def _send(self, method: str, path: str, url: str, data: Optional[bytes], allowed_status_codes: List[int],
+              stream: bool, options: CallOptions) -> requests.Response:
+        retry = self.retry_policy.start() if self.retry_policy else None
+        deadline = options.deadline
+        timeout = options.timeout if options.timeout is not None else self.timeout
+
+        while True:
+            if deadline:
+                deadline.check()
+            if self.rate_limiter:
+                self.rate_limiter.acquire(method, path, deadline)
+            # Signed per attempt so that retries carry a fresh timestamp
+            headers = self.generate_headers_for_bytes(method, f"/v1{path}", data)
+            try:
+                response = self.http_client.request(method, url, headers=headers, data=data,
+                                                    timeout=clamp_timeout(timeout, deadline), stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if deadline and deadline.expired():
+                    raise DeadlineExceededError(f"{method} {path} did not complete before the deadline") from e
+                delay = retry.on_error(method, _request_sent(e), options.idempotent) if retry else None
+                if delay is None or (deadline and not deadline.allows(delay)):
+                    raise
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in allowed_status_codes and retry:
+                delay = retry.on_status(method, response.status_code, response.headers.get("Retry-After"),
+                                        options.idempotent)
+                if delay is not None and (deadline is None or deadline.allows(delay)):
+                    response.close()
+                    time.sleep(delay)
+                    continue
+
+            self.check_response(response, allowed_status_codes)
+            return response
+
+
+@dataclass
+class RecordedRequest:
+    method: str
+    path: str
+    query: Optional[str] = ""
+    body: Optional[Dict] = None
+    allowed_status_codes: Optional[List[int]] = None
+
+
+class _EmptyResponse:
+    content = b"{}"
+
+
+class RecordingClient:
+    """
+    Stands in for Client to capture the request an endpoint builds without sending it.
+
+    The endpoint still returns an empty instance of its response type, which tells
+    the caller how to decode the response once it has sent the request itself.
+    """
+
+    def __init__(self):
+        self.recorded: Optional[RecordedRequest] = None
+
+    def request(self, method: str, path: str, query: Optional[str] = "", body: Optional[Dict] = None,
+                allowed_status_codes: Optional[List[int]] = None) -> _EmptyResponse:
+        self.recorded = RecordedRequest(method, path, query, body, allowed_status_codes)
+        return _EmptyResponse()
+
+
+def record_request(credentials: Credentials, module: str, method: str, request: Any) -> Tuple[RecordedRequest, type]:
+    """
+    Run an endpoint method against a RecordingClient.
+
+    Args:
+        credentials: Coinbase Prime API credentials
+        module: Endpoint module name, e.g. "list_orders"
+        method: Endpoint method name, e.g. "list_orders"
+        request: The endpoint's request dataclass
+
+    Returns:
+        The request the endpoint would send and its response type
+    """
+    recorder = RecordingClient()
+    endpoint_client = importlib.import_module(f"prime_sdk.{module}").PrimeClient(credentials, client=recorder)
+    response_type = type(getattr(endpoint_client, method)(request))
+    return recorder.recorded, response_type
@@ -15,7 +15,7 @@
 from dataclasses import dataclass, asdict
 
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from prime_sdk.credentials import Credentials
 
@@ -38,11 +38,11 @@ class CreateAddressBookEntryResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def create_address_book_entry(self, request: CreateAddressBookEntryRequest) -> CreateAddressBookEntryResponse:
         path = f"/portfolios/{request.portfolio_id}/address_book"
         body = {k: v for k, v in asdict(request).items() if v is not None}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return CreateAddressBookEntryResponse(**response.json())
+        return CreateAddressBookEntryResponse(**response_json(response))
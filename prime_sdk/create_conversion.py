@@ -15,7 +15,7 @@
 from dataclasses import dataclass, asdict
 
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 
@@ -44,11 +44,11 @@ class CreateConversionResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def create_conversion(self, request: CreateConversionRequest) -> CreateConversionResponse:
         path = f"/portfolios/{request.portfolio_id}/wallets/{request.wallet_id}/conversion"
         body = {k: v for k, v in asdict(request).items() if v is not None}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return CreateConversionResponse(**response.json())
+        return CreateConversionResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass, asdict
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 
 
@@ -34,11 +34,11 @@ class CreateNewLocateResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def create_new_locate(self, request: CreateNewLocateRequest) -> CreateNewLocateResponse:
         path = f"/portfolios/{request.portfolio_id}/locates"
         body = {k: v for k, v in asdict(request).items() if v is not None}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return CreateNewLocateResponse(**response.json())
+        return CreateNewLocateResponse(**response_json(response))
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass, asdict
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import AddressGroup
@@ -35,11 +35,11 @@ class CreateOnchainAddressBookEntryResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def create_onchain_address_book_entry(self, request: CreateOnchainAddressBookEntryRequest) -> CreateOnchainAddressBookEntryResponse:
         path = f"/portfolios/{request.portfolio_id}/onchain_address_group"
         body = {k: v for k, v in asdict(request).items() if v is not None}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return CreateOnchainAddressBookEntryResponse(**response.json())
+        return CreateOnchainAddressBookEntryResponse(**response_json(response))
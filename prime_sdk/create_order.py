@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass, asdict
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from prime_sdk.credentials import Credentials
 from prime_sdk.enums import OrderSide, OrderType, TimeInForce
@@ -50,11 +50,11 @@ class CreateOrderResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def create_order(self, request: CreateOrderRequest) -> CreateOrderResponse:
         path = f"/portfolios/{request.portfolio_id}/order"
         body = {k: v for k, v in asdict(request).items() if v is not None}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return CreateOrderResponse(**response.json())
+        return CreateOrderResponse(**response_json(response))
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass, asdict
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Blockchain
@@ -60,8 +60,8 @@ class CreateWithdrawalResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def create_withdrawal(self, request: CreateWithdrawalRequest) -> CreateWithdrawalResponse:
         path = f"/portfolios/{request.portfolio_id}/wallets/{request.wallet_id}/withdrawals"
@@ -75,4 +75,4 @@ class PrimeClient:
             body["blockchain_address"] = asdict(request.blockchain_address)
 
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return CreateWithdrawalResponse(**response.json())
+        return CreateWithdrawalResponse(**response_json(response))
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 import json
 
@@ -25,6 +25,11 @@ class Credentials:
     portfolio_id: str
     entity_id: str
     svc_account_id: str
+    signing_key_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Encoded once here rather than on every signature
+        self.signing_key_bytes = self.signing_key.encode()
 
     @staticmethod
     def from_json(data: str) -> 'Credentials':
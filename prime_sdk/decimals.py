@@ -0,0 +1,93 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Exact Decimal access to the string money fields of Prime models.
+
+Models with money fields expose a read-only <field>_decimal property for each
+of them:
+
+    fill.price_decimal * fill.filled_quantity_decimal
+
+Each read parses the string again, which costs about as much as a cache
+lookup would. Loops that revisit the same records should convert them once
+with decimal_columns(), which parses each distinct string in a list once.
+"""
+
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def parse_decimal(value: Optional[str]) -> Optional[Decimal]:
+    """Parse a money string to Decimal; None and empty strings become None."""
+    if value is None or value == "":
+        return None
+    return Decimal(value)
+
+
+def decimal_accessor(field: str) -> property:
+    """Return a read-only property giving the Decimal value of a string field, or None if it is empty."""
+    read = attrgetter(field)
+
+    def get(self) -> Optional[Decimal]:
+        value = read(self)
+        return Decimal(value) if value else None
+
+    get.__name__ = f"{field}_decimal"
+    return property(get, doc=f"{field} as a Decimal, or None if empty")
+
+
+def money(*fields: str):
+    """Class decorator adding a <field>_decimal accessor for each of the given string fields."""
+    def decorate(cls):
+        for field in fields:
+            setattr(cls, f"{field}_decimal", decimal_accessor(field))
+        cls.__money_fields__ = fields
+        return cls
+    return decorate
+
+
+def money_fields(model: type) -> Tuple[str, ...]:
+    """Return the money fields of a model class, or () if it declares none."""
+    return getattr(model, "__money_fields__", ())
+
+
+def decimal_columns(records: Iterable[Any],
+                    fields: Optional[Sequence[str]] = None) -> Dict[str, List[Optional[Decimal]]]:
+    """
+    Convert money fields of many records to Decimal columns.
+
+    Args:
+        records: Models (e.g. a ListPortfolioFillsResponse's fills) or parsed JSON objects
+        fields: Fields to convert; defaults to the money fields of the first record's model
+
+    Returns a list of Decimals (None for missing values) per field, in record order.
+    Each distinct string is parsed once per call, and equal strings share one Decimal.
+    """
+    records = list(records)
+    if fields is None:
+        fields = money_fields(type(records[0])) if records else ()
+    parsed: Dict[Any, Optional[Decimal]] = {}
+    columns = {}
+    for field in fields:
+        if records and isinstance(records[0], dict):
+            values = [record.get(field) for record in records]
+        else:
+            values = list(map(attrgetter(field), records))
+        for value in dict.fromkeys(values):
+            if value not in parsed:
+                parsed[value] = parse_decimal(value)
+        columns[field] = list(map(parsed.__getitem__, values))
+    return columns
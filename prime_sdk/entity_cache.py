@@ -0,0 +1,322 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Permanent cache of orders, transactions, allocations and activities in a terminal state.
+
+Once an order is filled, cancelled or expired, or a transaction, allocation or
+activity has completed or failed, it no longer changes. An EntityCache keeps
+the get_order, get_transaction, get_allocation_by_id and get_activity
+responses for such entities, keyed by entity id, portfolio and scope, and
+never expires them; responses for entities that can still change are returned
+but not stored. The clients pass their API access key as the scope, so clients
+with different credentials or portfolios can share a cache, or a store file,
+without being answered with entities their own requests might be refused.
+
+Entries are held in memory. With a store, they are also written to disk and
+read back on a memory miss, so they survive restarts:
+
+    cache = EntityCache(store=SqliteEntityStore("entities.db"))
+    client = PrimeClient(credentials, entity_cache=cache)
+"""
+
+import importlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, FrozenSet, Optional, Union
+
+from prime_sdk.timeouts import Deadline
+
+ORDER_TERMINAL_STATUSES = frozenset({"FILLED", "CANCELLED", "EXPIRED", "FAILED"})
+TRANSACTION_TERMINAL_STATUSES = frozenset({"TRANSACTION_DONE", "TRANSACTION_IMPORTED", "TRANSACTION_CANCELLED",
+                                           "TRANSACTION_REJECTED", "TRANSACTION_FAILED", "TRANSACTION_EXPIRED"})
+ALLOCATION_TERMINAL_STATUSES = frozenset({"ALLOCATION_STATUS_ALLOCATION_ALLOCATED",
+                                          "ALLOCATION_STATUS_ALLOCATION_REJECTED"})
+ACTIVITY_TERMINAL_STATUSES = frozenset({"ACTIVITY_STATUS_COMPLETED", "ACTIVITY_STATUS_CANCELLED",
+                                        "ACTIVITY_STATUS_EXPIRED", "ACTIVITY_STATUS_FAILED"})
+
+
+@dataclass(frozen=True)
+class EntityKind:
+    """How to request an entity by id from one get endpoint, and read its status from the response."""
+    endpoint: str
+    request_type: str
+    id_field: str
+    entity_field: str
+    terminal_statuses: FrozenSet[str]
+
+    def request(self, portfolio_id: str, entity_id: str) -> Any:
+        """Build the endpoint's request for one entity."""
+        request_type = getattr(importlib.import_module(f"prime_sdk.{self.endpoint}"), self.request_type)
+        return request_type(**{"portfolio_id": portfolio_id, self.id_field: entity_id})
+
+
+ENTITY_KINDS = {
+    "order": EntityKind("get_order", "GetOrderRequest", "order_id", "order", ORDER_TERMINAL_STATUSES),
+    "transaction": EntityKind("get_transaction", "GetTransactionRequest", "transaction_id", "transaction",
+                              TRANSACTION_TERMINAL_STATUSES),
+    "allocation": EntityKind("get_allocation_by_id", "GetAllocationByIdRequest", "allocation_id", "allocation",
+                             ALLOCATION_TERMINAL_STATUSES),
+    "activity": EntityKind("get_activity", "GetActivityRequest", "activity_id", "activity",
+                           ACTIVITY_TERMINAL_STATUSES),
+}
+
+
+def is_terminal(kind: EntityKind, response: Any) -> bool:
+    """Whether the entity in a get response has reached a status it never leaves."""
+    entity = getattr(response, kind.entity_field, None)
+    status = getattr(entity, "status", None)
+    if isinstance(status, Enum):
+        status = status.value
+    return status in kind.terminal_statuses
+
+
+@dataclass(frozen=True)
+class EntityCacheStats:
+    """Counters of an EntityCache; disk_hits are the hits that were read back from the store."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    not_terminal: int = 0
+
+
+class SqliteEntityStore:
+    """
+    Entity store in an SQLite database file; responses are pickled.
+
+    Reading a response unpickles it, so anyone who can write the database file
+    can run code in this process. Keep the file somewhere only the SDK's user
+    can write to.
+    """
+
+    def __init__(self, path: str):
+        import sqlite3
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS entities (key TEXT PRIMARY KEY, response BLOB NOT NULL)")
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._db.execute("SELECT response FROM entities WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        import pickle
+        return pickle.loads(row[0])
+
+    def put(self, key: str, response: Any) -> None:
+        import pickle
+        data = pickle.dumps(response, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO entities (key, response) VALUES (?, ?)", (key, data))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entities WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entities WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entities")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ShelveEntityStore:
+    """
+    Entity store in a shelve file, for environments without sqlite3.
+
+    shelve pickles its values, so as with SqliteEntityStore, anyone who can
+    write the file can run code in this process when it is read.
+    """
+
+    def __init__(self, path: str):
+        import pickle
+        import shelve
+        self._lock = threading.Lock()
+        self._shelf = shelve.open(path, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._shelf.get(key)
+
+    def put(self, key: str, response: Any) -> None:
+        with self._lock:
+            self._shelf[key] = response
+            self._shelf.sync()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._shelf.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._shelf.keys() if key.startswith(prefix)]:
+                del self._shelf[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shelf.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._shelf)
+
+    def close(self) -> None:
+        with self._lock:
+            self._shelf.close()
+
+
+class EntityCache:
+    """
+    Thread-safe, never-expiring cache of get responses for entities in a terminal state.
+
+    Pass one to PrimeClient or AsyncPrimeClient as entity_cache=; the get
+    endpoints of ENTITY_KINDS then answer from it when they can. Cached
+    responses are shared by every caller and must be treated as read-only.
+    """
+
+    def __init__(self, store: Any = None, max_entries: Optional[int] = None):
+        """
+        Args:
+            store: Optional SqliteEntityStore or ShelveEntityStore that keeps entries across restarts
+            max_entries: Optional cap on the entries held in memory; the least recently used are
+                dropped from memory only, and are read back from the store if there is one
+        """
+        self.store = store
+        self.max_entries = max_entries
+        self._kinds = {kind.endpoint: name for name, kind in ENTITY_KINDS.items()}
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._counts = dict.fromkeys(EntityCacheStats.__dataclass_fields__, 0)
+
+    @staticmethod
+    def key(kind: str, entity_id: str, scope: Optional[str] = None, portfolio_id: Optional[str] = None) -> str:
+        # The entity id comes first so that one entity can be dropped from every scope by prefix
+        return f"{kind}/{entity_id}/{scope or ''}/{portfolio_id or ''}"
+
+    def caches(self, endpoint: str) -> bool:
+        return endpoint in self._kinds
+
+    def get(self, kind: str, entity_id: str, scope: Optional[str] = None,
+            portfolio_id: Optional[str] = None) -> Optional[Any]:
+        """The cached response for an entity in a scope and portfolio, or None."""
+        key = self.key(kind, entity_id, scope, portfolio_id)
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+                self._counts["hits"] += 1
+                return response
+        response = self.store.get(key) if self.store is not None else None
+        with self._lock:
+            if response is None:
+                self._counts["misses"] += 1
+                return None
+            self._counts["hits"] += 1
+            self._counts["disk_hits"] += 1
+            self._remember(key, response)
+        return response
+
+    def put(self, kind: str, entity_id: str, response: Any, scope: Optional[str] = None,
+            portfolio_id: Optional[str] = None) -> bool:
+        """Cache a get response if its entity is in a terminal state; returns whether it was cached."""
+        if not is_terminal(ENTITY_KINDS[kind], response):
+            with self._lock:
+                self._counts["not_terminal"] += 1
+            return False
+        key = self.key(kind, entity_id, scope, portfolio_id)
+        if self.store is not None:
+            self.store.put(key, response)
+        with self._lock:
+            self._counts["stored"] += 1
+            self._remember(key, response)
+        return True
+
+    def invalidate(self, kind: Optional[str] = None, entity_id: Optional[str] = None) -> None:
+        """
+        Drop cached entities, from memory and the store: every one, those of a kind, or one entity.
+        An entity is dropped in every scope and portfolio it is cached under.
+        """
+        prefix = None if kind is None else f"{kind}/" if entity_id is None else f"{kind}/{entity_id}/"
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key.startswith(prefix)]:
+                    del self._entries[key]
+        if self.store is None:
+            return
+        if prefix is None:
+            self.store.clear()
+        else:
+            self.store.delete_prefix(prefix)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> EntityCacheStats:
+        with self._lock:
+            return EntityCacheStats(**self._counts)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(self._counts, 0)
+
+    def close(self) -> None:
+        """Close the store, if there is one."""
+        if self.store is not None:
+            self.store.close()
+
+    def fetch(self, endpoint: str, method: Callable[..., Any], request: Any,
+              deadline: Union[Deadline, float, None] = None, scope: Optional[str] = None) -> Any:
+        """Return the cached response to method(request), or call it and cache the response if terminal."""
+        kind = self._kinds[endpoint]
+        entity_id, portfolio_id = getattr(request, ENTITY_KINDS[kind].id_field), request.portfolio_id
+        response = self.get(kind, entity_id, scope, portfolio_id)
+        if response is None:
+            response = method(request, deadline)
+            self.put(kind, entity_id, response, scope, portfolio_id)
+        return response
+
+    async def afetch(self, endpoint: str, method: Callable[..., Awaitable[Any]], request: Any,
+                     deadline: Union[Deadline, float, None] = None, scope: Optional[str] = None) -> Any:
+        """Async variant of fetch for coroutine methods; a disk store is read and written in line."""
+        kind = self._kinds[endpoint]
+        entity_id, portfolio_id = getattr(request, ENTITY_KINDS[kind].id_field), request.portfolio_id
+        response = self.get(kind, entity_id, scope, portfolio_id)
+        if response is None:
+            response = await method(request, deadline)
+            self.put(kind, entity_id, response, scope, portfolio_id)
+        return response
+
+    def _remember(self, key: str, response: Any) -> None:
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
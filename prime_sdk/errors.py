@@ -0,0 +1,29 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+
+class PrimeAPIError(Exception):
+    """Raised when the Prime API answers with a status code the caller did not allow."""
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[str] = None):
+        super().__init__(f"Request failed with status {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call's deadline passes before it could complete."""
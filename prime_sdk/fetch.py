@@ -0,0 +1,142 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Concurrent lookup of many orders, transactions, allocations or activities by id.
+
+fetch_many drops duplicate ids, answers what it can from an EntityCache, and
+sends the get requests for the rest from a pool of `concurrency` workers.
+Every request waits for the client's rate limiter or, when the client has
+none, for a TokenBucket at Prime's documented rate. It returns one FetchResult
+per distinct id, in the order the ids were first given, and a failed lookup
+does not stop the others.
+"""
+
+import contextvars
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+from prime_sdk.entity_cache import ENTITY_KINDS, EntityCache, EntityKind
+from prime_sdk.rate_limit import TokenBucket, check_concurrency
+from prime_sdk.timeouts import Deadline, call_options
+
+DEFAULT_FETCH_CONCURRENCY = 16
+
+
+@dataclass
+class FetchResult:
+    """The outcome of looking up one id."""
+    id: str
+    response: Optional[Any] = None
+    error: Optional[Exception] = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def entity_kind(kind: str) -> EntityKind:
+    try:
+        return ENTITY_KINDS[kind]
+    except KeyError:
+        raise ValueError(f"unknown entity kind {kind!r}; expected one of {', '.join(ENTITY_KINDS)}") from None
+
+
+def _results(kind: str, ids: Iterable[str], cache: Optional[EntityCache], scope: Optional[str],
+             portfolio_id: str) -> Dict[str, FetchResult]:
+    results = {entity_id: FetchResult(entity_id) for entity_id in dict.fromkeys(ids)}
+    if cache is not None:
+        for result in results.values():
+            result.response = cache.get(kind, result.id, scope, portfolio_id)
+            result.cached = result.response is not None
+    return results
+
+
+def fetch_many(get: Callable[[Any], Any], kind: str, ids: Iterable[str], portfolio_id: str,
+               concurrency: int = DEFAULT_FETCH_CONCURRENCY, deadline: Union[Deadline, float, None] = None,
+               cache: Optional[EntityCache] = None, bucket: Optional[TokenBucket] = None,
+               scope: Optional[str] = None) -> Dict[str, FetchResult]:
+    """
+    Look up entities by id concurrently and return a FetchResult per distinct id.
+
+    Args:
+        get: The kind's endpoint method, e.g. client.get_order, without caching of its own
+        kind: "order", "transaction", "allocation" or "activity"
+        ids: Entity ids; duplicates are looked up once
+        portfolio_id: The portfolio the entities belong to
+        concurrency: Maximum number of requests in flight at once
+        deadline: Optional deadline, in seconds or as a Deadline, for the whole lookup; ids not
+            fetched by then fail with DeadlineExceededError
+        cache: Optional EntityCache to answer from first and to store terminal responses in
+        bucket: Optional TokenBucket every request waits on before it is sent; pass one when
+            get is not already rate limited
+        scope: The scope the cache's entries are kept under, as the clients pass their access key
+
+    A failed lookup is reported in its result's error rather than raised.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    check_concurrency(concurrency)
+    entity = entity_kind(kind)
+    results = _results(kind, ids, cache, scope, portfolio_id)
+    pending = [result for result in results.values() if not result.cached]
+    if not pending:
+        return results
+    deadline = Deadline.of(deadline)
+
+    def fetch(result: FetchResult) -> None:
+        try:
+            if bucket is not None:
+                bucket.acquire(deadline=deadline)
+            with call_options(deadline=deadline):
+                result.response = get(entity.request(portfolio_id, result.id))
+        except Exception as e:
+            result.error = e
+        else:
+            if cache is not None:
+                cache.put(kind, result.id, result.response, scope, portfolio_id)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(pending)), thread_name_prefix="prime-sdk-fetch") as pool:
+        for result in pending:
+            pool.submit(contextvars.copy_context().run, fetch, result)
+    return results
+
+
+async def afetch_many(get: Callable[[Any], Awaitable[Any]], kind: str, ids: Iterable[str], portfolio_id: str,
+                      concurrency: int = DEFAULT_FETCH_CONCURRENCY, deadline: Union[Deadline, float, None] = None,
+                      cache: Optional[EntityCache] = None, bucket: Optional[TokenBucket] = None,
+                      scope: Optional[str] = None) -> Dict[str, FetchResult]:
+    """Async variant of fetch_many for AsyncPrimeClient methods; lookups are sent by concurrent tasks."""
+    import asyncio
+    check_concurrency(concurrency)
+    entity = entity_kind(kind)
+    results = _results(kind, ids, cache, scope, portfolio_id)
+    deadline = Deadline.of(deadline)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def fetch(result: FetchResult) -> None:
+        async with slots:
+            try:
+                if bucket is not None:
+                    await bucket.acquire_async(deadline=deadline)
+                with call_options(deadline=deadline):
+                    result.response = await get(entity.request(portfolio_id, result.id))
+            except Exception as e:
+                result.error = e
+            else:
+                if cache is not None:
+                    cache.put(kind, result.id, result.response, scope, portfolio_id)
+
+    await asyncio.gather(*(fetch(result) for result in results.values() if not result.cached))
+    return results
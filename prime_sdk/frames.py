@@ -0,0 +1,229 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar containers for fills and orders, backed by NumPy arrays.
+
+A frame converts each column once, in bulk: numeric strings become float64
+arrays (or exact int64 arrays scaled by 10**scale), timestamps become
+datetime64[us] and low-cardinality fields such as side and product_id are
+stored as integer codes into a sorted array of categories. Aggregations then
+run vectorized over whole columns:
+
+    frame = FillFrame.from_records(client.iter_list_portfolio_fills(request))
+    frame.notional_by_product()   # {"BTC-USD": 1523412.5, "ETH-USD": 80211.0}
+
+NumPy is optional: pip install prime-sdk-py[frames]
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from prime_sdk.sharding import naive_utc_text
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("frames require numpy: pip install prime-sdk-py[frames]")
+
+
+def _values(records: List[Any], name: str) -> List[Any]:
+    if records and isinstance(records[0], dict):
+        return [record.get(name) for record in records]
+    try:
+        return list(map(attrgetter(name), records))
+    except AttributeError:
+        return [getattr(record, name, None) for record in records]
+
+
+def _float_or_nan(value: Optional[str]) -> float:
+    return float(value) if value else float("nan")
+
+
+def parse_float_column(values: List[Optional[str]]) -> 'np.ndarray':
+    """Convert decimal strings to float64; missing or empty values become NaN."""
+    try:
+        return np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+    except (TypeError, ValueError):
+        return np.fromiter(map(_float_or_nan, values), dtype=np.float64, count=len(values))
+
+
+def parse_scaled_column(values: List[Optional[str]], scale: int) -> 'np.ndarray':
+    """
+    Convert decimal strings exactly to int64 holding value * 10**scale.
+
+    Missing or empty values become 0. Raises ValueError if a value has more
+    than `scale` significant decimal places or does not fit in int64.
+    """
+    text = np.array([value if value else "0" for value in values], dtype=str)
+    if not len(text):
+        return np.zeros(0, dtype=np.int64)
+    negative = np.char.startswith(text, "-")
+    parts = np.char.partition(np.char.lstrip(text, "-+"), ".")
+    whole, fraction = parts[:, 0], np.char.rstrip(parts[:, 2], "0")
+    if (np.char.str_len(fraction) > scale).any():
+        raise ValueError(f"value has more than {scale} decimal places")
+    if (np.char.str_len(whole) > 18 - scale).any():
+        raise ValueError(f"value does not fit in int64 at scale {scale}")
+    result = np.where(whole == "", "0", whole).astype(np.int64) * 10 ** scale
+    if scale:
+        result += np.where(fraction == "", "0", np.char.ljust(fraction, scale, "0")).astype(np.int64)
+    result[negative] *= -1
+    return result
+
+
+def parse_timestamp_column(values: List[Optional[str]]) -> 'np.ndarray':
+    """
+    Convert ISO-8601 timestamps (e.g. 2025-01-31T12:00:00.123Z) to UTC datetime64[us]; missing values are NaT.
+
+    UTC offsets are applied and fractions beyond microseconds are truncated.
+    """
+    return np.array([naive_utc_text(value) or "NaT" for value in values], dtype="datetime64[us]")
+
+
+def encode_categories(values: List[Optional[str]]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Return (categories, codes) with categories sorted and codes indexing into them; missing values are ""."""
+    distinct = dict.fromkeys(values)
+    if None in distinct:
+        values = [value or "" for value in values]
+        distinct = dict.fromkeys(values)
+    index = {value: code for code, value in enumerate(distinct)}
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int32, count=len(values))
+    labels = np.array(list(index), dtype=str)
+    order = np.argsort(labels, kind="stable")
+    remap = np.empty(len(labels), dtype=np.int32)
+    remap[order] = np.arange(len(labels), dtype=np.int32)
+    return labels[order], remap[codes]
+
+
+class _Frame:
+    """Base class for columnar record containers; subclasses declare their columns."""
+
+    NUMERIC: Tuple[str, ...] = ()
+    TIMESTAMPS: Tuple[str, ...] = ()
+    CATEGORICAL: Tuple[str, ...] = ()
+    TEXT: Tuple[str, ...] = ()
+    ITEMS_FIELD = ""
+
+    def __init__(self, columns: Dict[str, 'np.ndarray'], categories: Dict[str, 'np.ndarray'],
+                 scale: Optional[int] = None):
+        """
+        Args:
+            columns: Arrays of equal length keyed by field name; categorical fields hold codes
+            categories: Sorted labels for each categorical field
+            scale: Decimal scale of integer numeric columns, or None if they are float64
+        """
+        self.columns = columns
+        self.categories = categories
+        self.scale = scale
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any], scale: Optional[int] = None) -> '_Frame':
+        """
+        Build a frame from model instances or parsed JSON objects.
+
+        Args:
+            records: Models (e.g. Fill) or dicts, such as a response's list or an iter_* generator
+            scale: If given, numeric columns are exact int64 values scaled by 10**scale instead of float64
+        """
+        _require_numpy()
+        records = list(records)
+        columns = {}
+        categories = {}
+        for name in cls.NUMERIC:
+            values = _values(records, name)
+            columns[name] = parse_float_column(values) if scale is None else parse_scaled_column(values, scale)
+        for name in cls.TIMESTAMPS:
+            columns[name] = parse_timestamp_column(_values(records, name))
+        for name in cls.CATEGORICAL:
+            categories[name], columns[name] = encode_categories(_values(records, name))
+        for name in cls.TEXT:
+            columns[name] = np.array(_values(records, name), dtype=object)
+        return cls(columns, categories, scale)
+
+    @classmethod
+    def from_response(cls, response: Any, scale: Optional[int] = None) -> '_Frame':
+        """Build a frame from a list response, e.g. a ListPortfolioFillsResponse."""
+        return cls.from_records(getattr(response, cls.ITEMS_FIELD) or [], scale)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> 'np.ndarray':
+        """Return a column; categorical columns are returned as labels."""
+        if name in self.categories:
+            return self.categories[name][self.columns[name]]
+        return self.columns[name]
+
+    def codes(self, name: str) -> 'np.ndarray':
+        """Return the integer codes of a categorical column, indexing into self.categories[name]."""
+        return self.columns[name]
+
+    def sum_by(self, value: str, by: str) -> Dict[str, Any]:
+        """
+        Sum a numeric column per category of a categorical column, skipping missing values.
+
+        Sums of scaled integer columns are exact and stay scaled.
+        """
+        codes = self.columns[by]
+        values = self.columns[value]
+        size = len(self.categories[by])
+        if values.dtype.kind == "f":
+            present = ~np.isnan(values)
+            totals = np.bincount(codes[present], weights=values[present], minlength=size)
+        else:
+            totals = np.zeros(size, dtype=np.int64)
+            np.add.at(totals, codes, values)
+        return dict(zip(self.categories[by].tolist(), totals.tolist()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} rows)"
+
+
+class FillFrame(_Frame):
+    """Columnar fills from list_portfolio_fills or list_order_fills."""
+
+    NUMERIC = ("filled_quantity", "filled_value", "price", "commission", "venue_fees", "ces_commission")
+    TIMESTAMPS = ("time",)
+    CATEGORICAL = ("product_id", "client_product_id", "side", "venue")
+    TEXT = ("id", "order_id")
+    ITEMS_FIELD = "fills"
+
+    def notional_by_product(self) -> Dict[str, Any]:
+        """Total filled_value per product_id."""
+        return self.sum_by("filled_value", "product_id")
+
+    def quantity_by_product(self) -> Dict[str, Any]:
+        """Total filled_quantity per product_id."""
+        return self.sum_by("filled_quantity", "product_id")
+
+
+class OrderFrame(_Frame):
+    """Columnar orders from list_orders."""
+
+    NUMERIC = ("base_quantity", "quote_value", "limit_price", "filled_quantity", "filled_value",
+               "average_filled_price", "commission", "exchange_fee", "stop_price", "net_average_filled_price")
+    TIMESTAMPS = ("created_at", "start_time", "expiry_time")
+    CATEGORICAL = ("product_id", "client_product_id", "side", "type", "status", "time_in_force")
+    TEXT = ("id", "user_id", "portfolio_id", "client_order_id")
+    ITEMS_FIELD = "orders"
+
+    def notional_by_product(self) -> Dict[str, Any]:
+        """Total filled_value per product_id."""
+        return self.sum_by("filled_value", "product_id")
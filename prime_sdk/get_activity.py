@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Activity
@@ -33,10 +33,10 @@ class GetActivityResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def get_activity(self, request: GetActivityRequest) -> GetActivityResponse:
         path = f"/portfolios/{request.portfolio_id}/activities/{request.activity_id}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetActivityResponse(**response.json())
+        return GetActivityResponse(**response_json(response))
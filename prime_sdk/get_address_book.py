@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_query_param, append_pagination_params, Pagination
 from prime_sdk.model import Address
@@ -36,8 +36,8 @@ class GetAddressBookResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def get_address_book(self, request: GetAddressBookRequest) -> GetAddressBookResponse:
         path = f"/portfolios/{request.portfolio_id}/address_book"
@@ -47,4 +47,4 @@ class PrimeClient:
         query_params = append_pagination_params(query_params, request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetAddressBookResponse(**response.json())
+        return GetAddressBookResponse(**response_json(response))
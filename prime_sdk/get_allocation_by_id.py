@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import List, Optional
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Allocation
 
@@ -33,10 +33,10 @@ class GetAllocationByIdResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def get_allocation_by_id(self, request: GetAllocationByIdRequest) -> GetAllocationByIdResponse:
         path = f"/portfolios/{request.portfolio_id}/allocations/{request.allocation_id}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetAllocationByIdResponse(**response.json())
+        return GetAllocationByIdResponse(**response_json(response))
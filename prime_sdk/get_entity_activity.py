@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Activity
@@ -32,10 +32,10 @@ class GetEntityActivityResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def get_entity_activity_by_activity_id(self, request: GetEntityActivityRequest) -> GetEntityActivityResponse:
         path = f"/activities/{request.activity_id}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetEntityActivityResponse(**response.json())
+        return GetEntityActivityResponse(**response_json(response))
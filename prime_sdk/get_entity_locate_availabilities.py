@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import LocateAvailability
 from prime_sdk.utils import append_query_param
@@ -34,11 +34,11 @@ class GetEntityLocateAvailabilitiesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def get_entity_locate_availabilities(self, request: GetEntityLocateAvailabilitiesRequest) -> GetEntityLocateAvailabilitiesResponse:
         path = f"/entities/{request.entity_id}/locates_availability"
         query_params = append_query_param("", "locate_date", request.locate_date)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetEntityLocateAvailabilitiesResponse(**response.json())
+        return GetEntityLocateAvailabilitiesResponse(**response_json(response))
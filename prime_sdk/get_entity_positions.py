@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import append_query_param
@@ -36,11 +36,11 @@ class GetEntityPositionsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def get_entity_positions(self, request: GetEntityPositionsRequest) -> GetEntityPositionsResponse:
         path = f"/entities/{request.entity_id}/futures/positions"
         query_params = append_query_param("", 'product_id', request.product_id)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetEntityPositionsResponse(**response.json())
+        return GetEntityPositionsResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import MarginInformation
 
@@ -32,10 +32,10 @@ class GetMarginInformationResponse(BaseResponse):
     
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def get_margin_information(self, request: GetMarginInformationRequest) -> GetMarginInformationResponse:
         path = f"/entities/{request.entity_id}/margin"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetMarginInformationResponse(**response.json())
+        return GetMarginInformationResponse(**response_json(response))
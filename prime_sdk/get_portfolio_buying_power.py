@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import BuyingPower
 from prime_sdk.utils import append_query_param
@@ -35,12 +35,12 @@ class GetBuyingPowerResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def get_buying_power(self, request: GetBuyingPowerRequest) -> GetBuyingPowerResponse:
         path = f"/portfolios/{request.portfolio_id}/buying_power"
         query_params = append_query_param("", "base_currency", request.base_currency)
         query_params = append_query_param(query_params, "quote_currency", request.quote_currency)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetBuyingPowerResponse(**response.json())
+        return GetBuyingPowerResponse(**response_json(response))
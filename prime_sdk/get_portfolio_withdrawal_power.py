@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import WithdrawalPower
 from prime_sdk.utils import append_query_param
@@ -34,11 +34,11 @@ class GetPortfolioWithdrawalPowerResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def get_portfolio_withdrawal_power(self, request: GetPortfolioWithdrawalPowerRequest) -> GetPortfolioWithdrawalPowerResponse:
         path = f"/portfolios/{request.portfolio_id}/withdrawal_power"
         query_params = append_query_param("", "symbol", request.symbol)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetPortfolioWithdrawalPowerResponse(**response.json())
+        return GetPortfolioWithdrawalPowerResponse(**response_json(response))
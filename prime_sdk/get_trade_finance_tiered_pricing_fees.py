@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Fee
 from prime_sdk.utils import append_query_param
@@ -34,11 +34,11 @@ class GetTradeFinanceTieredPricingFeesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def get_trade_finance_tiered_pricing_fees(self, request: GetTradeFinanceTieredPricingFeesRequest) -> GetTradeFinanceTieredPricingFeesResponse:
         path = f"/portfolios/{request.portfolio_id}/tf_tiered_fees"
         query_params = append_query_param("", "effective_at", request.effective_at)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetTradeFinanceTieredPricingFeesResponse(**response.json())
+        return GetTradeFinanceTieredPricingFeesResponse(**response_json(response))
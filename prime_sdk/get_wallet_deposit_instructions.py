@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import append_query_param
@@ -36,11 +36,11 @@ class GetWalletDepositInstructionsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def get_wallet_deposit_instructions(self, request: GetWalletDepositInstructionsRequest) -> GetWalletDepositInstructionsResponse:
         path = f"/portfolios/{request.portfolio_id}/wallets/{request.wallet_id}/deposit_instructions"
         query_params = append_query_param("", 'deposit_type', request.deposit_type)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetWalletDepositInstructionsResponse(**response.json())
+        return GetWalletDepositInstructionsResponse(**response_json(response))
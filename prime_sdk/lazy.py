@@ -0,0 +1,177 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazy decoding of response models.
+
+When enabled, list fields of a response keep the parsed JSON objects and
+decode each element on first access, and model objects decode each field on
+first access. Callers that read a few fields of wide records such as Order or
+MarginSummary skip building everything else:
+
+    with lazy_decoding():
+        orders = client.list_orders(ListOrdersRequest(portfolio_id="..."))
+    statuses = [order.status for order in orders.orders]
+
+Lazy records are instances of the model class (isinstance(order, Order) holds)
+and compare, print and serialize like eagerly decoded ones. As when decoding
+eagerly, objects nested inside a record stay dicts unless full_depth_decoding()
+is also on, in which case they are lazy records themselves. Because fields are
+only looked at when read, a record missing a required field raises
+AttributeError on access rather than TypeError when the response is built.
+"""
+
+import dataclasses
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+_lazy_decoding = ContextVar("prime_sdk_lazy_decoding", default=False)
+
+
+def lazy_decoding_enabled() -> bool:
+    """Return whether responses built in the current context are decoded lazily."""
+    return _lazy_decoding.get()
+
+
+@contextmanager
+def lazy_decoding(enabled: bool = True) -> Iterator[None]:
+    """Decode responses built inside the block lazily (or eagerly, with enabled=False)."""
+    token = _lazy_decoding.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy_decoding.reset(token)
+
+
+class LazyList(list):
+    """
+    A list of parsed JSON objects whose elements are decoded on first access.
+
+    Indexing and iteration decode elements one at a time and keep the result in
+    place; every other operation that reads elements decodes them all first, so
+    the list behaves like the eagerly decoded one. Copies and pickles are plain
+    lists.
+    """
+
+    __slots__ = ("_decode",)
+
+    def __init__(self, iterable: Iterable[Any] = (), decode: Optional[Callable[[Any], Any]] = None):
+        super().__init__(iterable)
+        self._decode = decode
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = list.__getitem__(self, index)
+        if self._decode is not None and type(item) is dict:
+            item = self._decode(item)
+            list.__setitem__(self, index, item)
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def _materialize(self) -> None:
+        if self._decode is not None:
+            for index in range(len(self)):
+                self[index]
+            self._decode = None
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
+def _materializing(name: str) -> Callable:
+    method = getattr(list, name)
+
+    def materialize_first(self, *args, **kwargs):
+        self._materialize()
+        for arg in args:
+            # list's C methods read the other operand's raw items too, e.g. in lazy == lazy
+            if isinstance(arg, LazyList):
+                arg._materialize()
+        return method(self, *args, **kwargs)
+
+    materialize_first.__name__ = name
+    return materialize_first
+
+
+for _name in ("__contains__", "__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__add__", "__mul__",
+              "__rmul__", "__reversed__", "__repr__", "copy", "count", "index", "pop", "remove", "sort"):
+    setattr(LazyList, _name, _materializing(_name))
+
+
+class _LazyField:
+    """Decodes one model field from the record's JSON object on first read and caches the result."""
+
+    __slots__ = ("name", "convert", "default")
+
+    def __init__(self, name: str, convert: Callable[[Any], Any], default: Any):
+        self.name = name
+        self.convert = convert
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        raw = instance.__dict__["_raw"]
+        if self.name in raw:
+            value = raw[self.name]
+            if value is not None and self.convert is not None:
+                value = self.convert(value)
+        elif self.default is not dataclasses.MISSING:
+            value = self.default
+        else:
+            raise AttributeError(f"{type(instance).__name__} record has no {self.name!r}")
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _rebuild(model: type, values: Dict[str, Any]) -> Any:
+    return model(**values)
+
+
+def lazy_model(model: type, converters: Dict[str, Callable[[Any], Any]]) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Return a function that wraps a JSON object as a lazily decoded instance of model.
+
+    converters maps field names to the converter applied to their raw values;
+    fields without one are returned as parsed.
+    """
+    names = [f.name for f in dataclasses.fields(model)]
+
+    def __eq__(self, other):
+        if isinstance(other, model):
+            return all(getattr(self, name) == getattr(other, name) for name in names)
+        return NotImplemented
+
+    def __reduce__(self):
+        return _rebuild, (model, {name: getattr(self, name) for name in names})
+
+    namespace = {f.name: _LazyField(f.name, converters.get(f.name), f.default) for f in dataclasses.fields(model)}
+    namespace["__eq__"] = __eq__
+    namespace["__reduce__"] = __reduce__
+    namespace["__module__"] = model.__module__
+    lazy_class = type(model.__name__, (model,), namespace)
+    lazy_class.__qualname__ = model.__qualname__
+    new = object.__new__
+
+    def wrap(raw: Dict[str, Any]) -> Any:
+        instance = new(lazy_class)
+        instance.__dict__["_raw"] = raw
+        return instance
+
+    return wrap
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from datetime import datetime
 from prime_sdk.credentials import Credentials
@@ -41,8 +41,8 @@ class ListActivitiesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_activities(self, request: ListActivitiesRequest) -> ListActivitiesResponse:
         path = f"/portfolios/{request.portfolio_id}/activities"
@@ -64,4 +64,4 @@ class PrimeClient:
 
         query_params = append_pagination_params(query_params, request.pagination)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListActivitiesResponse(**response.json())
+        return ListActivitiesResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Position
 from prime_sdk.utils import PaginationParams, Pagination, append_query_param, append_pagination_params
@@ -35,11 +35,11 @@ class ListAggregateEntityPositionsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_aggregate_entity_positions(self, request: ListAggregateEntityPositionsRequest) -> ListAggregateEntityPositionsResponse:
         path = f"/entities/{request.entity_id}/aggregate_positions"
         query_params = append_pagination_params(query_params, request.pagination)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListAggregateEntityPositionsResponse(**response.json())
+        return ListAggregateEntityPositionsResponse(**response_json(response))
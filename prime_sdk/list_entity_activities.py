@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from datetime import datetime
 from prime_sdk.credentials import Credentials
@@ -43,8 +43,8 @@ class ListEntityActivitiesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_entity_activities(self, request: ListEntityActivitiesRequest) -> ListEntityActivitiesResponse:
         path = f"/entities/{request.entity_id}/activities"
@@ -68,4 +68,4 @@ class PrimeClient:
         query_params = append_pagination_params(query_params, request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListEntityActivitiesResponse(**response.json())
+        return ListEntityActivitiesResponse(**response_json(response))
@@ -15,10 +15,10 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import EntityBalance
-from prime_sdk.utils import append_query_param, Pagination, PaginationParams
+from prime_sdk.utils import append_query_param, append_pagination_params, Pagination, PaginationParams
 from prime_sdk.enums import AggregationType
 
 
@@ -38,13 +38,14 @@ class ListEntityBalancesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_entity_balances(self, request: ListEntityBalancesRequest) -> ListEntityBalancesResponse:
         path = f"/entities/{request.entity_id}/balances"
         query_params = append_query_param("", "symbols", request.symbols)
-        query_params = append_query_param(query_params, "balance_type", request.balance_type)
+        query_params = append_query_param(query_params, "aggregation_type", request.aggregation_type)
+        query_params = append_pagination_params(query_params, request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListEntityBalancesResponse(**response.json())
+        return ListEntityBalancesResponse(**response_json(response))
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_pagination_params
@@ -34,8 +34,8 @@ class ListEntityPaymentMethodsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_entity_payment_methods(self, request: ListEntityPaymentMethodsRequest) -> ListEntityPaymentMethodsResponse:
         path = f"/entities/{request.entity_id}/payment-methods"
@@ -43,4 +43,4 @@ class PrimeClient:
         query_params = append_pagination_params("", request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListEntityPaymentMethodsResponse(**response.json())
+        return ListEntityPaymentMethodsResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Locate
 from prime_sdk.utils import append_query_param
@@ -35,12 +35,12 @@ class ListExistingLocatesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_existing_locates(self, request: ListExistingLocatesRequest) -> ListExistingLocatesResponse:
         path = f"/portfolios/{request.portfolio_id}/locates"
         query_params = append_query_param("", "locate_ids", request.locate_ids)
         query_params = append_query_param(query_params, "locate_date", request.locate_date)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListExistingLocatesResponse(**response.json())
+        return ListExistingLocatesResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import Accrual
 from prime_sdk.utils import append_query_param
@@ -37,8 +37,8 @@ class ListInterestAccrualsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_interest_accruals(self, request: ListInterestAccrualsRequest) -> ListInterestAccrualsResponse:
         path = f"/entities/{request.entity_id}/accruals"
@@ -46,4 +46,4 @@ class PrimeClient:
         query_params = append_query_param(query_params, "start_date", request.start_date)
         query_params = append_query_param(query_params, "end_date", request.end_date)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListInterestAccrualsResponse(**response.json())
+        return ListInterestAccrualsResponse(**response_json(response))
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_query_param, append_pagination_params
@@ -37,8 +37,8 @@ class ListInvoicesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_invoices(self, request: ListInvoicesRequest) -> ListInvoicesResponse:
         path = f"/entities/{request.entity_id}/invoices"
@@ -47,4 +47,4 @@ class PrimeClient:
         query_params = append_query_param(query_params, 'billing_month', request.billing_month)
         query_params = append_pagination_params(query_params, request.pagination)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListInvoicesResponse(**response.json())
+        return ListInvoicesResponse(**response_json(response))
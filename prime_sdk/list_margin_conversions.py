@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import append_query_param
 from prime_sdk.model import Conversion
@@ -35,12 +35,12 @@ class ListMarginConversionsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_margin_conversions(self, request: ListMarginConversionsRequest) -> ListMarginConversionsResponse:
         path = f"/portfolios/{request.portfolio_id}/margin_conversions"
         query_params = append_query_param("", "start_date", request.start_date)
         query_params = append_query_param(query_params, "end_date", request.end_date)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListMarginConversionsResponse(**response.json())
+        return ListMarginConversionsResponse(**response_json(response))
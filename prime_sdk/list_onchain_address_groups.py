@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 from prime_sdk.model import AddressGroup
@@ -32,10 +32,10 @@ class ListOnchainAddressGroupsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def list_onchain_address_groups(self, request: ListOnchainAddressGroupsRequest) -> ListOnchainAddressGroupsResponse:
         path = f"/portfolios/{request.portfolio_id}/onchain_address_groups"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return ListOnchainAddressGroupsResponse(**response.json())
\ No newline at end of file
+        return ListOnchainAddressGroupsResponse(**response_json(response))
\ No newline at end of file
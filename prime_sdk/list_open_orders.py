@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from datetime import datetime
 from prime_sdk.credentials import Credentials
@@ -41,8 +41,8 @@ class ListOpenOrdersResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_open_orders(self, request: ListOpenOrdersRequest) -> ListOpenOrdersResponse:
         path = f"/portfolios/{request.portfolio_id}/open_orders"
@@ -63,4 +63,4 @@ class PrimeClient:
                 request.end_date.isoformat() + 'Z')
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListOpenOrdersResponse(**response.json())
+        return ListOpenOrdersResponse(**response_json(response))
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_pagination_params, Pagination
 from typing import Optional, List
@@ -36,8 +36,8 @@ class ListOrderFillsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_order_fills(self, request: ListOrderFillsRequest) -> ListOrderFillsResponse:
         path = f"/portfolios/{request.portfolio_id}/orders/{request.order_id}/fills"
@@ -45,4 +45,4 @@ class PrimeClient:
         query_params = append_pagination_params("", request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListOrderFillsResponse(**response.json())
+        return ListOrderFillsResponse(**response_json(response))
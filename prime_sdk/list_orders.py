@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from datetime import datetime
 
@@ -43,8 +43,8 @@ class ListOrdersResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_orders(self, request: ListOrdersRequest) -> ListOrdersResponse:
         path = f"/portfolios/{request.portfolio_id}/orders"
@@ -62,4 +62,4 @@ class PrimeClient:
         query_params = append_pagination_params(query_params, request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListOrdersResponse(**response.json())
+        return ListOrdersResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_pagination_params, append_query_param, Pagination
 from typing import Optional, List
@@ -38,8 +38,8 @@ class ListPortfolioFillsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_portfolio_fills(self, request: ListPortfolioFillsRequest) -> ListPortfolioFillsResponse:
         path = f"/portfolios/{request.portfolio_id}/fills"
@@ -52,4 +52,4 @@ class PrimeClient:
         query_params = append_pagination_params(query_params, request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListPortfolioFillsResponse(**response.json())
+        return ListPortfolioFillsResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_pagination_params, Pagination
 from prime_sdk.model import PortfolioUser
@@ -35,8 +35,8 @@ class ListPortfolioUsersResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_portfolio_users(self, request: ListPortfolioUsersRequest) -> ListPortfolioUsersResponse:
         path = f"/portfolios/{request.portfolio_id}/users"
@@ -44,4 +44,4 @@ class PrimeClient:
         query_params = append_pagination_params("", request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListPortfolioUsersResponse(**response.json())
+        return ListPortfolioUsersResponse(**response_json(response))
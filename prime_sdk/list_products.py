@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_pagination_params, Pagination
 from prime_sdk.model import Product
@@ -34,12 +34,12 @@ class ListProductsResponse(BaseResponse):
     pagination: Pagination = None
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_products(self, request: ListProductsRequest) -> ListProductsResponse:
         path = f"/portfolios/{request.portfolio_id}/products"
 
         query_params = append_pagination_params("", request.pagination)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListProductsResponse(**response.json())
+        return ListProductsResponse(**response_json(response))
@@ -15,7 +15,7 @@
 from dataclasses import dataclass
 
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import Optional, List
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_query_param, append_pagination_params, Pagination
@@ -38,8 +38,8 @@ class ListWalletAddressesResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_wallet_addresses(self, request: ListWalletAddressesRequest) -> ListWalletAddressesResponse:
         path = f"/portfolios/{request.portfolio_id}/wallets/{request.wallet_id}/addresses"
@@ -48,4 +48,4 @@ class PrimeClient:
         query_params = append_pagination_params(query_params, request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListWalletAddressesResponse(**response.json())
+        return ListWalletAddressesResponse(**response_json(response))
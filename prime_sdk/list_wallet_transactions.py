@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from typing import Optional, List
 from datetime import datetime
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from prime_sdk.credentials import Credentials
 from prime_sdk.utils import PaginationParams, append_query_param, append_pagination_params, Pagination
 from prime_sdk.model import Transaction
@@ -40,8 +40,8 @@ class ListWalletTransactionsResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
 
     def list_wallet_transactions(
             self,
@@ -58,4 +58,4 @@ class PrimeClient:
         query_params = append_pagination_params(query_params, request.pagination)
 
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListWalletTransactionsResponse(**response.json())
+        return ListWalletTransactionsResponse(**response_json(response))
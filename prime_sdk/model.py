@@ -12,11 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import List
+from prime_sdk.decimals import money
 from prime_sdk.enums import NetworkType
 
 
+def _slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ so instances carry no per-instance __dict__.
+    A __weakref__ slot is kept so instances can still be weakly referenced.
+
+    Used for the record types returned in bulk by list endpoints. Equivalent to
+    dataclass(slots=True), which needs Python 3.10.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names + ('__weakref__',)
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
 @dataclass
 class Address:
     name: str
@@ -120,6 +138,7 @@ class UserAction:
     timestamp: str
 
 
+@_slotted
 @dataclass
 class Activity:
     id: str
@@ -230,6 +249,9 @@ class OrderEditHistory:
     accept_time: str
 
 
+@_slotted
+@money("base_quantity", "quote_value", "limit_price", "filled_quantity", "filled_value", "average_filled_price",
+       "commission", "exchange_fee", "stop_price", "net_average_filled_price", "display_size")
 @dataclass
 class Order:
     id: str
@@ -360,6 +382,8 @@ class OnchainDetails:
     signing_status: str
 
 
+@_slotted
+@money("amount", "network_fees", "fees")
 @dataclass
 class Transaction:
     id: str
@@ -388,6 +412,10 @@ class Transaction:
     network_info: Network
 
 
+@_slotted
+@money("amount", "holds", "bonded_amount", "reserved_amount", "unbonding_amount", "unvested_amount",
+       "pending_rewards_amount", "past_rewards_amount", "bondable_amount", "withdrawable_amount", "fiat_amount",
+       "unbondable_amount")
 @dataclass
 class Balance:
     symbol: str
@@ -484,6 +512,8 @@ class Invoices:
     invoice_items: List[InvoiceItem]
 
 
+@_slotted
+@money("filled_quantity", "filled_value", "price", "commission", "venue_fees", "ces_commission")
 @dataclass
 class Fill:
     id: str
@@ -698,6 +728,8 @@ class Conversion:
     portfolio_id: str
 
 
+@money("interest_rate", "nominal_accrual", "notional_accrual", "conversion_rate", "loan_amount", "benchmark_rate",
+       "spread", "loan_amount_notional", "nominal_open_borrow_sod", "notional_open_bnorrow_sod")
 @dataclass
 class Accrual:
     accrual_id: str
@@ -0,0 +1,231 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Iteration over cursor-paginated list endpoints.
+
+The helpers call a list endpoint repeatedly, passing each response's
+pagination.next_cursor back in the request's PaginationParams until has_next
+is false, and yield pages or items one at a time. Only the current page is held
+in memory, plus up to `prefetch` pages fetched ahead of the consumer.
+
+Because each request needs the previous page's cursor, pages are always fetched
+one after another. Prefetching moves that loop onto a background thread (or an
+asyncio task) feeding a bounded queue, so page N+1 is in flight while the caller
+processes page N and a long export is bound by API throughput rather than by
+request latency plus processing time.
+"""
+
+import contextvars
+import threading
+from dataclasses import replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Union
+
+from prime_sdk.timeouts import Deadline, call_options
+from prime_sdk.utils import PaginationParams
+
+
+def _first_pagination(request: Any, page_size: Optional[int]) -> PaginationParams:
+    pagination = request.pagination if request.pagination else PaginationParams()
+    if page_size:
+        pagination = replace(pagination, limit=str(page_size))
+    return pagination
+
+
+def _next_cursor(page: Any) -> Optional[str]:
+    pagination = getattr(page, "pagination", None)
+    if not pagination or not pagination.has_next or not pagination.next_cursor:
+        return None
+    return pagination.next_cursor
+
+
+_DONE = object()
+_PUT_POLL_INTERVAL = 0.1
+
+
+def _prefetched(pages: Iterator[Any], depth: int) -> Iterator[Any]:
+    """Drain pages on a background thread, keeping up to depth pages buffered ahead."""
+    import queue
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(entry) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=_PUT_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((None, e))
+        finally:
+            pages.close()
+
+    context = contextvars.copy_context()
+    threading.Thread(target=context.run, args=(produce,), name="prime-sdk-prefetch", daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield page
+    finally:
+        stopped.set()
+
+
+async def _aprefetched(pages: AsyncIterator[Any], depth: int) -> AsyncIterator[Any]:
+    """Drain pages on a background task, keeping up to depth pages buffered ahead."""
+    import asyncio
+    buffer = asyncio.Queue(maxsize=depth)
+
+    async def produce():
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+            await buffer.put((_DONE, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await buffer.put((None, e))
+        finally:
+            await pages.aclose()
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield page
+    finally:
+        task.cancel()
+
+
+def iter_pages(fetch: Callable[[Any], Any], request: Any, page_size: Optional[int] = None,
+               deadline: Union[Deadline, float, None] = None, prefetch: int = 0) -> Iterator[Any]:
+    """
+    Yield every page of a list endpoint, starting from the request's cursor.
+
+    Args:
+        fetch: The endpoint method, e.g. client.list_orders
+        request: The endpoint's request dataclass
+        page_size: Optional page size sent as the pagination limit
+        deadline: Optional deadline, in seconds or as a Deadline, for fetching all pages
+        prefetch: Number of pages to fetch ahead of the consumer on a background thread;
+            0 fetches each page only when it is requested
+    """
+    if prefetch > 0:
+        return _prefetched(_fetch_pages(fetch, request, page_size, deadline), prefetch)
+    return _fetch_pages(fetch, request, page_size, deadline)
+
+
+def _fetch_pages(fetch: Callable[[Any], Any], request: Any, page_size: Optional[int],
+                 deadline: Union[Deadline, float, None]) -> Iterator[Any]:
+    pagination = _first_pagination(request, page_size)
+    deadline = Deadline.of(deadline)
+    while True:
+        if deadline:
+            deadline.check()
+        with call_options(deadline=deadline):
+            page = fetch(replace(request, pagination=pagination))
+        yield page
+        cursor = _next_cursor(page)
+        if cursor is None:
+            return
+        pagination = replace(pagination, cursor=cursor)
+
+
+def iter_items(fetch: Callable[[Any], Any], request: Any, items_field: str, page_size: Optional[int] = None,
+               max_items: Optional[int] = None, deadline: Union[Deadline, float, None] = None,
+               prefetch: int = 0) -> Iterator[Any]:
+    """
+    Yield the items of every page of a list endpoint, e.g. each Order of list_orders.
+
+    Args:
+        fetch: The endpoint method, e.g. client.list_orders
+        request: The endpoint's request dataclass
+        items_field: The response field holding the page's items, e.g. "orders"
+        page_size: Optional page size sent as the pagination limit
+        max_items: Stop after this many items without fetching further pages
+        deadline: Optional deadline, in seconds or as a Deadline, for fetching all pages
+        prefetch: Number of pages to fetch ahead of the consumer on a background thread
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    pages = iter_pages(fetch, request, page_size, deadline, prefetch)
+    try:
+        for page in pages:
+            for item in getattr(page, items_field) or []:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        pages.close()
+
+
+def aiter_pages(fetch: Callable[[Any], Awaitable[Any]], request: Any, page_size: Optional[int] = None,
+                deadline: Union[Deadline, float, None] = None, prefetch: int = 0) -> AsyncIterator[Any]:
+    """Async variant of iter_pages for AsyncPrimeClient methods; prefetching runs on a background task."""
+    if prefetch > 0:
+        return _aprefetched(_afetch_pages(fetch, request, page_size, deadline), prefetch)
+    return _afetch_pages(fetch, request, page_size, deadline)
+
+
+async def _afetch_pages(fetch: Callable[[Any], Awaitable[Any]], request: Any, page_size: Optional[int],
+                        deadline: Union[Deadline, float, None]) -> AsyncIterator[Any]:
+    pagination = _first_pagination(request, page_size)
+    deadline = Deadline.of(deadline)
+    while True:
+        if deadline:
+            deadline.check()
+        with call_options(deadline=deadline):
+            page = await fetch(replace(request, pagination=pagination))
+        yield page
+        cursor = _next_cursor(page)
+        if cursor is None:
+            return
+        pagination = replace(pagination, cursor=cursor)
+
+
+async def aiter_items(fetch: Callable[[Any], Awaitable[Any]], request: Any, items_field: str,
+                      page_size: Optional[int] = None, max_items: Optional[int] = None,
+                      deadline: Union[Deadline, float, None] = None, prefetch: int = 0) -> AsyncIterator[Any]:
+    """Async variant of iter_items for AsyncPrimeClient methods."""
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    pages = aiter_pages(fetch, request, page_size, deadline, prefetch)
+    try:
+        async for page in pages:
+            for item in getattr(page, items_field) or []:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        await pages.aclose()
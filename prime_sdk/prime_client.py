@@ -31,547 +31,499 @@ This wrapper simplifies usage:
     portfolios = client.list_portfolios(ListPortfoliosRequest())
 """
 
-from prime_sdk.credentials import Credentials
-
-# Import all request and response types
-from prime_sdk.accept_quote import AcceptQuoteRequest, AcceptQuoteResponse
-from prime_sdk.cancel_entity_futures_sweep import CancelEntityFuturesSweepRequest, CancelEntityFuturesSweepResponse
-from prime_sdk.cancel_order import CancelOrderRequest, CancelOrderResponse
-from prime_sdk.create_address_book_entry import CreateAddressBookEntryRequest, CreateAddressBookEntryResponse
-from prime_sdk.create_conversion import CreateConversionRequest, CreateConversionResponse
-from prime_sdk.create_new_locates import CreateNewLocateRequest, CreateNewLocateResponse
-from prime_sdk.create_onchain_address_book_entry import CreateOnchainAddressBookEntryRequest, CreateOnchainAddressBookEntryResponse
-from prime_sdk.create_onchain_transaction import CreateOnchainTransactionRequest, CreateOnchainTransactionResponse
-from prime_sdk.create_order import CreateOrderRequest, CreateOrderResponse
-from prime_sdk.create_order_preview import CreateOrderPreviewRequest, CreateOrderPreviewResponse
-from prime_sdk.create_portfolio_allocations import CreatePortfolioAllocationsRequest, CreatePortfolioAllocationsResponse
-from prime_sdk.create_portfolio_net_allocations import CreatePortfolioNetAllocationsRequest, CreatePortfolioNetAllocationsResponse
-from prime_sdk.create_quote import CreateQuoteRequest, CreateQuoteResponse
-from prime_sdk.create_stake import CreateStakeRequest, CreateStakeResponse
-from prime_sdk.create_transfer import CreateTransferRequest, CreateTransferResponse
-from prime_sdk.create_unstake import CreateUnstakeRequest, CreateUnstakeResponse
-from prime_sdk.create_wallet import CreateWalletRequest, CreateWalletResponse
-from prime_sdk.create_wallet_address import CreateWalletAddressRequest, CreateWalletAddressResponse
-from prime_sdk.create_withdrawal import CreateWithdrawalRequest, CreateWithdrawalResponse
-from prime_sdk.delete_onchain_address_group import DeleteOnchainAddressGroupRequest, DeleteOnchainAddressGroupResponse
-from prime_sdk.get_activity import GetActivityRequest, GetActivityResponse
-from prime_sdk.get_address_book import GetAddressBookRequest, GetAddressBookResponse
-from prime_sdk.get_allocation_by_id import GetAllocationByIdRequest, GetAllocationByIdResponse
-from prime_sdk.get_entity_activity import GetEntityActivityRequest, GetEntityActivityResponse
-from prime_sdk.get_entity_fcm_balance import GetEntityFcmBalanceRequest, GetEntityFcmBalanceResponse
-from prime_sdk.get_entity_locate_availabilities import GetEntityLocateAvailabilitiesRequest, GetEntityLocateAvailabilitiesResponse
-from prime_sdk.get_entity_payment_method import GetEntityPaymentMethodRequest, GetEntityPaymentMethodResponse
-from prime_sdk.get_entity_positions import GetEntityPositionsRequest, GetEntityPositionsResponse
-from prime_sdk.get_margin_information import GetMarginInformationRequest, GetMarginInformationResponse
-from prime_sdk.get_net_allocations_by_netting_id import GetNetAllocationsByNettingIdRequest, GetNetAllocationsByNettingIdResponse
-from prime_sdk.get_order import GetOrderRequest, GetOrderResponse
-from prime_sdk.get_portfolio import GetPortfolioRequest, GetPortfolioResponse
-from prime_sdk.get_portfolio_buying_power import GetBuyingPowerRequest, GetBuyingPowerResponse
-from prime_sdk.get_portfolio_commission import GetPortfolioCommissionRequest, GetPortfolioCommissionResponse
-from prime_sdk.get_portfolio_credit_information import GetPortfolioCreditInformationRequest, GetPortfolioCreditInformationResponse
-from prime_sdk.get_portfolio_withdrawal_power import GetPortfolioWithdrawalPowerRequest, GetPortfolioWithdrawalPowerResponse
-from prime_sdk.get_trade_finance_tiered_pricing_fees import GetTradeFinanceTieredPricingFeesRequest, GetTradeFinanceTieredPricingFeesResponse
-from prime_sdk.get_transaction import GetTransactionRequest, GetTransactionResponse
-from prime_sdk.get_wallet import GetWalletRequest, GetWalletResponse
-from prime_sdk.get_wallet_balance import GetWalletBalanceRequest, GetWalletBalanceResponse
-from prime_sdk.get_wallet_deposit_instructions import GetWalletDepositInstructionsRequest, GetWalletDepositInstructionsResponse
-from prime_sdk.list_activities import ListActivitiesRequest, ListActivitiesResponse
-from prime_sdk.list_aggregate_entity_positions import ListAggregateEntityPositionsRequest, ListAggregateEntityPositionsResponse
-from prime_sdk.list_assets import ListAssetsRequest, ListAssetsResponse
-from prime_sdk.list_entity_activities import ListEntityActivitiesRequest, ListEntityActivitiesResponse
-from prime_sdk.list_entity_balances import ListEntityBalancesRequest, ListEntityBalancesResponse
-from prime_sdk.list_entity_futures_sweeps import ListEntityFuturesSweepsRequest, ListEntityFuturesSweepsResponse
-from prime_sdk.list_entity_payment_methods import ListEntityPaymentMethodsRequest, ListEntityPaymentMethodsResponse
-from prime_sdk.list_entity_positions import ListEntityPositionsRequest, ListEntityPositionsResponse
-from prime_sdk.list_existing_locates import ListExistingLocatesRequest, ListExistingLocatesResponse
-from prime_sdk.list_interest_accruals import ListInterestAccrualsRequest, ListInterestAccrualsResponse
-from prime_sdk.list_interest_accruals_for_portfolio import ListInterestAccrualsForPortfolioRequest, ListInterestAccrualsForPortfolioResponse
-from prime_sdk.list_invoices import ListInvoicesRequest, ListInvoicesResponse
-from prime_sdk.list_margin_call_summaries import ListMarginCallSummariesRequest, ListMarginCallSummariesResponse
-from prime_sdk.list_margin_conversions import ListMarginConversionsRequest, ListMarginConversionsResponse
-from prime_sdk.list_onchain_address_groups import ListOnchainAddressGroupsRequest, ListOnchainAddressGroupsResponse
-from prime_sdk.list_open_orders import ListOpenOrdersRequest, ListOpenOrdersResponse
-from prime_sdk.list_order_fills import ListOrderFillsRequest, ListOrderFillsResponse
-from prime_sdk.list_orders import ListOrdersRequest, ListOrdersResponse
-from prime_sdk.list_portfolio_allocations import ListPortfolioAllocationsRequest, ListPortfolioAllocationsResponse
-from prime_sdk.list_portfolio_balances import ListPortfolioBalancesRequest, ListPortfolioBalancesResponse
-from prime_sdk.list_portfolio_fills import ListPortfolioFillsRequest, ListPortfolioFillsResponse
-from prime_sdk.list_portfolio_transactions import ListPortfolioTransactionsRequest, ListPortfolioTransactionsResponse
-from prime_sdk.list_portfolio_users import ListPortfolioUsersRequest, ListPortfolioUsersResponse
-from prime_sdk.list_portfolios import ListPortfoliosRequest, ListPortfoliosResponse
-from prime_sdk.list_products import ListProductsRequest, ListProductsResponse
-from prime_sdk.list_users import ListUsersRequest, ListUsersResponse
-from prime_sdk.list_wallet_addresses import ListWalletAddressesRequest, ListWalletAddressesResponse
-from prime_sdk.list_wallet_transactions import ListWalletTransactionsRequest, ListWalletTransactionsResponse
-from prime_sdk.list_wallets import ListWalletsRequest, ListWalletsResponse
-from prime_sdk.list_web3_wallet_balances import ListWeb3WalletBalancesRequest, ListWeb3WalletBalancesResponse
-from prime_sdk.schedule_entity_futures_sweep import ScheduleEntityFuturesSweepRequest, ScheduleEntityFuturesSweepResponse
-from prime_sdk.set_auto_sweep import SetAutoSweepRequest, SetAutoSweepResponse
-from prime_sdk.update_onchain_address_book import UpdateOnchainAddressBookRequest, UpdateOnchainAddressBookResponse
-
-# Import all individual clients with aliases
-from prime_sdk.accept_quote import PrimeClient as AcceptQuoteClient
-from prime_sdk.cancel_entity_futures_sweep import PrimeClient as CancelEntityFuturesSweepClient
-from prime_sdk.cancel_order import PrimeClient as CancelOrderClient
-from prime_sdk.create_address_book_entry import PrimeClient as CreateAddressBookEntryClient
-from prime_sdk.create_conversion import PrimeClient as CreateConversionClient
-from prime_sdk.create_new_locates import PrimeClient as CreateNewLocatesClient
-from prime_sdk.create_onchain_address_book_entry import PrimeClient as CreateOnchainAddressBookEntryClient
-from prime_sdk.create_onchain_transaction import PrimeClient as CreateOnchainTransactionClient
-from prime_sdk.create_order import PrimeClient as CreateOrderClient
-from prime_sdk.create_order_preview import PrimeClient as CreateOrderPreviewClient
-from prime_sdk.create_portfolio_allocations import PrimeClient as CreatePortfolioAllocationsClient
-from prime_sdk.create_portfolio_net_allocations import PrimeClient as CreatePortfolioNetAllocationsClient
-from prime_sdk.create_quote import PrimeClient as CreateQuoteClient
-from prime_sdk.create_stake import PrimeClient as CreateStakeClient
-from prime_sdk.create_transfer import PrimeClient as CreateTransferClient
-from prime_sdk.create_unstake import PrimeClient as CreateUnstakeClient
-from prime_sdk.create_wallet import PrimeClient as CreateWalletClient
-from prime_sdk.create_wallet_address import PrimeClient as CreateWalletAddressClient
-from prime_sdk.create_withdrawal import PrimeClient as CreateWithdrawalClient
-from prime_sdk.delete_onchain_address_group import PrimeClient as DeleteOnchainAddressGroupClient
-from prime_sdk.get_activity import PrimeClient as GetActivityClient
-from prime_sdk.get_address_book import PrimeClient as GetAddressBookClient
-from prime_sdk.get_allocation_by_id import PrimeClient as GetAllocationByIdClient
-from prime_sdk.get_entity_activity import PrimeClient as GetEntityActivityClient
-from prime_sdk.get_entity_fcm_balance import PrimeClient as GetEntityFcmBalanceClient
-from prime_sdk.get_entity_locate_availabilities import PrimeClient as GetEntityLocateAvailabilitiesClient
-from prime_sdk.get_entity_payment_method import PrimeClient as GetEntityPaymentMethodClient
-from prime_sdk.get_entity_positions import PrimeClient as GetEntityPositionsClient
-from prime_sdk.get_margin_information import PrimeClient as GetMarginInformationClient
-from prime_sdk.get_net_allocations_by_netting_id import PrimeClient as GetNetAllocationsByNettingIdClient
-from prime_sdk.get_order import PrimeClient as GetOrderClient
-from prime_sdk.get_portfolio import PrimeClient as GetPortfolioClient
-from prime_sdk.get_portfolio_buying_power import PrimeClient as GetPortfolioBuyingPowerClient
-from prime_sdk.get_portfolio_commission import PrimeClient as GetPortfolioCommissionClient
-from prime_sdk.get_portfolio_credit_information import PrimeClient as GetPortfolioCreditInformationClient
-from prime_sdk.get_portfolio_withdrawal_power import PrimeClient as GetPortfolioWithdrawalPowerClient
-from prime_sdk.get_trade_finance_tiered_pricing_fees import PrimeClient as GetTradeFinanceTieredPricingFeesClient
-from prime_sdk.get_transaction import PrimeClient as GetTransactionClient
-from prime_sdk.get_wallet import PrimeClient as GetWalletClient
-from prime_sdk.get_wallet_balance import PrimeClient as GetWalletBalanceClient
-from prime_sdk.get_wallet_deposit_instructions import PrimeClient as GetWalletDepositInstructionsClient
-from prime_sdk.list_activities import PrimeClient as ListActivitiesClient
-from prime_sdk.list_aggregate_entity_positions import PrimeClient as ListAggregateEntityPositionsClient
-from prime_sdk.list_assets import PrimeClient as ListAssetsClient
-from prime_sdk.list_entity_activities import PrimeClient as ListEntityActivitiesClient
-from prime_sdk.list_entity_balances import PrimeClient as ListEntityBalancesClient
-from prime_sdk.list_entity_futures_sweeps import PrimeClient as ListEntityFuturesSweepsClient
-from prime_sdk.list_entity_payment_methods import PrimeClient as ListEntityPaymentMethodsClient
-from prime_sdk.list_entity_positions import PrimeClient as ListEntityPositionsClient
-from prime_sdk.list_existing_locates import PrimeClient as ListExistingLocatesClient
-from prime_sdk.list_interest_accruals import PrimeClient as ListInterestAccrualsClient
-from prime_sdk.list_interest_accruals_for_portfolio import PrimeClient as ListInterestAccrualsForPortfolioClient
-from prime_sdk.list_invoices import PrimeClient as ListInvoicesClient
-from prime_sdk.list_margin_call_summaries import PrimeClient as ListMarginCallSummariesClient
-from prime_sdk.list_margin_conversions import PrimeClient as ListMarginConversionsClient
-from prime_sdk.list_onchain_address_groups import PrimeClient as ListOnchainAddressGroupsClient
-from prime_sdk.list_open_orders import PrimeClient as ListOpenOrdersClient
-from prime_sdk.list_order_fills import PrimeClient as ListOrderFillsClient
-from prime_sdk.list_orders import PrimeClient as ListOrdersClient
-from prime_sdk.list_portfolio_allocations import PrimeClient as ListPortfolioAllocationsClient
-from prime_sdk.list_portfolio_balances import PrimeClient as ListPortfolioBalancesClient
-from prime_sdk.list_portfolio_fills import PrimeClient as ListPortfolioFillsClient
-from prime_sdk.list_portfolio_transactions import PrimeClient as ListPortfolioTransactionsClient
-from prime_sdk.list_portfolio_users import PrimeClient as ListPortfolioUsersClient
-from prime_sdk.list_portfolios import PrimeClient as ListPortfoliosClient
-from prime_sdk.list_products import PrimeClient as ListProductsClient
-from prime_sdk.list_users import PrimeClient as ListUsersClient
-from prime_sdk.list_wallet_addresses import PrimeClient as ListWalletAddressesClient
-from prime_sdk.list_wallet_transactions import PrimeClient as ListWalletTransactionsClient
-from prime_sdk.list_wallets import PrimeClient as ListWalletsClient
-from prime_sdk.list_web3_wallet_balances import PrimeClient as ListWeb3WalletBalancesClient
-from prime_sdk.schedule_entity_futures_sweep import PrimeClient as ScheduleEntityFuturesSweepClient
-from prime_sdk.set_auto_sweep import PrimeClient as SetAutoSweepClient
-from prime_sdk.update_onchain_address_book import PrimeClient as UpdateOnchainAddressBookClient
+import functools
+import importlib
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
 
+import requests
 
-class PrimeClient:
+from prime_sdk import bulk, cancel_all, fetch
+from prime_sdk.client import Client, copy_http_client, mount_pool, new_http_client, DEFAULT_POOL_CONNECTIONS, \
+    DEFAULT_POOL_MAXSIZE
+from prime_sdk.credentials import Credentials
+from prime_sdk.lazy import lazy_decoding
+from prime_sdk.pagination import iter_items
+from prime_sdk.rate_limit import RateLimiter, default_bucket
+from prime_sdk.response_cache import ResponseCache
+from prime_sdk.retry import RetryPolicy
+from prime_sdk.sharding import iter_sharded, TIME_RANGE_ENDPOINTS
+from prime_sdk.single_flight import SingleFlight
+from prime_sdk.streaming import iter_streamed_items
+from prime_sdk.timeouts import Deadline, Timeout, DEFAULT_TIMEOUT, call_options
+
+if TYPE_CHECKING:
+    from prime_sdk.entity_cache import EntityCache
+
+# Endpoint modules and the names the unified client re-exports from each of them:
+# the request type, the response type and the module's PrimeClient under an alias.
+# Modules are imported on first use, so importing this module stays cheap.
+_MODULE_EXPORTS = {
+    "accept_quote": ("AcceptQuoteRequest", "AcceptQuoteResponse", "AcceptQuoteClient"),
+    "cancel_entity_futures_sweep": ("CancelEntityFuturesSweepRequest", "CancelEntityFuturesSweepResponse", "CancelEntityFuturesSweepClient"),
+    "cancel_order": ("CancelOrderRequest", "CancelOrderResponse", "CancelOrderClient"),
+    "create_address_book_entry": ("CreateAddressBookEntryRequest", "CreateAddressBookEntryResponse", "CreateAddressBookEntryClient"),
+    "create_conversion": ("CreateConversionRequest", "CreateConversionResponse", "CreateConversionClient"),
+    "create_new_locates": ("CreateNewLocateRequest", "CreateNewLocateResponse", "CreateNewLocatesClient"),
+    "create_onchain_address_book_entry": ("CreateOnchainAddressBookEntryRequest", "CreateOnchainAddressBookEntryResponse", "CreateOnchainAddressBookEntryClient"),
+    "create_onchain_transaction": ("CreateOnchainTransactionRequest", "CreateOnchainTransactionResponse", "CreateOnchainTransactionClient"),
+    "create_order": ("CreateOrderRequest", "CreateOrderResponse", "CreateOrderClient"),
+    "create_order_preview": ("CreateOrderPreviewRequest", "CreateOrderPreviewResponse", "CreateOrderPreviewClient"),
+    "create_portfolio_allocations": ("CreatePortfolioAllocationsRequest", "CreatePortfolioAllocationsResponse", "CreatePortfolioAllocationsClient"),
+    "create_portfolio_net_allocations": ("CreatePortfolioNetAllocationsRequest", "CreatePortfolioNetAllocationsResponse", "CreatePortfolioNetAllocationsClient"),
+    "create_quote": ("CreateQuoteRequest", "CreateQuoteResponse", "CreateQuoteClient"),
+    "create_stake": ("CreateStakeRequest", "CreateStakeResponse", "CreateStakeClient"),
+    "create_transfer": ("CreateTransferRequest", "CreateTransferResponse", "CreateTransferClient"),
+    "create_unstake": ("CreateUnstakeRequest", "CreateUnstakeResponse", "CreateUnstakeClient"),
+    "create_wallet": ("CreateWalletRequest", "CreateWalletResponse", "CreateWalletClient"),
+    "create_wallet_address": ("CreateWalletAddressRequest", "CreateWalletAddressResponse", "CreateWalletAddressClient"),
+    "create_withdrawal": ("CreateWithdrawalRequest", "CreateWithdrawalResponse", "CreateWithdrawalClient"),
+    "delete_onchain_address_group": ("DeleteOnchainAddressGroupRequest", "DeleteOnchainAddressGroupResponse", "DeleteOnchainAddressGroupClient"),
+    "get_activity": ("GetActivityRequest", "GetActivityResponse", "GetActivityClient"),
+    "get_address_book": ("GetAddressBookRequest", "GetAddressBookResponse", "GetAddressBookClient"),
+    "get_allocation_by_id": ("GetAllocationByIdRequest", "GetAllocationByIdResponse", "GetAllocationByIdClient"),
+    "get_entity_activity": ("GetEntityActivityRequest", "GetEntityActivityResponse", "GetEntityActivityClient"),
+    "get_entity_fcm_balance": ("GetEntityFcmBalanceRequest", "GetEntityFcmBalanceResponse", "GetEntityFcmBalanceClient"),
+    "get_entity_locate_availabilities": ("GetEntityLocateAvailabilitiesRequest", "GetEntityLocateAvailabilitiesResponse", "GetEntityLocateAvailabilitiesClient"),
+    "get_entity_payment_method": ("GetEntityPaymentMethodRequest", "GetEntityPaymentMethodResponse", "GetEntityPaymentMethodClient"),
+    "get_entity_positions": ("GetEntityPositionsRequest", "GetEntityPositionsResponse", "GetEntityPositionsClient"),
+    "get_margin_information": ("GetMarginInformationRequest", "GetMarginInformationResponse", "GetMarginInformationClient"),
+    "get_net_allocations_by_netting_id": ("GetNetAllocationsByNettingIdRequest", "GetNetAllocationsByNettingIdResponse", "GetNetAllocationsByNettingIdClient"),
+    "get_order": ("GetOrderRequest", "GetOrderResponse", "GetOrderClient"),
+    "get_portfolio": ("GetPortfolioRequest", "GetPortfolioResponse", "GetPortfolioClient"),
+    "get_portfolio_buying_power": ("GetBuyingPowerRequest", "GetBuyingPowerResponse", "GetPortfolioBuyingPowerClient"),
+    "get_portfolio_commission": ("GetPortfolioCommissionRequest", "GetPortfolioCommissionResponse", "GetPortfolioCommissionClient"),
+    "get_portfolio_credit_information": ("GetPortfolioCreditInformationRequest", "GetPortfolioCreditInformationResponse", "GetPortfolioCreditInformationClient"),
+    "get_portfolio_withdrawal_power": ("GetPortfolioWithdrawalPowerRequest", "GetPortfolioWithdrawalPowerResponse", "GetPortfolioWithdrawalPowerClient"),
+    "get_trade_finance_tiered_pricing_fees": ("GetTradeFinanceTieredPricingFeesRequest", "GetTradeFinanceTieredPricingFeesResponse", "GetTradeFinanceTieredPricingFeesClient"),
+    "get_transaction": ("GetTransactionRequest", "GetTransactionResponse", "GetTransactionClient"),
+    "get_wallet": ("GetWalletRequest", "GetWalletResponse", "GetWalletClient"),
+    "get_wallet_balance": ("GetWalletBalanceRequest", "GetWalletBalanceResponse", "GetWalletBalanceClient"),
+    "get_wallet_deposit_instructions": ("GetWalletDepositInstructionsRequest", "GetWalletDepositInstructionsResponse", "GetWalletDepositInstructionsClient"),
+    "list_activities": ("ListActivitiesRequest", "ListActivitiesResponse", "ListActivitiesClient"),
+    "list_aggregate_entity_positions": ("ListAggregateEntityPositionsRequest", "ListAggregateEntityPositionsResponse", "ListAggregateEntityPositionsClient"),
+    "list_assets": ("ListAssetsRequest", "ListAssetsResponse", "ListAssetsClient"),
+    "list_entity_activities": ("ListEntityActivitiesRequest", "ListEntityActivitiesResponse", "ListEntityActivitiesClient"),
+    "list_entity_balances": ("ListEntityBalancesRequest", "ListEntityBalancesResponse", "ListEntityBalancesClient"),
+    "list_entity_futures_sweeps": ("ListEntityFuturesSweepsRequest", "ListEntityFuturesSweepsResponse", "ListEntityFuturesSweepsClient"),
+    "list_entity_payment_methods": ("ListEntityPaymentMethodsRequest", "ListEntityPaymentMethodsResponse", "ListEntityPaymentMethodsClient"),
+    "list_entity_positions": ("ListEntityPositionsRequest", "ListEntityPositionsResponse", "ListEntityPositionsClient"),
+    "list_existing_locates": ("ListExistingLocatesRequest", "ListExistingLocatesResponse", "ListExistingLocatesClient"),
+    "list_interest_accruals": ("ListInterestAccrualsRequest", "ListInterestAccrualsResponse", "ListInterestAccrualsClient"),
+    "list_interest_accruals_for_portfolio": ("ListInterestAccrualsForPortfolioRequest", "ListInterestAccrualsForPortfolioResponse", "ListInterestAccrualsForPortfolioClient"),
+    "list_invoices": ("ListInvoicesRequest", "ListInvoicesResponse", "ListInvoicesClient"),
+    "list_margin_call_summaries": ("ListMarginCallSummariesRequest", "ListMarginCallSummariesResponse", "ListMarginCallSummariesClient"),
+    "list_margin_conversions": ("ListMarginConversionsRequest", "ListMarginConversionsResponse", "ListMarginConversionsClient"),
+    "list_onchain_address_groups": ("ListOnchainAddressGroupsRequest", "ListOnchainAddressGroupsResponse", "ListOnchainAddressGroupsClient"),
+    "list_open_orders": ("ListOpenOrdersRequest", "ListOpenOrdersResponse", "ListOpenOrdersClient"),
+    "list_order_fills": ("ListOrderFillsRequest", "ListOrderFillsResponse", "ListOrderFillsClient"),
+    "list_orders": ("ListOrdersRequest", "ListOrdersResponse", "ListOrdersClient"),
+    "list_portfolio_allocations": ("ListPortfolioAllocationsRequest", "ListPortfolioAllocationsResponse", "ListPortfolioAllocationsClient"),
+    "list_portfolio_balances": ("ListPortfolioBalancesRequest", "ListPortfolioBalancesResponse", "ListPortfolioBalancesClient"),
+    "list_portfolio_fills": ("ListPortfolioFillsRequest", "ListPortfolioFillsResponse", "ListPortfolioFillsClient"),
+    "list_portfolio_transactions": ("ListPortfolioTransactionsRequest", "ListPortfolioTransactionsResponse", "ListPortfolioTransactionsClient"),
+    "list_portfolio_users": ("ListPortfolioUsersRequest", "ListPortfolioUsersResponse", "ListPortfolioUsersClient"),
+    "list_portfolios": ("ListPortfoliosRequest", "ListPortfoliosResponse", "ListPortfoliosClient"),
+    "list_products": ("ListProductsRequest", "ListProductsResponse", "ListProductsClient"),
+    "list_users": ("ListUsersRequest", "ListUsersResponse", "ListUsersClient"),
+    "list_wallet_addresses": ("ListWalletAddressesRequest", "ListWalletAddressesResponse", "ListWalletAddressesClient"),
+    "list_wallet_transactions": ("ListWalletTransactionsRequest", "ListWalletTransactionsResponse", "ListWalletTransactionsClient"),
+    "list_wallets": ("ListWalletsRequest", "ListWalletsResponse", "ListWalletsClient"),
+    "list_web3_wallet_balances": ("ListWeb3WalletBalancesRequest", "ListWeb3WalletBalancesResponse", "ListWeb3WalletBalancesClient"),
+    "schedule_entity_futures_sweep": ("ScheduleEntityFuturesSweepRequest", "ScheduleEntityFuturesSweepResponse", "ScheduleEntityFuturesSweepClient"),
+    "set_auto_sweep": ("SetAutoSweepRequest", "SetAutoSweepResponse", "SetAutoSweepClient"),
+    "update_onchain_address_book": ("UpdateOnchainAddressBookRequest", "UpdateOnchainAddressBookResponse", "UpdateOnchainAddressBookClient"),
+}
+
+_LAZY_ATTRIBUTES = {
+    name: (module, "PrimeClient" if name.endswith("Client") else name)
+    for module, names in _MODULE_EXPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(importlib.import_module(f"prime_sdk.{module}"), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+class _Endpoint:
     """
-    Unified client for Coinbase Prime SDK operations.
+    Exposes an endpoint client's method as an attribute of the unified client.
 
-    This class consolidates all individual PrimeClient imports into a single interface,
-    avoiding the need to import from 70+ different modules.
+    The endpoint module is the attribute name; the method name defaults to it too.
+    The exposed method also accepts an optional `deadline`, either a Deadline or
+    a budget in seconds, that bounds the whole call including retries.
     """
 
-    def __init__(self, credentials: Credentials):
-        """
-        Initialize the unified Prime client with credentials.
-
-        Args:
-            credentials: Coinbase Prime API credentials
-        """
-        self.credentials = credentials
-        
-        # Initialize all client properties
-        self._accept_quote = AcceptQuoteClient(credentials)
-        self._cancel_entity_futures_sweep = CancelEntityFuturesSweepClient(credentials)
-        self._cancel_order = CancelOrderClient(credentials)
-        self._create_address_book_entry = CreateAddressBookEntryClient(credentials)
-        self._create_conversion = CreateConversionClient(credentials)
-        self._create_new_locates = CreateNewLocatesClient(credentials)
-        self._create_onchain_address_book_entry = CreateOnchainAddressBookEntryClient(credentials)
-        self._create_onchain_transaction = CreateOnchainTransactionClient(credentials)
-        self._create_order = CreateOrderClient(credentials)
-        self._create_order_preview = CreateOrderPreviewClient(credentials)
-        self._create_portfolio_allocations = CreatePortfolioAllocationsClient(credentials)
-        self._create_portfolio_net_allocations = CreatePortfolioNetAllocationsClient(credentials)
-        self._create_quote = CreateQuoteClient(credentials)
-        self._create_stake = CreateStakeClient(credentials)
-        self._create_transfer = CreateTransferClient(credentials)
-        self._create_unstake = CreateUnstakeClient(credentials)
-        self._create_wallet = CreateWalletClient(credentials)
-        self._create_wallet_address = CreateWalletAddressClient(credentials)
-        self._create_withdrawal = CreateWithdrawalClient(credentials)
-        self._delete_onchain_address_group = DeleteOnchainAddressGroupClient(credentials)
-        self._get_activity = GetActivityClient(credentials)
-        self._get_address_book = GetAddressBookClient(credentials)
-        self._get_allocation_by_id = GetAllocationByIdClient(credentials)
-        self._get_entity_activity = GetEntityActivityClient(credentials)
-        self._get_entity_fcm_balance = GetEntityFcmBalanceClient(credentials)
-        self._get_entity_locate_availabilities = GetEntityLocateAvailabilitiesClient(credentials)
-        self._get_entity_payment_method = GetEntityPaymentMethodClient(credentials)
-        self._get_entity_positions = GetEntityPositionsClient(credentials)
-        self._get_margin_information = GetMarginInformationClient(credentials)
-        self._get_net_allocations_by_netting_id = GetNetAllocationsByNettingIdClient(credentials)
-        self._get_order = GetOrderClient(credentials)
-        self._get_portfolio = GetPortfolioClient(credentials)
-        self._get_portfolio_buying_power = GetPortfolioBuyingPowerClient(credentials)
-        self._get_portfolio_commission = GetPortfolioCommissionClient(credentials)
-        self._get_portfolio_credit_information = GetPortfolioCreditInformationClient(credentials)
-        self._get_portfolio_withdrawal_power = GetPortfolioWithdrawalPowerClient(credentials)
-        self._get_trade_finance_tiered_pricing_fees = GetTradeFinanceTieredPricingFeesClient(credentials)
-        self._get_transaction = GetTransactionClient(credentials)
-        self._get_wallet = GetWalletClient(credentials)
-        self._get_wallet_balance = GetWalletBalanceClient(credentials)
-        self._get_wallet_deposit_instructions = GetWalletDepositInstructionsClient(credentials)
-        self._list_activities = ListActivitiesClient(credentials)
-        self._list_aggregate_entity_positions = ListAggregateEntityPositionsClient(credentials)
-        self._list_assets = ListAssetsClient(credentials)
-        self._list_entity_activities = ListEntityActivitiesClient(credentials)
-        self._list_entity_balances = ListEntityBalancesClient(credentials)
-        self._list_entity_futures_sweeps = ListEntityFuturesSweepsClient(credentials)
-        self._list_entity_payment_methods = ListEntityPaymentMethodsClient(credentials)
-        self._list_entity_positions = ListEntityPositionsClient(credentials)
-        self._list_existing_locates = ListExistingLocatesClient(credentials)
-        self._list_interest_accruals = ListInterestAccrualsClient(credentials)
-        self._list_interest_accruals_for_portfolio = ListInterestAccrualsForPortfolioClient(credentials)
-        self._list_invoices = ListInvoicesClient(credentials)
-        self._list_margin_call_summaries = ListMarginCallSummariesClient(credentials)
-        self._list_margin_conversions = ListMarginConversionsClient(credentials)
-        self._list_onchain_address_groups = ListOnchainAddressGroupsClient(credentials)
-        self._list_open_orders = ListOpenOrdersClient(credentials)
-        self._list_order_fills = ListOrderFillsClient(credentials)
-        self._list_orders = ListOrdersClient(credentials)
-        self._list_portfolio_allocations = ListPortfolioAllocationsClient(credentials)
-        self._list_portfolio_balances = ListPortfolioBalancesClient(credentials)
-        self._list_portfolio_fills = ListPortfolioFillsClient(credentials)
-        self._list_portfolio_transactions = ListPortfolioTransactionsClient(credentials)
-        self._list_portfolio_users = ListPortfolioUsersClient(credentials)
-        self._list_portfolios = ListPortfoliosClient(credentials)
-        self._list_products = ListProductsClient(credentials)
-        self._list_users = ListUsersClient(credentials)
-        self._list_wallet_addresses = ListWalletAddressesClient(credentials)
-        self._list_wallet_transactions = ListWalletTransactionsClient(credentials)
-        self._list_wallets = ListWalletsClient(credentials)
-        self._list_web3_wallet_balances = ListWeb3WalletBalancesClient(credentials)
-        self._schedule_entity_futures_sweep = ScheduleEntityFuturesSweepClient(credentials)
-        self._set_auto_sweep = SetAutoSweepClient(credentials)
-        self._update_onchain_address_book = UpdateOnchainAddressBookClient(credentials)
-
-    # Client properties for direct access
-    @property
-    def accept_quote(self):
-        return self._accept_quote.accept_quote
-
-    @property
-    def cancel_entity_futures_sweep(self):
-        return self._cancel_entity_futures_sweep.cancel_entity_futures_sweep
-
-    @property
-    def cancel_order(self):
-        return self._cancel_order.cancel_order
-
-    @property
-    def create_address_book_entry(self):
-        return self._create_address_book_entry.create_address_book_entry
-
-    @property
-    def create_conversion(self):
-        return self._create_conversion.create_conversion
-
-    @property
-    def create_new_locates(self):
-        return self._create_new_locates.create_new_locate
-
-    @property
-    def create_onchain_address_book_entry(self):
-        return self._create_onchain_address_book_entry.create_onchain_address_book_entry
-
-    @property
-    def create_onchain_transaction(self):
-        return self._create_onchain_transaction.create_onchain_transaction
-
-    @property
-    def create_order(self):
-        return self._create_order.create_order
-
-    @property
-    def create_order_preview(self):
-        return self._create_order_preview.create_order_preview
-
-    @property
-    def create_portfolio_allocations(self):
-        return self._create_portfolio_allocations.create_portfolio_allocations
-
-    @property
-    def create_portfolio_net_allocations(self):
-        return self._create_portfolio_net_allocations.create_portfolio_net_allocations
-
-    @property
-    def create_quote(self):
-        return self._create_quote.create_quote
-
-    @property
-    def create_stake(self):
-        return self._create_stake.create_stake
-
-    @property
-    def create_transfer(self):
-        return self._create_transfer.create_transfer
-
-    @property
-    def create_unstake(self):
-        return self._create_unstake.create_unstake
-
-    @property
-    def create_wallet(self):
-        return self._create_wallet.create_wallet
-
-    @property
-    def create_wallet_address(self):
-        return self._create_wallet_address.create_wallet_address
-
-    @property
-    def create_withdrawal(self):
-        return self._create_withdrawal.create_withdrawal
-
-    @property
-    def delete_onchain_address_group(self):
-        return self._delete_onchain_address_group.delete_onchain_address_group
-
-    @property
-    def get_activity(self):
-        return self._get_activity.get_activity
-
-    @property
-    def get_address_book(self):
-        return self._get_address_book.get_address_book
-
-    @property
-    def get_allocation_by_id(self):
-        return self._get_allocation_by_id.get_allocation_by_id
-
-    @property
-    def get_entity_activity(self):
-        return self._get_entity_activity.get_entity_activity_by_activity_id
-
-    @property
-    def get_entity_fcm_balance(self):
-        return self._get_entity_fcm_balance.get_entity_fcm_balance
-
-    @property
-    def get_entity_locate_availabilities(self):
-        return self._get_entity_locate_availabilities.get_entity_locate_availabilities
-
-    @property
-    def get_entity_payment_method(self):
-        return self._get_entity_payment_method.get_entity_payment_method
-
-    @property
-    def get_entity_positions(self):
-        return self._get_entity_positions.get_entity_positions
-
-    @property
-    def get_margin_information(self):
-        return self._get_margin_information.get_margin_information
-
-    @property
-    def get_net_allocations_by_netting_id(self):
-        return self._get_net_allocations_by_netting_id.get_net_allocations_by_netting_id
-
-    @property
-    def get_order(self):
-        return self._get_order.get_order
-
-    @property
-    def get_portfolio(self):
-        return self._get_portfolio.get_portfolio
-
-    @property
-    def get_portfolio_buying_power(self):
-        return self._get_portfolio_buying_power.get_buying_power
-
-    @property
-    def get_portfolio_commission(self):
-        return self._get_portfolio_commission.get_portfolio_commission
-
-    @property
-    def get_portfolio_credit_information(self):
-        return self._get_portfolio_credit_information.get_portfolio_credit_information
-
-    @property
-    def get_portfolio_withdrawal_power(self):
-        return self._get_portfolio_withdrawal_power.get_portfolio_withdrawal_power
-
-    @property
-    def get_trade_finance_tiered_pricing_fees(self):
-        return self._get_trade_finance_tiered_pricing_fees.get_trade_finance_tiered_pricing_fees
-
-    @property
-    def get_transaction(self):
-        return self._get_transaction.get_transaction
-
-    @property
-    def get_wallet(self):
-        return self._get_wallet.get_wallet
-
-    @property
-    def get_wallet_balance(self):
-        return self._get_wallet_balance.get_wallet_balance
+    def __init__(self, method: Optional[str] = None):
+        self.method = method
 
-    @property
-    def get_wallet_deposit_instructions(self):
-        return self._get_wallet_deposit_instructions.get_wallet_deposit_instructions
+    def __set_name__(self, owner, name: str):
+        self.module = name
+        if self.method is None:
+            self.method = name
 
-    @property
-    def list_activities(self):
-        return self._list_activities.list_activities
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.bind(instance)
 
-    @property
-    def list_aggregate_entity_positions(self):
-        return self._list_aggregate_entity_positions.list_aggregate_entity_positions
+    def bind(self, instance, cached: bool = True) -> Callable:
+        """The endpoint method of a PrimeClient; with cached=False it bypasses the client's caches."""
+        method = getattr(getattr(instance, f"_{self.module}"), self.method)
+        call = _with_call_options(method, instance.endpoint_timeouts.get(self.module), instance.lazy_decoding)
+        if cached:
+            response_cache, entity_cache = instance.response_cache, instance.entity_cache
+            # Scoped by access key, so clients with different credentials never share responses
+            scope = instance.credentials.access_key
+            if response_cache is not None and response_cache.caches(self.module):
+                call = _with_cache(call, self.module, functools.partial(response_cache.fetch, scope=scope))
+            if entity_cache is not None and entity_cache.caches(self.module):
+                call = _with_cache(call, self.module, functools.partial(entity_cache.fetch, scope=scope))
+        return call
 
-    @property
-    def list_assets(self):
-        return self._list_assets.list_assets
 
-    @property
-    def list_entity_activities(self):
-        return self._list_entity_activities.list_entity_activities
+def _with_call_options(method: Callable, timeout: Optional[Timeout], lazy: bool = False) -> Callable:
+    @functools.wraps(method)
+    def call(request: Any, deadline: Union[Deadline, float, None] = None) -> Any:
+        if deadline is None and timeout is None and not lazy:
+            return method(request)
+        with call_options(deadline=deadline, timeout=timeout), lazy_decoding() if lazy else nullcontext():
+            return method(request)
 
-    @property
-    def list_entity_balances(self):
-        return self._list_entity_balances.list_entity_balances
+    return call
 
-    @property
-    def list_entity_futures_sweeps(self):
-        return self._list_entity_futures_sweeps.list_entity_futures_sweeps
 
-    @property
-    def list_entity_payment_methods(self):
-        return self._list_entity_payment_methods.list_entity_payment_methods
+def _with_cache(call: Callable, endpoint: str, lookup: Callable) -> Callable:
+    # lookup is a cache's fetch method: lookup(endpoint, call, request, deadline)
+    @functools.wraps(call)
+    def cached(request: Any, deadline: Union[Deadline, float, None] = None) -> Any:
+        return lookup(endpoint, call, request, deadline)
 
-    @property
-    def list_entity_positions(self):
-        return self._list_entity_positions.list_entity_positions
+    return cached
 
-    @property
-    def list_existing_locates(self):
-        return self._list_existing_locates.list_existing_locates
 
-    @property
-    def list_interest_accruals(self):
-        return self._list_interest_accruals.list_interest_accruals
-
-    @property
-    def list_interest_accruals_for_portfolio(self):
-        return self._list_interest_accruals_for_portfolio.list_interest_accruals_for_portfolio
-
-    @property
-    def list_invoices(self):
-        return self._list_invoices.list_invoices
-
-    @property
-    def list_margin_call_summaries(self):
-        return self._list_margin_call_summaries.list_margin_call_summaries
-
-    @property
-    def list_margin_conversions(self):
-        return self._list_margin_conversions.list_margin_conversions
+class _Paginator:
+    """
+    Exposes iter_<endpoint>(request, page_size=None, max_items=None, deadline=None, prefetch=0, stream=False),
+    a generator over the items of every page of a cursor-paginated endpoint.
 
-    @property
-    def list_onchain_address_groups(self):
-        return self._list_onchain_address_groups.list_onchain_address_groups
+    With stream=True each page is parsed while it is received instead of being decoded as a whole.
+    """
 
-    @property
-    def list_open_orders(self):
-        return self._list_open_orders.list_open_orders
+    def __init__(self, items_field: str):
+        self.items_field = items_field
 
-    @property
-    def list_order_fills(self):
-        return self._list_order_fills.list_order_fills
+    def __set_name__(self, owner, name: str):
+        self.endpoint = name[len("iter_"):]
+        self.method = vars(owner)[self.endpoint].method
 
-    @property
-    def list_orders(self):
-        return self._list_orders.list_orders
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
 
-    @property
-    def list_portfolio_allocations(self):
-        return self._list_portfolio_allocations.list_portfolio_allocations
+        def iterate(request: Any, page_size: Optional[int] = None, max_items: Optional[int] = None,
+                    deadline: Union[Deadline, float, None] = None, prefetch: int = 0, stream: bool = False):
+            if not stream:
+                return iter_items(getattr(instance, self.endpoint), request, self.items_field, page_size=page_size,
+                                  max_items=max_items, deadline=deadline, prefetch=prefetch)
+            if prefetch:
+                raise ValueError("prefetch is not supported with stream=True")
+            return iter_streamed_items(instance.client, self.endpoint, self.method, request, self.items_field,
+                                       page_size=page_size, max_items=max_items, deadline=deadline,
+                                       timeout=instance.endpoint_timeouts.get(self.endpoint),
+                                       lazy=instance.lazy_decoding or None)
 
-    @property
-    def list_portfolio_balances(self):
-        return self._list_portfolio_balances.list_portfolio_balances
+        iterate.__name__ = iterate.__qualname__ = f"iter_{self.endpoint}"
+        return iterate
 
-    @property
-    def list_portfolio_fills(self):
-        return self._list_portfolio_fills.list_portfolio_fills
 
-    @property
-    def list_portfolio_transactions(self):
-        return self._list_portfolio_transactions.list_portfolio_transactions
+class _Sharded:
+    """
+    Exposes iter_sharded_<endpoint>(request, shards=8, max_workers=4, page_size=None, min_window=1 minute,
+    deadline=None), a generator over the items of a time-filtered endpoint that pages windows in parallel.
+    """
 
-    @property
-    def list_portfolio_users(self):
-        return self._list_portfolio_users.list_portfolio_users
+    def __set_name__(self, owner, name: str):
+        self.endpoint = name[len("iter_sharded_"):]
 
-    @property
-    def list_portfolios(self):
-        return self._list_portfolios.list_portfolios
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return functools.partial(iter_sharded, getattr(instance, self.endpoint),
+                                 endpoint=TIME_RANGE_ENDPOINTS[self.endpoint])
 
-    @property
-    def list_products(self):
-        return self._list_products.list_products
 
-    @property
-    def list_users(self):
-        return self._list_users.list_users
+class PrimeClient:
+    """
+    Unified client for Coinbase Prime SDK operations.
 
-    @property
-    def list_wallet_addresses(self):
-        return self._list_wallet_addresses.list_wallet_addresses
+    This class consolidates all individual PrimeClient imports into a single interface,
+    avoiding the need to import from 70+ different modules. Every operation is sent
+    through one shared Client, so all endpoints reuse the same connection pool.
 
-    @property
-    def list_wallet_transactions(self):
-        return self._list_wallet_transactions.list_wallet_transactions
+    The client can be used as a context manager to release pooled connections:
+        with PrimeClient(credentials) as client:
+            client.list_portfolios(ListPortfoliosRequest())
+    """
 
-    @property
-    def list_wallets(self):
-        return self._list_wallets.list_wallets
+    def __init__(self, credentials: Credentials, http_client: Optional[requests.Session] = None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 keep_alive: bool = True, retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None, timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+                 endpoint_timeouts: Optional[Dict[str, Timeout]] = None, lazy_decoding: bool = False,
+                 single_flight: Optional[SingleFlight] = None, response_cache: Optional[ResponseCache] = None,
+                 entity_cache: Optional['EntityCache'] = None):
+        """
+        Initialize the unified Prime client with credentials.
 
-    @property
-    def list_web3_wallet_balances(self):
-        return self._list_web3_wallet_balances.list_web3_wallet_balances
+        Args:
+            credentials: Coinbase Prime API credentials
+            http_client: Optional session to send requests with; pool settings are ignored when given
+            pool_connections: Number of host pools to cache
+            pool_maxsize: Maximum number of connections kept per host pool
+            keep_alive: If False, connections are closed after every request
+            retry_policy: Optional policy for retrying throttled, failed or unreachable requests
+            rate_limiter: Optional client-side rate limiter; share one instance to limit several clients together
+            timeout: Connect and read timeout in seconds, or a (connect, read) tuple; None waits forever
+            endpoint_timeouts: Timeouts for individual operations, keyed by method name (e.g. "list_portfolio_fills")
+            lazy_decoding: If True, response models are decoded field by field on first access
+            single_flight: Optional SingleFlight; concurrent identical GETs then share one request
+            response_cache: Optional ResponseCache for the responses of slow-changing endpoints
+            entity_cache: Optional EntityCache for orders, transactions, allocations and activities
+                in a terminal state
+        """
+        self.credentials = credentials
+        self.endpoint_timeouts = dict(endpoint_timeouts) if endpoint_timeouts else {}
+        self.lazy_decoding = lazy_decoding
+        self.response_cache = response_cache
+        self.entity_cache = entity_cache
+        if http_client is None:
+            http_client = new_http_client(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                          keep_alive=keep_alive)
+        self.client = Client(credentials, http_client, retry_policy=retry_policy, rate_limiter=rate_limiter,
+                             timeout=timeout, single_flight=single_flight)
+        self._priority_client: Optional[Client] = None
+        self._priority_pool_maxsize = 0
+
+    def __getattr__(self, name: str):
+        # Endpoint clients (self._list_orders, ...) are built on first access and cached
+        if not name.startswith("_") or name.startswith("__") or name[1:] not in _MODULE_EXPORTS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        endpoint_client = importlib.import_module(f"prime_sdk.{name[1:]}").PrimeClient(
+            self.credentials, client=self.client)
+        setattr(self, name, endpoint_client)
+        return endpoint_client
+
+    def close(self) -> None:
+        """Close the shared connection pool."""
+        self.client.close()
+        if self._priority_client is not None:
+            self._priority_client.close()
+
+    def __enter__(self) -> 'PrimeClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def create_orders_bulk(self, requests: Iterable[Any],
+                           concurrency: int = bulk.DEFAULT_BULK_CONCURRENCY,
+                           deadline: Union[Deadline, float, None] = None) -> List[bulk.BulkOrderResult]:
+        """
+        Submit many orders concurrently, within the client's rate limit.
 
-    @property
-    def schedule_entity_futures_sweep(self):
-        return self._schedule_entity_futures_sweep.schedule_entity_futures_sweep
+        Args:
+            requests: CreateOrderRequests; those without a client_order_id are given a random one
+            concurrency: Maximum number of orders in flight at once
+            deadline: Optional deadline, in seconds or as a Deadline, for the whole batch
+
+        Returns one BulkOrderResult per request, in input order, holding either the
+        response or the error; failures do not abort the batch. Orders are resent
+        by the retry policy when their outcome is unknown, which their
+        client_order_id makes safe. Without a rate_limiter on the client, the
+        batch is held to Prime's documented order-entry rate.
+        """
+        bucket = default_bucket() if self.client.rate_limiter is None else None
+        return bulk.create_orders_bulk(self.create_order, requests, concurrency, deadline, bucket)
+
+    def cancel_all_open_orders(self, portfolio_id: str, product_ids: Union[str, Iterable[str], None] = None,
+                               side: Any = None, concurrency: int = cancel_all.DEFAULT_CANCEL_CONCURRENCY,
+                               deadline: Union[Deadline, float, None] = cancel_all.DEFAULT_FLATTEN_DEADLINE,
+                               verify_interval: float = cancel_all.DEFAULT_VERIFY_INTERVAL
+                               ) -> cancel_all.CancelAllResult:
+        """
+        Cancel every open order of a portfolio, then re-list until none are left or the deadline passes.
 
-    @property
-    def set_auto_sweep(self):
-        return self._set_auto_sweep.set_auto_sweep
+        Args:
+            portfolio_id: The portfolio to flatten
+            product_ids: Only cancel orders for these products
+            side: Only cancel orders on this side (OrderSide or "BUY"/"SELL")
+            concurrency: Maximum number of cancels in flight at once
+            deadline: Deadline, in seconds or as a Deadline, for cancelling and verifying
+            verify_interval: Seconds to wait between a round of cancels and the next listing
+
+        Requests are sent over a connection pool reserved for this method, so they
+        do not queue behind other traffic. The pool uses the settings of the
+        client's session and holds as many connections as the largest concurrency
+        requested so far. The returned CancelAllResult holds the cancelled and
+        failed order ids, any orders still open and the time until the book was
+        verified empty.
+        """
+        return cancel_all.cancel_all_open_orders(
+            self._priority_endpoint("list_open_orders", concurrency),
+            self._priority_endpoint("cancel_order", concurrency), portfolio_id, product_ids=product_ids,
+            side=side, concurrency=concurrency, deadline=deadline, verify_interval=verify_interval)
+
+    def fetch_many(self, kind: str, ids: Iterable[str], portfolio_id: Optional[str] = None,
+                   concurrency: int = fetch.DEFAULT_FETCH_CONCURRENCY,
+                   deadline: Union[Deadline, float, None] = None) -> Dict[str, fetch.FetchResult]:
+        """
+        Look up many orders, transactions, allocations or activities by id, concurrently.
 
-    @property
-    def update_onchain_address_book(self):
-        return self._update_onchain_address_book.update_onchain_address_book
+        Args:
+            kind: "order", "transaction", "allocation" or "activity"
+            ids: Entity ids; duplicates are looked up once
+            portfolio_id: The portfolio the entities belong to; defaults to the credentials' portfolio
+            concurrency: Maximum number of requests in flight at once
+            deadline: Optional deadline, in seconds or as a Deadline, for the whole lookup
+
+        Returns a FetchResult per distinct id, in the order the ids were first given,
+        holding either the get response or the error. Ids held by the client's
+        EntityCache are answered from it without a request. Without a
+        rate_limiter on the client, requests are held to Prime's documented rate.
+        """
+        get = vars(PrimeClient)[fetch.entity_kind(kind).endpoint].bind(self, cached=False)
+        bucket = default_bucket() if self.client.rate_limiter is None else None
+        return fetch.fetch_many(get, kind, ids, portfolio_id or self.credentials.portfolio_id,
+                                concurrency=concurrency, deadline=deadline, cache=self.entity_cache, bucket=bucket,
+                                scope=self.credentials.access_key)
+
+    def _priority_endpoint(self, name: str, pool_maxsize: int) -> Callable:
+        # Endpoint methods bound to a second Client whose session copies the shared one's settings
+        # but has a connection pool of its own, grown to the largest pool_maxsize requested
+        if self._priority_client is None:
+            priority = Client(self.credentials, copy_http_client(self.client.http_client, pool_maxsize),
+                              retry_policy=self.client.retry_policy, rate_limiter=self.client.rate_limiter,
+                              timeout=self.client.timeout)
+            priority.http_base_url = self.client.http_base_url
+            self._priority_client = priority
+            self._priority_pool_maxsize = pool_maxsize
+        elif pool_maxsize > self._priority_pool_maxsize:
+            session = self._priority_client.http_client
+            mount_pool(session, 1, pool_maxsize, session.get_adapter("https://").max_retries)
+            self._priority_pool_maxsize = pool_maxsize
+        endpoint = vars(PrimeClient)[name]
+        endpoint_client = importlib.import_module(f"prime_sdk.{endpoint.module}").PrimeClient(
+            self.credentials, client=self._priority_client)
+        return _with_call_options(getattr(endpoint_client, endpoint.method), self.endpoint_timeouts.get(name),
+                                  self.lazy_decoding)
+
+    # Endpoint methods, resolved on the shared endpoint clients
+    accept_quote = _Endpoint()
+    cancel_entity_futures_sweep = _Endpoint()
+    cancel_order = _Endpoint()
+    create_address_book_entry = _Endpoint()
+    create_conversion = _Endpoint()
+    create_new_locates = _Endpoint("create_new_locate")
+    create_onchain_address_book_entry = _Endpoint()
+    create_onchain_transaction = _Endpoint()
+    create_order = _Endpoint()
+    create_order_preview = _Endpoint()
+    create_portfolio_allocations = _Endpoint()
+    create_portfolio_net_allocations = _Endpoint()
+    create_quote = _Endpoint()
+    create_stake = _Endpoint()
+    create_transfer = _Endpoint()
+    create_unstake = _Endpoint()
+    create_wallet = _Endpoint()
+    create_wallet_address = _Endpoint()
+    create_withdrawal = _Endpoint()
+    delete_onchain_address_group = _Endpoint()
+    get_activity = _Endpoint()
+    get_address_book = _Endpoint()
+    get_allocation_by_id = _Endpoint()
+    get_entity_activity = _Endpoint("get_entity_activity_by_activity_id")
+    get_entity_fcm_balance = _Endpoint()
+    get_entity_locate_availabilities = _Endpoint()
+    get_entity_payment_method = _Endpoint()
+    get_entity_positions = _Endpoint()
+    get_margin_information = _Endpoint()
+    get_net_allocations_by_netting_id = _Endpoint()
+    get_order = _Endpoint()
+    get_portfolio = _Endpoint()
+    get_portfolio_buying_power = _Endpoint("get_buying_power")
+    get_portfolio_commission = _Endpoint()
+    get_portfolio_credit_information = _Endpoint()
+    get_portfolio_withdrawal_power = _Endpoint()
+    get_trade_finance_tiered_pricing_fees = _Endpoint()
+    get_transaction = _Endpoint()
+    get_wallet = _Endpoint()
+    get_wallet_balance = _Endpoint()
+    get_wallet_deposit_instructions = _Endpoint()
+    list_activities = _Endpoint()
+    list_aggregate_entity_positions = _Endpoint()
+    list_assets = _Endpoint()
+    list_entity_activities = _Endpoint()
+    list_entity_balances = _Endpoint()
+    list_entity_futures_sweeps = _Endpoint()
+    list_entity_payment_methods = _Endpoint()
+    list_entity_positions = _Endpoint()
+    list_existing_locates = _Endpoint()
+    list_interest_accruals = _Endpoint()
+    list_interest_accruals_for_portfolio = _Endpoint()
+    list_invoices = _Endpoint()
+    list_margin_call_summaries = _Endpoint()
+    list_margin_conversions = _Endpoint()
+    list_onchain_address_groups = _Endpoint()
+    list_open_orders = _Endpoint()
+    list_order_fills = _Endpoint()
+    list_orders = _Endpoint()
+    list_portfolio_allocations = _Endpoint()
+    list_portfolio_balances = _Endpoint()
+    list_portfolio_fills = _Endpoint()
+    list_portfolio_transactions = _Endpoint()
+    list_portfolio_users = _Endpoint()
+    list_portfolios = _Endpoint()
+    list_products = _Endpoint()
+    list_users = _Endpoint()
+    list_wallet_addresses = _Endpoint()
+    list_wallet_transactions = _Endpoint()
+    list_wallets = _Endpoint()
+    list_web3_wallet_balances = _Endpoint()
+    schedule_entity_futures_sweep = _Endpoint()
+    set_auto_sweep = _Endpoint()
+    update_onchain_address_book = _Endpoint()
+
+    # Generators over every item of cursor-paginated endpoints
+    iter_get_address_book = _Paginator("addresses")
+    iter_list_activities = _Paginator("activities")
+    iter_list_aggregate_entity_positions = _Paginator("positions")
+    iter_list_entity_activities = _Paginator("activities")
+    iter_list_entity_balances = _Paginator("balances")
+    iter_list_entity_positions = _Paginator("positions")
+    iter_list_order_fills = _Paginator("fills")
+    iter_list_orders = _Paginator("orders")
+    iter_list_portfolio_allocations = _Paginator("allocations")
+    iter_list_portfolio_fills = _Paginator("fills")
+    iter_list_portfolio_transactions = _Paginator("transactions")
+    iter_list_portfolio_users = _Paginator("users")
+    iter_list_products = _Paginator("products")
+    iter_list_users = _Paginator("users")
+    iter_list_wallet_addresses = _Paginator("addresses")
+    iter_list_wallet_transactions = _Paginator("transactions")
+    iter_list_wallets = _Paginator("wallets")
+    iter_list_web3_wallet_balances = _Paginator("balances")
+
+    iter_sharded_list_orders = _Sharded()
+    iter_sharded_list_portfolio_fills = _Sharded()
+    iter_sharded_list_portfolio_transactions = _Sharded()
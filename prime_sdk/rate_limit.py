@@ -0,0 +1,155 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from prime_sdk.errors import DeadlineExceededError
+from prime_sdk.timeouts import Deadline
+
+# Documented Prime REST limits: 25 requests per second with bursts of up to 50
+DEFAULT_RATE = 25.0
+DEFAULT_BURST = 50.0
+
+ORDER_PATH_SEGMENTS = frozenset({"order", "orders", "open_orders", "order_preview"})
+
+
+def endpoint_group(method: str, path: str) -> str:
+    """Default classification of requests: "orders" for order entry and order state, "default" otherwise."""
+    if ORDER_PATH_SEGMENTS.intersection(path.split("/")):
+        return "orders"
+    return "default"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. A caller
+    that finds the bucket empty reserves its token anyway and is told how long
+    to wait for it, so concurrent callers are served in arrival order without
+    polling.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity if capacity else rate
+        self.clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return the seconds to wait before they may be used."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def _reserve_by(self, tokens: float, deadline: Optional[Deadline]) -> float:
+        delay = self.reserve(tokens)
+        if delay and deadline and not deadline.allows(delay):
+            with self._lock:
+                self._tokens = min(self.capacity, self._tokens + tokens)
+            raise DeadlineExceededError(f"rate limit wait of {delay:.3f}s exceeds the deadline")
+        return delay
+
+    def acquire(self, tokens: float = 1, deadline: Optional[Deadline] = None) -> float:
+        """Block until tokens are available. Returns the seconds waited."""
+        delay = self._reserve_by(tokens, deadline)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1, deadline: Optional[Deadline] = None) -> float:
+        """Wait on the event loop until tokens are available. Returns the seconds waited."""
+        import asyncio
+        delay = self._reserve_by(tokens, deadline)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available; negative when callers are queued."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    @property
+    def fill_level(self) -> float:
+        """Fraction of the bucket that is currently full, between 0 and 1."""
+        return max(0.0, self.tokens / self.capacity)
+
+
+def default_bucket() -> TokenBucket:
+    """A bucket at Prime's documented rate, for batch helpers run by a client without a rate limiter."""
+    return TokenBucket(DEFAULT_RATE, DEFAULT_BURST)
+
+
+def check_concurrency(concurrency: int) -> None:
+    """Raise ValueError unless concurrency, the number of workers of a batch helper, is at least 1."""
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+
+class RateLimiter:
+    """
+    Client-side rate limiting with one token bucket per endpoint group.
+
+    Requests are classified by `classify(method, path)`; groups without a
+    bucket of their own share the default bucket. One limiter can be shared by
+    any number of clients and threads.
+    """
+
+    def __init__(self, default: Optional[TokenBucket] = None, groups: Optional[Dict[str, TokenBucket]] = None,
+                 classify: Callable[[str, str], str] = endpoint_group):
+        self.default = default if default else TokenBucket(DEFAULT_RATE, DEFAULT_BURST)
+        self.groups = dict(groups) if groups else {}
+        self.classify = classify
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def bucket(self, method: str, path: str) -> TokenBucket:
+        return self.groups.get(self.classify(method, path), self.default)
+
+    def _record(self, delay: float) -> None:
+        if delay:
+            with self._lock:
+                self.throttled += 1
+                self.throttled_seconds += delay
+
+    def acquire(self, method: str, path: str, deadline: Optional[Deadline] = None) -> float:
+        delay = self.bucket(method, path).acquire(deadline=deadline)
+        self._record(delay)
+        return delay
+
+    async def acquire_async(self, method: str, path: str, deadline: Optional[Deadline] = None) -> float:
+        delay = await self.bucket(method, path).acquire_async(deadline=deadline)
+        self._record(delay)
+        return delay
+
+    def fill_levels(self) -> Dict[str, float]:
+        """Current fill level of every bucket, keyed by group name."""
+        levels = {name: bucket.fill_level for name, bucket in self.groups.items()}
+        levels["default"] = self.default.fill_level
+        return levels
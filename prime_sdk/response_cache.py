@@ -0,0 +1,236 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory cache of responses from endpoints whose data changes rarely.
+
+A ResponseCache keeps decoded responses for a time-to-live set per endpoint
+and evicts the least recently used ones beyond max_entries. Responses are
+keyed by endpoint, request and scope, so requests with different parameters
+are cached separately; the clients pass their API access key as the scope, so
+clients with different credentials can share a cache without seeing each
+other's responses. Cached responses are shared by every caller with the same
+scope and must be treated as read-only.
+
+With stale_while_revalidate, a response up to that many seconds past its TTL
+is still returned, and a single background request refreshes it; callers
+only wait for the API when there is no usable entry at all.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from prime_sdk.timeouts import Deadline
+
+# Seconds each endpoint's responses are kept by default
+DEFAULT_TTLS = {
+    "get_portfolio": 300.0,
+    "get_portfolio_commission": 300.0,
+    "get_trade_finance_tiered_pricing_fees": 300.0,
+    "get_wallet_deposit_instructions": 3600.0,
+    "list_assets": 300.0,
+    "list_entity_payment_methods": 300.0,
+    "list_portfolios": 300.0,
+    "list_products": 300.0,
+}
+DEFAULT_MAX_ENTRIES = 1024
+
+_FRESH, _STALE, _MISS = "fresh", "stale", "miss"
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Counters of a ResponseCache; stale hits are counted apart from fresh ones."""
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL and LRU cache of endpoint responses.
+
+    Pass one to PrimeClient or AsyncPrimeClient as response_cache=; calls to the
+    endpoints in its ttls are then answered from it while their entry is fresh.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, Optional[float]]] = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 stale_while_revalidate: float = 0.0):
+        """
+        Args:
+            ttls: Seconds to keep responses, by endpoint method name; merged over DEFAULT_TTLS,
+                and None disables caching for an endpoint
+            max_entries: Maximum number of responses kept; the least recently used are evicted
+            stale_while_revalidate: Seconds past its TTL an entry is still returned while it is refreshed
+        """
+        merged = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.ttls = {endpoint: ttl for endpoint, ttl in merged.items() if ttl}
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._refreshing = set()
+        self._counts = dict.fromkeys(ResponseCacheStats.__dataclass_fields__, 0)
+
+    def caches(self, endpoint: str) -> bool:
+        return endpoint in self.ttls
+
+    @staticmethod
+    def key(endpoint: str, request: Any, scope: Optional[str] = None) -> Hashable:
+        # Request dataclasses are not hashable; their repr lists every field
+        return endpoint, scope, repr(request)
+
+    def get(self, endpoint: str, request: Any, scope: Optional[str] = None) -> Optional[Any]:
+        """The fresh cached response for a request, or None; does not count as a lookup."""
+        with self._lock:
+            entry = self._entries.get(self.key(endpoint, request, scope))
+        return entry[1] if entry and entry[0] > time.monotonic() else None
+
+    def put(self, endpoint: str, request: Any, response: Any, scope: Optional[str] = None) -> None:
+        self._store(self.key(endpoint, request, scope), endpoint, response)
+
+    def invalidate(self, endpoint: Optional[str] = None, request: Any = None, scope: Optional[str] = None) -> int:
+        """
+        Drop cached responses: every one, those of an endpoint, or those for a request.
+        A request's responses are dropped in every scope, or only in scope if one is given.
+        Returns the number of entries dropped.
+        """
+        with self._lock:
+            if endpoint is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            elif request is not None and scope is not None:
+                dropped = int(self._entries.pop(self.key(endpoint, request, scope), None) is not None)
+            else:
+                text = None if request is None else self.key(endpoint, request)[2]
+                keys = [key for key in self._entries if key[0] == endpoint and text in (None, key[2])]
+                for key in keys:
+                    del self._entries[key]
+                dropped = len(keys)
+            return dropped
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(**self._counts)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(self._counts, 0)
+
+    def fetch(self, endpoint: str, method: Callable[..., Any], request: Any,
+              deadline: Union[Deadline, float, None] = None, scope: Optional[str] = None) -> Any:
+        """Return the cached response to method(request), calling it on a miss and refreshing stale entries."""
+        key = self.key(endpoint, request, scope)
+        state, response = self._lookup(key)
+        if state == _FRESH:
+            return response
+        if state == _STALE:
+            if self._begin_refresh(key):
+                threading.Thread(target=self._refresh, args=(key, endpoint, method, request),
+                                 name="prime-sdk-cache-refresh", daemon=True).start()
+            return response
+        response = method(request, deadline)
+        self._store(key, endpoint, response)
+        return response
+
+    async def afetch(self, endpoint: str, method: Callable[..., Awaitable[Any]], request: Any,
+                     deadline: Union[Deadline, float, None] = None, scope: Optional[str] = None) -> Any:
+        """Async variant of fetch for coroutine methods; stale entries are refreshed by a background task."""
+        import asyncio
+        key = self.key(endpoint, request, scope)
+        state, response = self._lookup(key)
+        if state == _FRESH:
+            return response
+        if state == _STALE:
+            if self._begin_refresh(key):
+                asyncio.ensure_future(self._arefresh(key, endpoint, method, request))
+            return response
+        response = await method(request, deadline)
+        self._store(key, endpoint, response)
+        return response
+
+    def _lookup(self, key: Hashable) -> Tuple[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self._counts["hits"] += 1
+                    return _FRESH, response
+                if now < expires_at + self.stale_while_revalidate:
+                    self._entries.move_to_end(key)
+                    self._counts["stale_hits"] += 1
+                    return _STALE, response
+                del self._entries[key]
+            self._counts["misses"] += 1
+            return _MISS, None
+
+    def _store(self, key: Hashable, endpoint: str, response: Any) -> None:
+        expires_at = time.monotonic() + self.ttls[endpoint]
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def _begin_refresh(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _end_refresh(self, key: Hashable, failed: bool) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+            self._counts["refresh_errors" if failed else "refreshes"] += 1
+
+    def _refresh(self, key: Hashable, endpoint: str, method: Callable[..., Any], request: Any) -> None:
+        try:
+            self._store(key, endpoint, method(request))
+        except Exception:
+            # The stale entry stays in place until it expires; the next lookup tries again
+            self._end_refresh(key, True)
+        else:
+            self._end_refresh(key, False)
+
+    async def _arefresh(self, key: Hashable, endpoint: str, method: Callable[..., Awaitable[Any]],
+                        request: Any) -> None:
+        try:
+            self._store(key, endpoint, await method(request))
+        except Exception:
+            self._end_refresh(key, True)
+        else:
+            self._end_refresh(key, False)
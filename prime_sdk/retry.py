@@ -0,0 +1,109 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before a failed request is sent again.
+
+    Idempotent methods are retried on any status in retry_status_codes and on
+    connection errors. Other methods (POST) are only retried when the request
+    cannot have been processed: a 429 response or a failure to connect, unless
+    the caller marks the request idempotent (e.g. an order with a client_order_id).
+
+    Delays follow exponential backoff with decorrelated jitter, a Retry-After
+    header is honoured when it asks for a longer wait, and no retry is started
+    that would end after max_total_time seconds from the first attempt.
+    """
+    max_attempts: int = 4
+    base_delay: float = 0.1
+    max_delay: float = 10.0
+    max_total_time: float = 30.0
+    retry_status_codes: FrozenSet[int] = RETRY_STATUS_CODES
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def should_retry_status(self, method: str, status_code: int, idempotent: bool = False) -> bool:
+        if status_code not in self.retry_status_codes:
+            return False
+        return status_code == 429 or idempotent or method in self.idempotent_methods
+
+    def should_retry_error(self, method: str, request_sent: bool, idempotent: bool = False) -> bool:
+        return not request_sent or idempotent or method in self.idempotent_methods
+
+    def next_delay(self, previous_delay: float) -> float:
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous_delay * 3)))
+
+    def start(self) -> 'RetryState':
+        return RetryState(self)
+
+
+class RetryState:
+    """Tracks the attempts of one request against its RetryPolicy."""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempts = 1
+        self.started_at = time.monotonic()
+        self.delay = policy.base_delay
+
+    def on_status(self, method: str, status_code: int, retry_after: Optional[str] = None,
+                  idempotent: bool = False) -> Optional[float]:
+        """Return the seconds to wait before retrying a response, or None to give up."""
+        if not self.policy.should_retry_status(method, status_code, idempotent):
+            return None
+        return self._backoff(parse_retry_after(retry_after))
+
+    def on_error(self, method: str, request_sent: bool, idempotent: bool = False) -> Optional[float]:
+        """Return the seconds to wait before retrying a transport error, or None to give up."""
+        if not self.policy.should_retry_error(method, request_sent, idempotent):
+            return None
+        return self._backoff(None)
+
+    def _backoff(self, retry_after: Optional[float]) -> Optional[float]:
+        if self.attempts >= self.policy.max_attempts:
+            return None
+        self.delay = self.policy.next_delay(self.delay)
+        delay = max(self.delay, retry_after) if retry_after is not None else self.delay
+        if time.monotonic() - self.started_at + delay > self.policy.max_total_time:
+            return None
+        self.attempts += 1
+        return delay
@@ -15,7 +15,7 @@
 from dataclasses import dataclass, asdict
 
 from prime_sdk.base_response import BaseResponse
-from prime_sdk.client import Client
+from prime_sdk.client import Client, response_json
 from typing import List, Optional
 from prime_sdk.credentials import Credentials
 
@@ -33,11 +33,11 @@ class SetAutoSweepResponse(BaseResponse):
 
 
 class PrimeClient:
-    def __init__(self, credentials: Credentials):
-        self.client = Client(credentials)
+    def __init__(self, credentials: Credentials, client: Optional[Client] = None):
+        self.client = client if client else Client(credentials)
         
     def set_auto_sweep(self, request: SetAutoSweepRequest) -> SetAutoSweepResponse:
         path = f"/entities/{request.entity_id}/futures/auto_sweep"
         body = {k: v for k, v in asdict(request).items() if v is not None}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return SetAutoSweepResponse(**response.json())
+        return SetAutoSweepResponse(**response_json(response))
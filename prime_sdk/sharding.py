@@ -0,0 +1,290 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parallel time-range fetches for list endpoints filtered by a date range.
+
+Cursor pagination is serial, so a long history is split into time windows that
+are paged concurrently and yielded oldest first. A window whose first page
+reports more pages is split in half before it is paged, so dense periods are
+spread over more workers while sparse ones cost a single request.
+
+Items are ordered by their timestamp within each window and duplicates at
+window boundaries are dropped by id.
+"""
+
+import contextvars
+import re
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from prime_sdk.pagination import _afetch_pages, _fetch_pages, _next_cursor
+from prime_sdk.timeouts import Deadline
+
+DEFAULT_SHARDS = 8
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MIN_WINDOW = timedelta(minutes=1)
+
+Window = Tuple[datetime, datetime]
+
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+def parse_time(value: Union[str, datetime]) -> datetime:
+    """Parse an API timestamp such as 2025-01-31T12:00:00.123Z into a naive UTC datetime."""
+    if isinstance(value, str):
+        text = value.strip()
+        if text[-1:] in ("Z", "z"):
+            text = text[:-1] + "+00:00"
+        text = _FRACTION.sub(lambda match: "." + (match.group(1) + "000000")[:6], text, count=1)
+        value = datetime.fromisoformat(text)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# Length of "2025-01-31T12:00:00.123456Z"; UTC timestamps up to this long are used as they are
+_MICROSECOND_UTC_LENGTH = 27
+
+
+def naive_utc_text(value: Optional[str]) -> Optional[str]:
+    """
+    Rewrite an API timestamp as naive UTC ISO-8601 text with at most six fractional digits, or None if empty.
+
+    The result is what NumPy's datetime64 and Arrow's timestamp casts accept
+    without warnings; the common ...Z form only has its suffix dropped.
+    """
+    if not value:
+        return None
+    if value[-1:] in ("Z", "z") and len(value) <= _MICROSECOND_UTC_LENGTH:
+        return value[:-1]
+    # Nanosecond fractions and UTC offsets
+    return parse_time(value).isoformat()
+
+
+@dataclass(frozen=True)
+class TimeRangeEndpoint:
+    """Describes how a list endpoint's request and response are split by time."""
+    start_field: str
+    end_field: str
+    items_field: str
+    time_field: str
+    string_dates: bool = False
+
+    def bounds(self, request: Any) -> Window:
+        start = getattr(request, self.start_field)
+        if start is None:
+            raise ValueError(f"A sharded fetch requires request.{self.start_field}")
+        end = getattr(request, self.end_field)
+        if end is None:
+            return parse_time(start), datetime.now(timezone.utc).replace(tzinfo=None)
+        return parse_time(start), parse_time(end)
+
+    def windowed(self, request: Any, window: Window) -> Any:
+        start, end = window
+        if self.string_dates:
+            start, end = start.isoformat() + "Z", end.isoformat() + "Z"
+        return replace(request, **{self.start_field: start, self.end_field: end})
+
+    def sort_key(self, item: Any) -> datetime:
+        value = getattr(item, self.time_field, None)
+        return parse_time(value) if value else datetime.min
+
+
+TIME_RANGE_ENDPOINTS = {
+    "list_orders": TimeRangeEndpoint("start_date", "end_date", "orders", "created_at"),
+    "list_portfolio_fills": TimeRangeEndpoint("start_date", "end_date", "fills", "time", string_dates=True),
+    "list_portfolio_transactions": TimeRangeEndpoint("start", "end", "transactions", "created_at"),
+}
+
+
+class _Split:
+    def __init__(self, windows: List[Window]):
+        self.windows = windows
+
+
+def split_windows(start: datetime, end: datetime, shards: int) -> List[Window]:
+    """Split [start, end] into up to `shards` equal, adjacent windows."""
+    if end <= start:
+        return [(start, end)]
+    step = (end - start) / max(1, shards)
+    edges = [start + step * i for i in range(max(1, shards))] + [end]
+    return [(a, b) for a, b in zip(edges, edges[1:]) if b > a]
+
+
+def _should_split(window: Window, first_page: Any, min_window: timedelta) -> bool:
+    start, end = window
+    return _next_cursor(first_page) is not None and end - start > min_window
+
+
+def _sorted_unique(endpoint: TimeRangeEndpoint, items: Iterable[Any]) -> List[Any]:
+    unique = {}
+    for item in items:
+        unique.setdefault(getattr(item, "id", None) or id(item), item)
+    return sorted(unique.values(), key=endpoint.sort_key)
+
+
+def _halves(window: Window) -> List[Window]:
+    start, end = window
+    middle = start + (end - start) / 2
+    return [(start, middle), (middle, end)]
+
+
+def _fetch_window(fetch: Callable[[Any], Any], request: Any, endpoint: TimeRangeEndpoint, window: Window,
+                  page_size: Optional[int], min_window: timedelta,
+                  deadline: Optional[Deadline]) -> Union[_Split, List[Any]]:
+    items = []
+    for number, page in enumerate(_fetch_pages(fetch, endpoint.windowed(request, window), page_size, deadline)):
+        if number == 0 and _should_split(window, page, min_window):
+            return _Split(_halves(window))
+        items.extend(getattr(page, endpoint.items_field) or [])
+    return _sorted_unique(endpoint, items)
+
+
+async def _afetch_window(fetch: Callable[[Any], Awaitable[Any]], request: Any, endpoint: TimeRangeEndpoint,
+                         window: Window, page_size: Optional[int], min_window: timedelta,
+                         deadline: Optional[Deadline]) -> Union[_Split, List[Any]]:
+    items = []
+    number = 0
+    pages = _afetch_pages(fetch, endpoint.windowed(request, window), page_size, deadline)
+    try:
+        async for page in pages:
+            if number == 0 and _should_split(window, page, min_window):
+                return _Split(_halves(window))
+            items.extend(getattr(page, endpoint.items_field) or [])
+            number += 1
+    finally:
+        await pages.aclose()
+    return _sorted_unique(endpoint, items)
+
+
+def _drop_seen(items: List[Any], previous_ids: set) -> Tuple[List[Any], set]:
+    """Drop items already yielded by the previous window; returns the kept items and their ids."""
+    kept = [item for item in items if getattr(item, "id", None) not in previous_ids]
+    return kept, {getattr(item, "id", None) for item in kept} - {None}
+
+
+def _without_boundary_duplicates(windows: Iterator[List[Any]]) -> Iterator[Any]:
+    previous_ids = set()
+    for items in windows:
+        items, previous_ids = _drop_seen(items, previous_ids)
+        yield from items
+
+
+def iter_sharded(fetch: Callable[[Any], Any], request: Any, endpoint: TimeRangeEndpoint,
+                 shards: int = DEFAULT_SHARDS, max_workers: int = DEFAULT_MAX_WORKERS,
+                 page_size: Optional[int] = None, min_window: timedelta = DEFAULT_MIN_WINDOW,
+                 deadline: Union[Deadline, float, None] = None) -> Iterator[Any]:
+    """
+    Yield the items of a time-filtered list endpoint oldest first, paging time windows in parallel.
+
+    Args:
+        fetch: The endpoint method, e.g. client.list_portfolio_fills
+        request: The endpoint's request dataclass; its start and end bound the fetch
+        endpoint: How the endpoint is split by time, e.g. TIME_RANGE_ENDPOINTS["list_portfolio_fills"]
+        shards: Number of windows the range is initially split into
+        max_workers: Maximum number of windows paged concurrently
+        page_size: Optional page size sent as the pagination limit
+        min_window: Windows this short are paged rather than split further
+        deadline: Optional deadline, in seconds or as a Deadline, for the whole fetch
+    """
+    deadline = Deadline.of(deadline)
+    start, end = endpoint.bounds(request)
+    return _without_boundary_duplicates(
+        _ordered_windows(fetch, request, endpoint, split_windows(start, end, shards), max_workers, page_size,
+                         min_window, deadline))
+
+
+def _ordered_windows(fetch: Callable[[Any], Any], request: Any, endpoint: TimeRangeEndpoint,
+                     windows: List[Window], max_workers: int, page_size: Optional[int], min_window: timedelta,
+                     deadline: Optional[Deadline]) -> Iterator[List[Any]]:
+    from concurrent.futures import Future, ThreadPoolExecutor
+    lookahead = 2 * max_workers
+    # Windows and futures in time order; the first `lookahead` entries are always submitted.
+    order = deque(windows)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prime-sdk-shard")
+
+    def submit_ahead():
+        for index in range(min(lookahead, len(order))):
+            if not isinstance(order[index], Future):
+                context = contextvars.copy_context()
+                order[index] = executor.submit(context.run, _fetch_window, fetch, request, endpoint,
+                                               order[index], page_size, min_window, deadline)
+
+    try:
+        while order:
+            submit_ahead()
+            result = order.popleft().result()
+            if isinstance(result, _Split):
+                order.extendleft(reversed(result.windows))
+                continue
+            yield result
+    finally:
+        for entry in order:
+            if isinstance(entry, Future):
+                entry.cancel()
+        executor.shutdown(wait=False)
+
+
+def aiter_sharded(fetch: Callable[[Any], Awaitable[Any]], request: Any, endpoint: TimeRangeEndpoint,
+                  shards: int = DEFAULT_SHARDS, max_workers: int = DEFAULT_MAX_WORKERS,
+                  page_size: Optional[int] = None, min_window: timedelta = DEFAULT_MIN_WINDOW,
+                  deadline: Union[Deadline, float, None] = None) -> AsyncIterator[Any]:
+    """Async variant of iter_sharded for AsyncPrimeClient methods; windows are paged by concurrent tasks."""
+    deadline = Deadline.of(deadline)
+    start, end = endpoint.bounds(request)
+    return _awithout_boundary_duplicates(
+        _aordered_windows(fetch, request, endpoint, split_windows(start, end, shards), max_workers, page_size,
+                          min_window, deadline))
+
+
+async def _awithout_boundary_duplicates(windows: AsyncIterator[List[Any]]) -> AsyncIterator[Any]:
+    previous_ids = set()
+    async for items in windows:
+        items, previous_ids = _drop_seen(items, previous_ids)
+        for item in items:
+            yield item
+
+
+async def _aordered_windows(fetch: Callable[[Any], Awaitable[Any]], request: Any, endpoint: TimeRangeEndpoint,
+                            windows: List[Window], max_workers: int, page_size: Optional[int],
+                            min_window: timedelta, deadline: Optional[Deadline]) -> AsyncIterator[List[Any]]:
+    import asyncio
+    semaphore = asyncio.Semaphore(max_workers)
+    lookahead = 2 * max_workers
+    order = deque(windows)
+
+    async def bounded(window):
+        async with semaphore:
+            return await _afetch_window(fetch, request, endpoint, window, page_size, min_window, deadline)
+
+    def submit_ahead():
+        for index in range(min(lookahead, len(order))):
+            if not isinstance(order[index], asyncio.Future):
+                order[index] = asyncio.ensure_future(bounded(order[index]))
+
+    try:
+        while order:
+            submit_ahead()
+            result = await order.popleft()
+            if isinstance(result, _Split):
+                order.extendleft(reversed(result.windows))
+                continue
+            yield result
+    finally:
+        for entry in order:
+            if isinstance(entry, asyncio.Future):
+                entry.cancel()
@@ -0,0 +1,112 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Coalescing of identical GET requests that are in flight at the same time.
+
+When several threads send the same GET (same credentials, path and query)
+while one is still outstanding, only the first is sent; the others wait for
+its response and share it. Requests that start after it has completed are sent
+again, so no response is older than a request that was already in flight.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from prime_sdk.errors import DeadlineExceededError
+from prime_sdk.timeouts import Deadline
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Counters of a SingleFlight: requests sent, and calls that shared another call's request instead."""
+    sent: int = 0
+    coalesced: int = 0
+
+    @property
+    def calls(self) -> int:
+        return self.sent + self.coalesced
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe registry of in-flight calls keyed by request.
+
+    Pass one to Client (or PrimeClient) to coalesce its GET requests. A waiter
+    gives up with DeadlineExceededError when its own deadline passes first, and
+    sends the request itself if the shared one ran out of its caller's deadline.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._sent = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, call: Callable[[], Any], deadline: Optional[Deadline] = None) -> Any:
+        """Return call(), or the result of the identical call already in flight under key."""
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = _Flight()
+                    self._sent += 1
+                else:
+                    self._coalesced += 1
+
+            if leader:
+                try:
+                    flight.result = call()
+                except BaseException as e:
+                    flight.error = e
+                    raise
+                finally:
+                    with self._lock:
+                        del self._flights[key]
+                    flight.done.set()
+                return flight.result
+
+            if not flight.done.wait(deadline.remaining() if deadline else None):
+                raise DeadlineExceededError("deadline exceeded waiting for an identical request in flight")
+            if flight.error is None:
+                return flight.result
+            if not isinstance(flight.error, DeadlineExceededError) or (deadline and deadline.expired()):
+                raise flight.error
+            # The shared request ran out of its caller's deadline, not ours: send it again
+            with self._lock:
+                self._coalesced -= 1
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently outstanding."""
+        with self._lock:
+            return len(self._flights)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(self._sent, self._coalesced)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._sent = self._coalesced = 0
@@ -0,0 +1,223 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental parsing of list responses.
+
+A list endpoint's body is one JSON object whose item array (orders, fills,
+transactions, ...) can run to many megabytes. Decoding it with response.json()
+buffers the body, builds the whole dict tree and then copies it into models, so
+peak memory is a multiple of the payload and nothing can be processed until
+the last byte has arrived. Here the body is read in chunks and the item array
+is parsed element by element, each element decoded into its model and yielded
+while the rest of the response is still in flight:
+
+    for fill in client.iter_list_portfolio_fills(request, page_size=1000, stream=True):
+        writer.write(fill)
+
+Only the partially received element and the other top-level fields (such as
+pagination) are held in memory.
+"""
+
+import codecs
+import json
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union, get_type_hints
+
+from prime_sdk.client import Client, record_request
+from prime_sdk.lazy import lazy_decoding_enabled
+from prime_sdk.pagination import _first_pagination, _next_cursor
+from prime_sdk.timeouts import Deadline, Timeout, call_options
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+
+class _JsonReader:
+    """A cursor over JSON text that is decoded from byte chunks as it is needed."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.scanner = json.JSONDecoder()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk, dropping text already consumed; returns False at the end of the body."""
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self.decoder.decode(b"", final=True)
+        else:
+            text = self.decoder.decode(chunk)
+        self.text = self.text[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end of the body."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, *characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            expected = " or ".join(repr(c) for c in characters)
+            raise json.JSONDecodeError(f"Expecting {expected}", self.text, self.pos)
+        self.pos += 1
+        return character
+
+    def value(self) -> Any:
+        """Parse the next complete JSON value, reading more of the body until it is available."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.scanner.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if type(value) in (int, float) and not self.number_ends(end) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def number_ends(self, end: int) -> bool:
+        """Whether a number parsed up to end is complete, rather than cut off by the end of the buffer."""
+        while end < len(self.text) and self.text[end] in _NUMBER_CHARACTERS:
+            end += 1
+        return end < len(self.text)
+
+
+def iter_json_array(chunks: Iterable[bytes], items_field: str,
+                    fields: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """
+    Parse a JSON object from byte chunks, yielding the elements of one of its array fields.
+
+    Args:
+        chunks: The UTF-8 encoded body, in chunks of any size
+        items_field: The top-level field holding the array, e.g. "fills"
+        fields: If given, receives the object's other top-level fields as they are parsed;
+            it is complete once the generator is exhausted
+
+    Raises json.JSONDecodeError if the body is not a JSON object.
+    """
+    if fields is None:
+        fields = {}
+    reader = _JsonReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == items_field and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(",", "]") == "]":
+                        break
+        else:
+            fields[key] = reader.value()
+        if reader.expect(",", "}") == "}":
+            return
+
+
+def _item_decoder(response_type: type, items_field: str, lazy: bool) -> Callable[[Any], Any]:
+    # imported here so that importing the unified client stays cheap
+    from prime_sdk.base_response import _field_converter, full_depth_decoding_enabled
+    hint = get_type_hints(response_type)[items_field]
+    item_type = (getattr(hint, "__args__", None) or (None,))[0]
+    full_depth = not lazy and full_depth_decoding_enabled()
+    convert = _field_converter(item_type, lazy, full_depth) if item_type is not None else None
+    return convert or (lambda item: item)
+
+
+def _iter_page(response: Any, decode: Callable[[Any], Any], items_field: str, fields: Dict[str, Any],
+               chunk_size: int) -> Iterator[Any]:
+    try:
+        for item in iter_json_array(response.iter_content(chunk_size), items_field, fields):
+            yield decode(item)
+    finally:
+        response.close()
+
+
+def iter_streamed_items(client: Client, module: str, method: str, request: Any, items_field: str,
+                        page_size: Optional[int] = None, max_items: Optional[int] = None,
+                        deadline: Union[Deadline, float, None] = None, timeout: Optional[Timeout] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE, lazy: Optional[bool] = None) -> Iterator[Any]:
+    """
+    Yield the items of every page of a list endpoint, parsing each page while it is received.
+
+    The streaming counterpart of pagination.iter_items; it follows next_cursor the same way.
+
+    Args:
+        client: The Client to send requests with
+        module: Endpoint module name, e.g. "list_portfolio_fills"
+        method: Endpoint method name, usually the same as module
+        request: The endpoint's request dataclass
+        items_field: The response field holding the page's items, e.g. "fills"
+        page_size: Optional page size sent as the pagination limit
+        max_items: Stop after this many items, closing the connection without reading the rest
+        deadline: Optional deadline, in seconds or as a Deadline, for sending all requests
+        timeout: Connect and read timeout for each request; the read timeout applies to every chunk
+        chunk_size: Number of bytes read from the connection at a time
+        lazy: Decode items lazily; defaults to whether lazy decoding is enabled for the caller
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    if lazy is None:
+        lazy = lazy_decoding_enabled()
+    pagination = _first_pagination(request, page_size)
+    deadline = Deadline.of(deadline)
+    decode = None
+    count = 0
+    while True:
+        if deadline:
+            deadline.check()
+        recorded, response_type = record_request(client.credentials, module, method,
+                                                 replace(request, pagination=pagination))
+        if decode is None:
+            decode = _item_decoder(response_type, items_field, lazy)
+        with call_options(deadline=deadline, timeout=timeout):
+            response = client.request(recorded.method, recorded.path, query=recorded.query, body=recorded.body,
+                                      allowed_status_codes=recorded.allowed_status_codes, stream=True)
+        fields = {}
+        items = _iter_page(response, decode, items_field, fields, chunk_size)
+        try:
+            for item in items:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+        finally:
+            items.close()
+        cursor = _next_cursor(response_type(**fields))
+        if cursor is None:
+            return
+        pagination = replace(pagination, cursor=cursor)
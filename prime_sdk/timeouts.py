@@ -0,0 +1,119 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-request timeouts and per-call deadlines.
+
+A timeout bounds a single HTTP attempt: a number of seconds for both connecting
+and reading, or a (connect, read) tuple as accepted by requests. A deadline
+bounds a whole call, including rate-limit waits, retries and pagination.
+Callers can also declare a call idempotent, e.g. a POST that carries a
+client-generated id, so that the retry policy may resend it. All three are
+carried to the client through a context variable, so they apply to every
+request made inside call_options(), in threads and asyncio tasks alike.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple, Union
+
+from prime_sdk.errors import DeadlineExceededError
+
+Timeout = Union[float, Tuple[Optional[float], Optional[float]]]
+
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+
+class Deadline:
+    """A point in time, on the monotonic clock, by which a call must finish."""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    @staticmethod
+    def of(value: Union['Deadline', float, None]) -> Optional['Deadline']:
+        """Accept either a Deadline or a budget in seconds from now."""
+        if value is None or isinstance(value, Deadline):
+            return value
+        return Deadline(value)
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        if self.expired():
+            raise DeadlineExceededError("deadline exceeded")
+
+    def allows(self, seconds: float) -> bool:
+        """Whether waiting `seconds` still leaves time before the deadline."""
+        return seconds < self.remaining()
+
+
+@dataclass(frozen=True)
+class CallOptions:
+    deadline: Optional[Deadline] = None
+    timeout: Optional[Timeout] = None
+    idempotent: bool = False
+
+
+_call_options = ContextVar("prime_sdk_call_options", default=CallOptions())
+
+
+def current_call_options() -> CallOptions:
+    return _call_options.get()
+
+
+@contextmanager
+def call_options(deadline: Union[Deadline, float, None] = None, timeout: Optional[Timeout] = None,
+                 idempotent: Optional[bool] = None) -> Iterator[CallOptions]:
+    """
+    Apply a deadline, timeout and/or idempotency to every request made inside the block.
+
+    Nested blocks can shorten an enclosing deadline but never extend it. With
+    idempotent=True, requests are retried like GETs whatever their method; only
+    use it when resending cannot apply an operation twice.
+    """
+    current = _call_options.get()
+    deadline = Deadline.of(deadline)
+    if current.deadline and (deadline is None or current.deadline.expires_at < deadline.expires_at):
+        deadline = current.deadline
+    options = CallOptions(deadline, timeout if timeout is not None else current.timeout,
+                          idempotent if idempotent is not None else current.idempotent)
+    token = _call_options.set(options)
+    try:
+        yield options
+    finally:
+        _call_options.reset(token)
+
+
+def split_timeout(timeout: Optional[Timeout]) -> Tuple[Optional[float], Optional[float]]:
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
+
+
+def clamp_timeout(timeout: Optional[Timeout],
+                  deadline: Optional[Deadline]) -> Tuple[Optional[float], Optional[float]]:
+    """The (connect, read) timeout of one attempt, shortened to end by the deadline."""
+    connect, read = split_timeout(timeout)
+    if deadline is None:
+        return connect, read
+    remaining = max(deadline.remaining(), 0.001)
+    return (min(connect, remaining) if connect is not None else remaining,
+            min(read, remaining) if read is not None else remaining)
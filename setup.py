@@ -21,6 +21,12 @@ setup(
     install_requires=[
         'requests',
     ],
+    extras_require={
+        'async': ['httpx'],
+        'frames': ['numpy'],
+        'arrow': ['pyarrow'],
+        'json': ['orjson'],
+    },
     entry_points={
         'console_scripts': [
             'prime-sdk=prime_sdk.__main__:main',
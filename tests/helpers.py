@@ -0,0 +1,38 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Builders for the JSON payloads the tests decode."""
+
+import dataclasses
+from typing import get_type_hints
+
+
+def payload_for(model):
+    """A JSON object with every field of model set, recursing into nested models."""
+    payload = {}
+    for name, hint in get_type_hints(model).items():
+        inner = hint.__args__[0] if getattr(hint, '__origin__', None) is list else hint
+        value = payload_for(inner) if dataclasses.is_dataclass(inner) else name
+        payload[name] = [value] if inner is not hint else value
+    return payload
+
+
+def fill_payload(index=0, **fields):
+    """A JSON object for Fill number index, with fields overriding the defaults."""
+    product_id = fields.get("product_id", "BTC-USD")
+    payload = dict(id=f"fill-{index}", order_id=f"order-{index}", product_id=product_id, client_product_id=product_id,
+                   side="BUY", filled_quantity="0.5", filled_value="30000", price="60000",
+                   time=f"2025-01-01T00:00:{index % 60:02d}.500Z", commission="0.1", venue="COINBASE")
+    payload.update(fields)
+    return payload
@@ -0,0 +1,95 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A local stand-in for the Prime API that replays scripted responses."""
+
+import json
+import threading
+import time
+import unittest
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from prime_sdk import PrimeClient
+from prime_sdk.credentials import Credentials
+
+CREDENTIALS = Credentials("key", "passphrase", "secret", "portfolio", "entity", "account")
+
+
+class StubServer:
+    def __init__(self):
+        self.responses = deque()
+        self.requests = []
+        self.default = (200, {}, {})
+        self.handler = None
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                server.requests.append((self.command, self.path, dict(self.headers), body, time.monotonic()))
+                if server.handler:
+                    status, headers, payload = server.handler(self.command, self.path, body)
+                else:
+                    status, headers, payload = server.responses.popleft() if server.responses else server.default
+                if callable(payload):
+                    payload = payload()
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.01,), daemon=True)
+
+    def enqueue(self, status, payload=None, headers=None):
+        self.responses.append((status, headers or {}, payload if payload is not None else {}))
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class StubServerTestCase(unittest.TestCase):
+    """Runs a StubServer for every test; make_client returns a PrimeClient pointed at it."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    def make_client(self, handler=None, credentials=CREDENTIALS, **kwargs):
+        if handler is not None:
+            self.server.handler = handler
+        client = PrimeClient(credentials, **kwargs)
+        client.client.http_base_url = self.server.base_url
+        self.addCleanup(client.close)
+        return client
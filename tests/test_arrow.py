@@ -0,0 +1,134 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import unittest
+from decimal import Decimal
+
+from prime_sdk.lazy import lazy_decoding
+from prime_sdk.list_activities import ListActivitiesResponse
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsResponse
+from prime_sdk.model import Accrual, Activity, Fill
+from helpers import fill_payload
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from prime_sdk.arrow import record_batches, schema_for, to_table, write_parquet
+except ImportError:
+    pa = None
+
+
+ACTIVITY = dict(id="activity-1", reference_id="ref", category="ORDER", type="BUY", secondary_type="NONE",
+                status="DONE", created_by="user-1", title="Buy", description="",
+                user_actions=[dict(action="CREATE", user_id="user-1", timestamp="2025-01-01T00:00:00Z")],
+                symbols=["BTC", "USD"], created_at="2025-01-01T00:00:00Z")
+
+
+@unittest.skipUnless(pa, "pyarrow is not installed")
+class TestSchema(unittest.TestCase):
+    def test_column_types(self):
+        schema = schema_for(Fill)
+        self.assertEqual(schema.names[:2], ["id", "order_id"])
+        self.assertEqual(schema.field("price").type, pa.decimal128(38, 18))
+        self.assertEqual(schema.field("time").type, pa.timestamp("us", tz="UTC"))
+        self.assertEqual(schema.field("side").type, pa.dictionary(pa.int32(), pa.string()))
+        self.assertEqual(schema.field("id").type, pa.string())
+
+    def test_nested_and_list_fields(self):
+        schema = schema_for(Activity)
+        self.assertEqual(schema.field("symbols").type, pa.list_(pa.string()))
+        self.assertEqual(schema.field("user_actions").type, pa.string())
+        self.assertEqual(schema.field("user_actions").metadata, {b"encoding": b"json"})
+
+    def test_decimal_type(self):
+        self.assertEqual(schema_for(Accrual, pa.decimal128(20, 8)).field("spread").type, pa.decimal128(20, 8))
+
+
+@unittest.skipUnless(pa, "pyarrow is not installed")
+class TestRecordBatches(unittest.TestCase):
+    def test_values(self):
+        records = [fill_payload(0, side="SELL", price="60000.12", commission="0.000000000000000001"),
+                   fill_payload(1, price="60000.12", commission="", venue_fees=None)]
+        table = to_table([Fill(**record) for record in records], Fill)
+        self.assertEqual(table.column("price").to_pylist(), [Decimal("60000.12")] * 2)
+        self.assertEqual(table.column("commission").to_pylist(), [Decimal("1E-18"), None])
+        self.assertEqual(str(table.column("time")[1]), "2025-01-01 00:00:01.500000+00:00")
+        self.assertEqual(table.column("side").to_pylist(), ["SELL", "BUY"])
+        self.assertEqual(to_table(records, Fill), table)
+
+    def test_nanosecond_and_offset_timestamps(self):
+        records = [fill_payload(0), fill_payload(1), fill_payload(2)]
+        records[0]["time"] = "2025-01-31T12:00:00.123456789Z"
+        records[1]["time"] = "2025-01-31T14:00:00.5+02:00"
+        records[2]["time"] = "2025-01-31T12:00:00-00:30"
+        times = [str(value) for value in to_table(records, Fill).column("time")]
+        self.assertEqual(times, ["2025-01-31 12:00:00.123456+00:00", "2025-01-31 12:00:00.500000+00:00",
+                                 "2025-01-31 12:30:00+00:00"])
+
+    def test_nested_values(self):
+        activities = ListActivitiesResponse(activities=[ACTIVITY]).activities
+        row = to_table(activities, Activity).to_pylist()[0]
+        self.assertEqual(json.loads(row["user_actions"]), ACTIVITY["user_actions"])
+        self.assertEqual(row["symbols"], ["BTC", "USD"])
+        self.assertIsNone(row["account_metadata"])
+        self.assertEqual(to_table([ACTIVITY], Activity).to_pylist()[0], row)
+
+    def test_lazy_records(self):
+        with lazy_decoding():
+            fills = ListPortfolioFillsResponse(fills=[fill_payload(0), fill_payload(1)]).fills
+        self.assertEqual(to_table(fills, Fill), to_table([fill_payload(0), fill_payload(1)], Fill))
+
+    def test_consumes_records_in_batches(self):
+        consumed = []
+
+        def records():
+            for index in range(5):
+                consumed.append(index)
+                yield fill_payload(index)
+
+        batches = record_batches(records(), Fill, batch_size=2)
+        self.assertEqual(next(batches).num_rows, 2)
+        self.assertEqual(consumed, [0, 1])
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+
+    def test_excess_precision_is_an_error(self):
+        with self.assertRaises(pa.ArrowInvalid):
+            to_table([fill_payload(0, commission="0.0000000000000000001")], Fill)
+
+
+@unittest.skipUnless(pa, "pyarrow is not installed")
+class TestWriteParquet(unittest.TestCase):
+    def test_round_trip(self):
+        sink = io.BytesIO()
+        rows = write_parquet((fill_payload(index) for index in range(5)), sink, Fill, batch_size=2)
+        self.assertEqual(rows, 5)
+        sink.seek(0)
+        parquet = pq.ParquetFile(sink)
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+        table = parquet.read()
+        self.assertEqual(table.column("id").to_pylist(), [f"fill-{index}" for index in range(5)])
+        self.assertEqual(table.column("commission").to_pylist(), [Decimal("0.1")] * 5)
+        self.assertEqual(table.schema.field("side").type, pa.dictionary(pa.int32(), pa.string()))
+
+    def test_empty(self):
+        sink = io.BytesIO()
+        self.assertEqual(write_parquet([], sink, Accrual), 0)
+        sink.seek(0)
+        self.assertEqual(pq.read_table(sink).schema.names, schema_for(Accrual).names)
+
+
+if __name__ == '__main__':
+    unittest.main()
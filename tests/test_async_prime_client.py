@@ -0,0 +1,144 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import unittest
+
+from prime_sdk import PrimeClient
+from prime_sdk.credentials import Credentials
+from prime_sdk.create_order import CreateOrderRequest, CreateOrderResponse
+from prime_sdk.list_orders import ListOrdersRequest, ListOrdersResponse
+from prime_sdk.get_order import GetOrderRequest
+from prime_sdk.model import Order
+from prime_sdk.retry import RetryPolicy
+
+try:
+    import httpx
+    from prime_sdk import AsyncPrimeClient
+except ImportError:
+    httpx = None
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncPrimeClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.credentials = Credentials(
+            access_key="test_access_key",
+            passphrase="test_passphrase",
+            signing_key="test_signing_key",
+            portfolio_id="test_portfolio_id",
+            entity_id="test_entity_id",
+            svc_account_id="test_svc_account_id"
+        )
+        self.requests = []
+
+    def make_client(self, payload):
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(200, json=payload)
+        transport = httpx.MockTransport(handler)
+        return AsyncPrimeClient(self.credentials, http_client=httpx.AsyncClient(transport=transport))
+
+    def test_same_method_surface(self):
+        """Test that every PrimeClient operation has an async counterpart"""
+        sync_methods = {name for name in dir(PrimeClient) if not name.startswith("_")}
+        for name in sync_methods - {"close"}:
+            if name.startswith("iter_"):
+                self.assertTrue(callable(getattr(AsyncPrimeClient, name)), name)
+            else:
+                self.assertTrue(asyncio.iscoroutinefunction(getattr(AsyncPrimeClient, name)), name)
+
+    async def test_list_orders(self):
+        """Test that a GET is built by the endpoint module and decoded into its response type"""
+        order = dict.fromkeys(Order.__dataclass_fields__, "x")
+        client = self.make_client({"orders": [order], "pagination": None})
+        response = await client.list_orders(ListOrdersRequest(portfolio_id="p1", product_ids="BTC-USD"))
+        await client.close()
+
+        self.assertIsInstance(response, ListOrdersResponse)
+        self.assertIsInstance(response.orders[0], Order)
+        request = self.requests[0]
+        self.assertEqual(request.method, "GET")
+        self.assertEqual(request.url.path, "/v1/portfolios/p1/orders")
+        self.assertEqual(request.url.query, b"product_ids=BTC-USD")
+        self.assertIn("X-CB-ACCESS-SIGNATURE", request.headers)
+
+    async def test_create_order_signs_sent_body(self):
+        """Test that the body sent is the one that was signed"""
+        client = self.make_client({"order_id": "order-1"})
+        request = CreateOrderRequest(portfolio_id="p1", side="BUY", client_order_id="c1",
+                                     product_id="BTC-USD", type="MARKET", base_quantity="1")
+        async with client:
+            response = await client.create_order(request)
+
+        self.assertIsInstance(response, CreateOrderResponse)
+        self.assertEqual(response.order_id, "order-1")
+        sent = self.requests[0]
+        body = json.loads(sent.content)
+        self.assertEqual(body["client_order_id"], "c1")
+        timestamp = sent.headers["X-CB-ACCESS-TIMESTAMP"]
+        expected = client.client.sign(f"{timestamp}POST/v1/portfolios/p1/order{sent.content.decode()}")
+        self.assertEqual(sent.headers["X-CB-ACCESS-SIGNATURE"], expected)
+
+    async def test_retries_with_policy(self):
+        """Test that the async transport follows the retry policy"""
+        statuses = [503, 200]
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(statuses.pop(0), json={})
+
+        client = AsyncPrimeClient(self.credentials, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                  retry_policy=RetryPolicy(base_delay=0.001))
+        async with client:
+            response = await client.get_order(GetOrderRequest(portfolio_id="p1", order_id="o1"))
+        self.assertIsNone(response.order)
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_iter_list_orders(self):
+        """Test that async iteration follows next_cursor across pages"""
+        order = dict.fromkeys(Order.__dataclass_fields__, "x")
+        pages = [
+            {"orders": [dict(order, id="o1"), dict(order, id="o2")],
+             "pagination": {"next_cursor": "c2", "has_next": True}},
+            {"orders": [dict(order, id="o3")], "pagination": {"next_cursor": "", "has_next": False}},
+        ]
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(200, json=pages[len(self.requests) - 1])
+
+        client = AsyncPrimeClient(self.credentials, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with client:
+            ids = [o.id async for o in client.iter_list_orders(ListOrdersRequest(portfolio_id="p1"), page_size=2)]
+        self.assertEqual(ids, ["o1", "o2", "o3"])
+        self.assertEqual(self.requests[0].url.params["limit"], "2")
+        self.assertEqual(self.requests[1].url.params["cursor"], "c2")
+
+    async def test_concurrent_calls(self):
+        """Test that many calls can be awaited concurrently on one loop"""
+        order = dict.fromkeys(Order.__dataclass_fields__, "x")
+        client = self.make_client({"orders": [order], "pagination": {"next_cursor": "", "has_next": False}})
+        async with client:
+            responses = await asyncio.gather(*[
+                client.list_orders(ListOrdersRequest(portfolio_id=f"p{i}")) for i in range(500)
+            ])
+        self.assertEqual(len(responses), 500)
+        self.assertIsInstance(responses[0].orders[0], Order)
+        self.assertEqual(len(self.requests), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
-from dataclasses import dataclass
-from typing import List, Optional
-from prime_sdk.base_response import BaseResponse
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional
+from unittest.mock import patch
+from prime_sdk.base_response import BaseResponse, full_depth_decoding
+from helpers import payload_for
 
 # Create a test response class that inherits from BaseResponse
 @dataclass
@@ -66,5 +68,95 @@ class TestBaseResponse(unittest.TestCase):
         self.assertIsInstance(response2.nested_list[0], NestedModel)
         self.assertEqual(response2.nested_list[0].name, 'item1')
 
+    def test_type_hints_resolved_once_per_class(self):
+        from prime_sdk import base_response
+
+        @dataclass
+        class NestedModel:
+            name: str
+
+        @dataclass
+        class CachedResponse(BaseResponse):
+            nested: NestedModel = None
+            items: List[NestedModel] = None
+            plain: Optional[str] = None
+
+        with patch.object(base_response, 'get_type_hints', wraps=base_response.get_type_hints) as hints:
+            for _ in range(3):
+                response = CachedResponse(nested={'name': 'a'}, items=[{'name': 'b'}], plain='c')
+        # once for the response class; the nested model is built as it is
+        self.assertEqual(hints.call_count, 1)
+        self.assertEqual(response.nested, NestedModel('a'))
+        self.assertEqual(response.items, [NestedModel('b')])
+        self.assertEqual([name for name, _ in base_response.decode_plan(CachedResponse)], ['nested', 'items'])
+
+    def test_full_depth_decoding(self):
+        from prime_sdk.get_margin_information import GetMarginInformationResponse
+        from prime_sdk.list_margin_call_summaries import ListMarginCallSummariesResponse
+        from prime_sdk.list_orders import ListOrdersResponse
+        from prime_sdk.model import MarginCallRecord, MarginInformation, MarginSummary, Order, OrderEditHistory
+
+        margin_summary = payload_for(MarginSummary)
+        information = {'margin_call_records': [payload_for(MarginCallRecord)], 'margin_summary': margin_summary}
+        response = GetMarginInformationResponse(margin_information=information)
+        self.assertIsInstance(response.margin_information, MarginInformation)
+        self.assertIsInstance(response.margin_information.margin_summary, dict)
+
+        with full_depth_decoding():
+            response = GetMarginInformationResponse(margin_information=information)
+            summaries = ListMarginCallSummariesResponse(margin_summaries=[
+                {'conversion_datetime': 't', 'conversion_date': 'd', 'margin_summary': margin_summary}])
+            orders = ListOrdersResponse(orders=[
+                dict(payload_for(Order), order_edit_history=[payload_for(OrderEditHistory)])])
+        self.assertIsInstance(response.margin_information, MarginInformation)
+        self.assertIsInstance(response.margin_information.margin_summary, MarginSummary)
+        self.assertIsInstance(response.margin_information.margin_call_records[0], MarginCallRecord)
+        for f in fields(MarginSummary):
+            self.assertNotIsInstance(getattr(response.margin_information.margin_summary, f.name), dict, f.name)
+        self.assertIsInstance(summaries.margin_summaries[0].margin_summary, MarginSummary)
+        self.assertIsInstance(orders.orders[0].order_edit_history[0], OrderEditHistory)
+
+    def test_full_depth_skips_unknown_nested_keys(self):
+        from prime_sdk.list_margin_call_summaries import ListMarginCallSummariesResponse
+        from prime_sdk.model import MarketRate, MarginSummary
+
+        record = {'conversion_datetime': 't', 'conversion_date': 'd',
+                  'margin_summary': dict(payload_for(MarginSummary), unexpected='x',
+                                         market_rates=[{'symbol': 'BTC', 'rate': '1', 'unexpected': 'x'}])}
+        with full_depth_decoding():
+            summaries = ListMarginCallSummariesResponse(margin_summaries=[record])
+        summary = summaries.margin_summaries[0].margin_summary
+        self.assertIsInstance(summary, MarginSummary)
+        self.assertEqual(summary.entity_id, 'entity_id')
+        self.assertFalse(hasattr(summary, 'unexpected'))
+        self.assertEqual(summary.market_rates, [MarketRate(symbol='BTC', rate='1')])
+
+    def test_top_level_records_keep_constructor_errors(self):
+        from prime_sdk.list_orders import ListOrdersResponse
+        from prime_sdk.model import Order
+
+        with self.assertRaises(TypeError):
+            ListOrdersResponse(orders=[dict(payload_for(Order), unexpected='x')])
+
+    def test_optional_and_dict_fields(self):
+        @dataclass
+        class Leaf:
+            name: str
+
+        @dataclass
+        class Branch:
+            leaf: Optional[Leaf] = None
+            by_key: Dict[str, Leaf] = None
+
+        @dataclass
+        class TreeResponse(BaseResponse):
+            branches: Optional[List[Branch]] = None
+
+        with full_depth_decoding():
+            response = TreeResponse(branches=[{'leaf': {'name': 'a'}, 'by_key': {'k': {'name': 'b'}}}, {}])
+        self.assertEqual(response.branches[0], Branch(Leaf('a'), {'k': Leaf('b')}))
+        self.assertEqual(response.branches[1], Branch())
+
+
 if __name__ == '__main__':
     unittest.main() 
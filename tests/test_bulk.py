@@ -0,0 +1,164 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+import httpx
+
+from prime_sdk import AsyncPrimeClient
+from prime_sdk.create_order import CreateOrderRequest, CreateOrderResponse
+from prime_sdk.enums import OrderSide, OrderType
+from prime_sdk.errors import DeadlineExceededError, PrimeAPIError
+from prime_sdk.rate_limit import RateLimiter, TokenBucket
+from prime_sdk.retry import RetryPolicy
+from stub_server import CREDENTIALS, StubServerTestCase
+
+
+def order(index, product_id="BTC-USD", client_order_id=""):
+    return CreateOrderRequest(portfolio_id="p1", side=OrderSide.BUY, client_order_id=client_order_id,
+                              product_id=product_id, type=OrderType.MARKET, base_quantity=f"0.{index + 1}")
+
+
+class OrderDesk:
+    """Accepts orders, rejects product BAD, and optionally fails or delays chosen attempts."""
+
+    def __init__(self, delay=0.0, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.in_flight = self.max_in_flight = 0
+        self.received = []
+
+    def __call__(self, method, path, body):
+        order = json.loads(body)
+        with self.lock:
+            self.received.append(order)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.failures > 0
+            self.failures -= fail
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if fail:
+            return 503, {}, {"message": "unavailable"}
+        if order["product_id"] == "BAD":
+            return 400, {}, {"message": "unknown product"}
+        return 200, {}, {"order_id": "order-" + order["client_order_id"]}
+
+
+class TestCreateOrdersBulk(StubServerTestCase):
+    def test_results_in_input_order(self):
+        client = self.make_client(OrderDesk())
+        requests = [order(i, product_id="BAD" if i == 3 else "BTC-USD", client_order_id=f"c{i}") for i in range(6)]
+        results = client.create_orders_bulk(requests, concurrency=3)
+        self.assertEqual([r.request for r in results], requests)
+        self.assertEqual([r.ok for r in results], [True, True, True, False, True, True])
+        self.assertEqual(results[0].order_id, "order-c0")
+        self.assertIsInstance(results[0].response, CreateOrderResponse)
+        self.assertIsInstance(results[3].error, PrimeAPIError)
+        self.assertEqual(results[3].error.status_code, 400)
+        self.assertIsNone(results[3].order_id)
+
+    def test_client_order_ids_filled_in(self):
+        desk = OrderDesk()
+        client = self.make_client(desk)
+        results = client.create_orders_bulk([order(0), order(1), order(2, client_order_id="mine")])
+        ids = [r.request.client_order_id for r in results]
+        self.assertEqual(ids[2], "mine")
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(sorted(o["client_order_id"] for o in desk.received), sorted(ids))
+        self.assertEqual([r.order_id for r in results], ["order-" + i for i in ids])
+
+    def test_bounded_concurrency(self):
+        desk = OrderDesk(delay=0.05)
+        client = self.make_client(desk)
+        start = time.monotonic()
+        results = client.create_orders_bulk([order(i) for i in range(12)], concurrency=4)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(desk.max_in_flight, 4)
+        self.assertLess(time.monotonic() - start, 12 * 0.05)
+
+    def test_rate_limit(self):
+        limiter = RateLimiter(groups={"orders": TokenBucket(rate=50, capacity=1)})
+        client = self.make_client(OrderDesk(), rate_limiter=limiter)
+        start = time.monotonic()
+        results = client.create_orders_bulk([order(i) for i in range(6)], concurrency=6)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertGreaterEqual(time.monotonic() - start, 5 / 50 * 0.9)
+
+    def test_default_order_rate_without_rate_limiter(self):
+        client = self.make_client(OrderDesk())
+        with mock.patch("prime_sdk.prime_client.default_bucket", lambda: TokenBucket(rate=50, capacity=1)):
+            start = time.monotonic()
+            results = client.create_orders_bulk([order(i) for i in range(6)], concurrency=6)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertGreaterEqual(time.monotonic() - start, 5 / 50 * 0.9)
+
+    def test_concurrency_must_be_positive(self):
+        client = self.make_client(OrderDesk())
+        for concurrency in (0, -1):
+            with self.assertRaises(ValueError):
+                client.create_orders_bulk([order(0)], concurrency=concurrency)
+
+    def test_unknown_outcome_resent_with_same_client_order_id(self):
+        desk = OrderDesk(failures=1)
+        policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+        client = self.make_client(desk, retry_policy=policy)
+        results = client.create_orders_bulk([order(0, client_order_id="c0")])
+        self.assertTrue(results[0].ok)
+        self.assertEqual([o["client_order_id"] for o in desk.received], ["c0", "c0"])
+
+        desk.failures = 1
+        with self.assertRaises(PrimeAPIError):
+            client.create_order(order(1, client_order_id="c1"))
+
+    def test_deadline(self):
+        client = self.make_client(OrderDesk(delay=0.05))
+        results = client.create_orders_bulk([order(i) for i in range(6)], concurrency=1, deadline=0.08)
+        self.assertTrue(results[0].ok)
+        self.assertIsInstance(results[-1].error, DeadlineExceededError)
+
+    def test_empty(self):
+        self.assertEqual(self.make_client(OrderDesk()).create_orders_bulk([]), [])
+
+
+class TestAsyncCreateOrdersBulk(unittest.IsolatedAsyncioTestCase):
+    async def test_results_in_input_order(self):
+        desk = OrderDesk()
+
+        def handler(request):
+            status, _, payload = desk(request.method, request.url.path, request.content)
+            return httpx.Response(status, json=payload)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPrimeClient(CREDENTIALS, http_client=http_client) as client:
+            requests = [order(i, product_id="BAD" if i == 1 else "BTC-USD") for i in range(5)]
+            results = await client.create_orders_bulk(requests, concurrency=2)
+        self.assertEqual([r.ok for r in results], [True, False, True, True, True])
+        self.assertEqual([r.order_id for r in results if r.ok],
+                         ["order-" + r.request.client_order_id for r in results if r.ok])
+
+    async def test_concurrency_must_be_positive(self):
+        async with AsyncPrimeClient(CREDENTIALS) as client:
+            with self.assertRaises(ValueError):
+                await client.create_orders_bulk([order(0)], concurrency=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
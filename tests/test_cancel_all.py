@@ -0,0 +1,214 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+from prime_sdk import AsyncPrimeClient, PrimeClient
+from prime_sdk.client import new_http_client
+from prime_sdk.enums import OrderSide
+from prime_sdk.errors import PrimeAPIError
+from prime_sdk.model import Order
+from stub_server import CREDENTIALS, StubServerTestCase
+
+
+class OrderBook:
+    """
+    Open orders of one portfolio. Cancels take effect after `lag` listings, ids in `stuck` are
+    rejected, and each listing first adds the next batch of `arrivals`.
+    """
+
+    def __init__(self, orders, lag=0, stuck=(), delay=0.0):
+        self.orders = {o["id"]: o for o in orders}
+        self.lag = lag
+        self.stuck = set(stuck)
+        self.delay = delay
+        self.pending = {}
+        self.arrivals = []
+        self.lock = threading.Lock()
+        self.in_flight = self.max_in_flight = 0
+        self.cancels = []
+        self.listings = 0
+
+    def __call__(self, method, path, body):
+        url = urlsplit(path)
+        if method == "GET":
+            return 200, {}, {"orders": self.list(parse_qs(url.query))}
+        order_id = url.path.split("/")[-2]
+        with self.lock:
+            self.cancels.append(order_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+            if order_id in self.stuck:
+                return 400, {}, {"message": "order cannot be cancelled"}
+            self.pending[order_id] = self.lag
+        return 200, {}, {"id": order_id}
+
+    def list(self, query):
+        with self.lock:
+            self.listings += 1
+            for order_id, lag in list(self.pending.items()):
+                if lag == 0:
+                    self.orders.pop(order_id, None)
+                    del self.pending[order_id]
+                else:
+                    self.pending[order_id] = lag - 1
+            if self.arrivals:
+                self.orders.update((o["id"], o) for o in self.arrivals.pop(0))
+            return [o for o in self.orders.values()
+                    if o["product_id"] in query.get("product_ids", [o["product_id"]])
+                    and o["side"] in query.get("order_side", [o["side"]])]
+
+
+def orders(count, product_id="BTC-USD", side="BUY", prefix="o"):
+    return [dict(dict.fromkeys(Order.__dataclass_fields__), id=f"{prefix}{i}", product_id=product_id, side=side)
+            for i in range(count)]
+
+
+class TestCancelAllOpenOrders(StubServerTestCase):
+    def test_flattens_book(self):
+        book = OrderBook(orders(20), delay=0.05)
+        client = self.make_client(book)
+        start = time.monotonic()
+        result = client.cancel_all_open_orders("p1", concurrency=10, verify_interval=0.01)
+        self.assertTrue(result.flat)
+        self.assertEqual(sorted(result.cancelled), sorted(o["id"] for o in orders(20)))
+        self.assertEqual(result.failed, {})
+        self.assertEqual(result.remaining, [])
+        self.assertEqual(result.rounds, 2)
+        self.assertEqual(book.max_in_flight, 10)
+        self.assertLess(time.monotonic() - start, 20 * 0.05)
+        self.assertLessEqual(result.time_to_flatten, result.elapsed)
+
+    def test_filters_by_product_and_side(self):
+        book = OrderBook(orders(3) + orders(2, product_id="ETH-USD", prefix="e")
+                         + orders(2, side="SELL", prefix="s"))
+        client = self.make_client(book)
+        result = client.cancel_all_open_orders("p1", product_ids=["BTC-USD"], side=OrderSide.BUY,
+                                               verify_interval=0.01)
+        self.assertTrue(result.flat)
+        self.assertEqual(sorted(result.cancelled), ["o0", "o1", "o2"])
+        self.assertEqual(sorted(book.orders), ["e0", "e1", "s0", "s1"])
+        self.assertIn("order_side=BUY", self.server.requests[0][1])
+
+    def test_waits_for_pending_cancels_without_resending(self):
+        book = OrderBook(orders(3), lag=2)
+        client = self.make_client(book)
+        result = client.cancel_all_open_orders("p1", verify_interval=0.01)
+        self.assertTrue(result.flat)
+        self.assertEqual(result.rounds, 4)
+        self.assertEqual(sorted(book.cancels), ["o0", "o1", "o2"])
+
+    def test_cancels_orders_placed_meanwhile(self):
+        book = OrderBook(orders(2))
+        book.arrivals = [[], orders(1, prefix="late")]
+        client = self.make_client(book)
+        result = client.cancel_all_open_orders("p1", verify_interval=0.01)
+        self.assertTrue(result.flat)
+        self.assertEqual(sorted(result.cancelled), ["late0", "o0", "o1"])
+        self.assertEqual(result.rounds, 3)
+
+    def test_deadline_reports_remaining(self):
+        book = OrderBook(orders(3), stuck={"o1"})
+        client = self.make_client(book)
+        result = client.cancel_all_open_orders("p1", deadline=0.2, verify_interval=0.05)
+        self.assertFalse(result.flat)
+        self.assertIsNone(result.time_to_flatten)
+        self.assertEqual([o.id for o in result.remaining], ["o1"])
+        self.assertEqual(list(result.failed), ["o1"])
+        self.assertIsInstance(result.failed["o1"], PrimeAPIError)
+        self.assertGreater(book.cancels.count("o1"), 1)
+        self.assertLess(result.elapsed, 0.3)
+
+    def test_uses_separate_connection_pool(self):
+        client = self.make_client(OrderBook(orders(1)))
+        client.cancel_all_open_orders("p1", verify_interval=0.01)
+        self.assertIsNotNone(client._priority_client)
+        self.assertIsNot(client._priority_client.http_client, client.client.http_client)
+        self.assertEqual(client._priority_client.http_base_url, self.server.base_url)
+
+    def test_separate_pool_keeps_session_settings(self):
+        session = new_http_client(keep_alive=False)
+        session.headers["X-Desk"] = "rates"
+        session.proxies = {"https": "http://proxy.test:3128"}
+        session.verify = "/etc/ssl/desk.pem"
+        session.trust_env = False
+        client = PrimeClient(CREDENTIALS, http_client=session)
+        client._priority_endpoint("cancel_order", 4)
+        priority = client._priority_client.http_client
+        self.assertIsNot(priority, session)
+        self.assertEqual(priority.headers["X-Desk"], "rates")
+        self.assertEqual(priority.headers["Connection"], "close")
+        self.assertEqual(priority.proxies, session.proxies)
+        self.assertEqual((priority.verify, priority.trust_env), ("/etc/ssl/desk.pem", False))
+        self.assertEqual(priority.get_adapter("https://")._pool_maxsize, 4)
+
+        client._priority_endpoint("cancel_order", 16)
+        client._priority_endpoint("cancel_order", 8)
+        self.assertIs(client._priority_client.http_client, priority)
+        self.assertEqual(priority.get_adapter("https://")._pool_maxsize, 16)
+        client.close()
+
+    def test_concurrency_must_be_positive(self):
+        book = OrderBook(orders(1))
+        with self.assertRaises(ValueError):
+            self.make_client(book).cancel_all_open_orders("p1", concurrency=0)
+        self.assertEqual(book.listings, 0)
+
+    def test_empty_book(self):
+        result = self.make_client(OrderBook([])).cancel_all_open_orders("p1")
+        self.assertTrue(result.flat)
+        self.assertEqual((result.cancelled, result.rounds), ([], 1))
+
+
+class TestAsyncCancelAllOpenOrders(unittest.IsolatedAsyncioTestCase):
+    async def test_flattens_book(self):
+        book = OrderBook(orders(6), stuck={"o4"})
+
+        def handler(request):
+            status, _, payload = book(request.method, str(request.url.raw_path, "ascii"), request.content)
+            return httpx.Response(status, json=payload)
+
+        client = AsyncPrimeClient(CREDENTIALS, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            client.client.http_base_url = "http://prime.test/v1"
+            result = await client.cancel_all_open_orders("p1", concurrency=4, deadline=0.2, verify_interval=0.05)
+            self.assertIsNone(client._priority_client)
+        self.assertFalse(result.flat)
+        self.assertEqual(sorted(result.cancelled), ["o0", "o1", "o2", "o3", "o5"])
+        self.assertEqual([o.id for o in result.remaining], ["o4"])
+
+    async def test_separate_pool_grows(self):
+        client = AsyncPrimeClient(CREDENTIALS)
+        async with client:
+            client._priority_endpoint("cancel_order", 4)
+            first = client._priority_client
+            client._priority_endpoint("cancel_order", 2)
+            self.assertIs(client._priority_client, first)
+            client._priority_endpoint("cancel_order", 8)
+            self.assertIsNot(client._priority_client, first)
+            self.assertEqual(client._retired_clients, [first])
+        self.assertTrue(first.http_client.is_closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
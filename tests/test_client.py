@@ -0,0 +1,90 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import hashlib
+import hmac
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from prime_sdk import json_codec
+from prime_sdk.client import Client
+from prime_sdk.credentials import Credentials
+from prime_sdk.enums import OrderSide
+
+
+class TestClient(unittest.TestCase):
+    def setUp(self):
+        self.credentials = Credentials(
+            access_key="test_access_key",
+            passphrase="test_passphrase",
+            signing_key="test_signing_key",
+            portfolio_id="test_portfolio_id",
+            entity_id="test_entity_id",
+            svc_account_id="test_svc_account_id"
+        )
+        self.session = Mock()
+        self.session.request.return_value = Mock(status_code=200)
+        self.client = Client(self.credentials, http_client=self.session)
+
+    def expected_signature(self, message: bytes) -> str:
+        digest = hmac.new(b"test_signing_key", message, hashlib.sha256).digest()
+        return base64.b64encode(digest).decode()
+
+    def test_signing_key_encoded_once(self):
+        self.assertEqual(self.credentials.signing_key_bytes, b"test_signing_key")
+
+    def test_post_signs_the_bytes_it_sends(self):
+        body = {"product_id": "BTC-USD", "side": OrderSide.BUY, "note": "é/"}
+        self.addCleanup(json_codec.use, None)
+        for codec in json_codec.available().values():
+            json_codec.use(codec)
+            with patch.object(codec, "dumps", wraps=codec.dumps) as dumps:
+                self.client.request("POST", "/portfolios/p1/order", body=body)
+            self.assertEqual(dumps.call_count, 1, codec.name)
+
+            _, kwargs = self.session.request.call_args
+            data = kwargs["data"]
+            self.assertNotIn("json", kwargs)
+            self.assertEqual(json.loads(data), {"product_id": "BTC-USD", "side": "BUY", "note": "é/"})
+
+            headers = kwargs["headers"]
+            message = f"{headers['X-CB-ACCESS-TIMESTAMP']}POST/v1/portfolios/p1/order".encode() + data
+            self.assertEqual(headers["X-CB-ACCESS-SIGNATURE"], self.expected_signature(message), codec.name)
+            self.assertEqual(headers["Content-Type"], "application/json")
+
+    def test_get_has_no_body(self):
+        self.client.request("GET", "/portfolios", query="limit=10")
+        args, kwargs = self.session.request.call_args
+        self.assertEqual(args, ("GET", "https://api.prime.coinbase.com/v1/portfolios?limit=10"))
+        self.assertIsNone(kwargs["data"])
+
+        headers = kwargs["headers"]
+        message = f"{headers['X-CB-ACCESS-TIMESTAMP']}GET/v1/portfolios".encode()
+        self.assertEqual(headers["X-CB-ACCESS-SIGNATURE"], self.expected_signature(message))
+        self.assertNotIn("Content-Type", headers)
+
+    def test_sign_matches_sign_bytes(self):
+        self.assertEqual(self.client.sign("message"), self.client.sign_bytes(b"message"))
+
+    def test_unexpected_status_raises(self):
+        self.session.request.return_value = Mock(status_code=400, text="bad",
+                                                 json=Mock(return_value={"message": "invalid"}))
+        with self.assertRaisesRegex(Exception, "status 400: invalid"):
+            self.client.request("GET", "/portfolios")
+
+
+if __name__ == '__main__':
+    unittest.main()
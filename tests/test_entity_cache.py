@@ -0,0 +1,172 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+
+import httpx
+
+from prime_sdk import AsyncPrimeClient
+from prime_sdk.entity_cache import EntityCache, EntityCacheStats, ShelveEntityStore, SqliteEntityStore
+from prime_sdk.get_activity import GetActivityRequest
+from prime_sdk.get_order import GetOrderRequest, GetOrderResponse
+from prime_sdk.model import Activity, Order
+from stub_server import CREDENTIALS, StubServerTestCase
+
+
+def order_payload(order_id, status):
+    return {"order": dict(dict.fromkeys(Order.__dataclass_fields__), id=order_id, status=status)}
+
+
+class Orders:
+    """Serves orders whose status is set in `statuses`, keyed by order id."""
+
+    def __init__(self, **statuses):
+        self.statuses = statuses
+
+    def __call__(self, method, path, body):
+        order_id = path.split("/")[-1]
+        return 200, {}, order_payload(order_id, self.statuses[order_id])
+
+
+class TestEntityCache(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.orders = Orders(o1="FILLED", o2="OPEN", o3="CANCELLED")
+        self.server.handler = self.orders
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def get(self, client, order_id, portfolio_id="p1"):
+        return client.get_order(GetOrderRequest(portfolio_id, order_id)).order.status
+
+    def test_only_terminal_entities_are_cached(self):
+        cache = EntityCache()
+        client = self.make_client(entity_cache=cache)
+        for _ in range(3):
+            self.assertEqual(self.get(client, "o1"), "FILLED")
+            self.assertEqual(self.get(client, "o2"), "OPEN")
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(cache.stats(), EntityCacheStats(hits=2, misses=4, stored=1, not_terminal=3))
+
+        self.orders.statuses["o2"] = "FILLED"
+        self.assertEqual(self.get(client, "o2"), "FILLED")
+        self.assertEqual(self.get(client, "o2"), "FILLED")
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertIsInstance(cache.get("order", "o2", CREDENTIALS.access_key, "p1"), GetOrderResponse)
+        self.assertIsNone(cache.get("order", "o2"))
+
+    def test_other_kinds(self):
+        cache = EntityCache()
+        response = type("Response", (), {})()
+        response.activity = Activity(**dict(dict.fromkeys(Activity.__dataclass_fields__), id="a1",
+                                            status="ACTIVITY_STATUS_PROCESSING"))
+        self.assertFalse(cache.put("activity", "a1", response, portfolio_id="p1"))
+        response.activity.status = "ACTIVITY_STATUS_COMPLETED"
+        self.assertTrue(cache.put("activity", "a1", response, portfolio_id="p1"))
+        self.assertIs(cache.fetch("get_activity", None, GetActivityRequest("p1", "a1")), response)
+        self.assertTrue(cache.caches("get_allocation_by_id"))
+        self.assertFalse(cache.caches("list_orders"))
+
+    def test_scoped_by_access_key_and_portfolio(self):
+        path = os.path.join(self.directory, "entities.db")
+        cache = EntityCache(store=SqliteEntityStore(path))
+        self.addCleanup(cache.close)
+        self.get(self.make_client(entity_cache=cache), "o1")
+        self.get(self.make_client(entity_cache=cache), "o1")
+        self.assertEqual(len(self.server.requests), 1)
+
+        other = self.make_client(entity_cache=cache, credentials=replace(CREDENTIALS, access_key="other-key"))
+        self.assertEqual(self.get(other, "o1"), "FILLED")
+        self.assertEqual(len(self.server.requests), 2)
+        self.get(self.make_client(entity_cache=cache), "o1", portfolio_id="p2")
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(cache.store), 3)
+
+        cache.invalidate("order", "o1")
+        self.assertEqual((len(cache), len(cache.store)), (0, 0))
+
+    def test_sqlite_store_survives_restart(self):
+        path = os.path.join(self.directory, "entities.db")
+        cache = EntityCache(store=SqliteEntityStore(path))
+        self.get(self.make_client(entity_cache=cache), "o1")
+        cache.close()
+
+        cache = EntityCache(store=SqliteEntityStore(path))
+        self.addCleanup(cache.close)
+        self.assertEqual(self.get(self.make_client(entity_cache=cache), "o1"), "FILLED")
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(cache.stats(), EntityCacheStats(hits=1, disk_hits=1))
+
+    def test_shelve_store_survives_restart(self):
+        path = os.path.join(self.directory, "entities")
+        cache = EntityCache(store=ShelveEntityStore(path))
+        self.get(self.make_client(entity_cache=cache), "o3")
+        cache.close()
+
+        cache = EntityCache(store=ShelveEntityStore(path))
+        self.addCleanup(cache.close)
+        self.assertEqual(self.get(self.make_client(entity_cache=cache), "o3"), "CANCELLED")
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(len(cache.store), 1)
+
+    def test_memory_cap_falls_back_to_store(self):
+        cache = EntityCache(store=SqliteEntityStore(os.path.join(self.directory, "entities.db")), max_entries=1)
+        self.addCleanup(cache.close)
+        client = self.make_client(entity_cache=cache)
+        self.get(client, "o1")
+        self.get(client, "o3")
+        self.assertEqual(len(cache), 1)
+        self.get(client, "o1")
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(cache.stats().disk_hits, 1)
+
+    def test_invalidate(self):
+        cache = EntityCache(store=SqliteEntityStore(os.path.join(self.directory, "entities.db")))
+        self.addCleanup(cache.close)
+        client = self.make_client(entity_cache=cache)
+        self.get(client, "o1")
+        self.get(client, "o3")
+        cache.invalidate("order", "o1")
+        self.assertIsNone(cache.get("order", "o1", CREDENTIALS.access_key, "p1"))
+        self.assertIsNotNone(cache.get("order", "o3", CREDENTIALS.access_key, "p1"))
+        cache.invalidate("order")
+        self.assertEqual((len(cache), len(cache.store)), (0, 0))
+
+
+class TestAsyncEntityCache(unittest.IsolatedAsyncioTestCase):
+    async def test_only_terminal_entities_are_cached(self):
+        orders = Orders(o1="EXPIRED", o2="PENDING")
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            status, _, payload = orders(request.method, request.url.path, request.content)
+            return httpx.Response(status, json=payload)
+
+        cache = EntityCache()
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPrimeClient(CREDENTIALS, http_client=http_client, entity_cache=cache) as client:
+            for _ in range(2):
+                for order_id in ("o1", "o2"):
+                    await client.get_order(GetOrderRequest("p1", order_id))
+        self.assertEqual(len(sent), 3)
+        self.assertEqual(cache.stats().stored, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
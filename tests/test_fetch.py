@@ -0,0 +1,150 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+import unittest
+from dataclasses import replace
+from unittest import mock
+
+import httpx
+
+from prime_sdk import AsyncPrimeClient
+from prime_sdk.entity_cache import EntityCache
+from prime_sdk.errors import PrimeAPIError
+from prime_sdk.get_transaction import GetTransactionResponse
+from prime_sdk.model import Transaction
+from prime_sdk.rate_limit import TokenBucket
+from stub_server import CREDENTIALS, StubServerTestCase
+
+
+class Transactions:
+    """Serves transactions; ids starting with "done" are complete, ids starting with "missing" are not found."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = self.max_in_flight = 0
+        self.paths = []
+
+    def __call__(self, method, path, body):
+        with self.lock:
+            self.paths.append(path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        transaction_id = path.split("/")[-1]
+        if transaction_id.startswith("missing"):
+            return 404, {}, {"message": "not found"}
+        status = "TRANSACTION_DONE" if transaction_id.startswith("done") else "TRANSACTION_PROCESSING"
+        return 200, {}, {"transaction": dict(dict.fromkeys(Transaction.__dataclass_fields__), id=transaction_id,
+                                             status=status)}
+
+
+class TestFetchMany(StubServerTestCase):
+    def test_results_by_id(self):
+        transactions = Transactions()
+        client = self.make_client(transactions)
+        results = client.fetch_many("transaction", ["t1", "missing", "t2", "t1"], portfolio_id="p1")
+        self.assertEqual(list(results), ["t1", "missing", "t2"])
+        self.assertEqual(len(transactions.paths), 3)
+        self.assertIn("/v1/portfolios/p1/transactions/t2", transactions.paths)
+        self.assertIsInstance(results["t1"].response, GetTransactionResponse)
+        self.assertEqual(results["t2"].response.transaction.id, "t2")
+        self.assertFalse(results["missing"].ok)
+        self.assertIsInstance(results["missing"].error, PrimeAPIError)
+        self.assertEqual(results["missing"].error.status_code, 404)
+
+    def test_bounded_concurrency(self):
+        transactions = Transactions(delay=0.05)
+        client = self.make_client(transactions)
+        start = time.monotonic()
+        results = client.fetch_many("transaction", [f"t{i}" for i in range(12)], concurrency=4)
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(transactions.max_in_flight, 4)
+        self.assertLess(time.monotonic() - start, 12 * 0.05)
+        self.assertTrue(all(path.startswith("/v1/portfolios/portfolio/") for path in transactions.paths))
+
+    def test_served_from_entity_cache(self):
+        transactions = Transactions()
+        cache = EntityCache()
+        client = self.make_client(transactions, entity_cache=cache)
+        client.fetch_many("transaction", ["done1", "t1"])
+        results = client.fetch_many("transaction", ["done1", "t1", "done2"])
+        self.assertEqual([r.cached for r in results.values()], [True, False, False])
+        self.assertEqual(len(transactions.paths), 4)
+        self.assertIsNotNone(cache.get("transaction", "done2", CREDENTIALS.access_key, CREDENTIALS.portfolio_id))
+        self.assertEqual(cache.stats().hits, 2)
+
+    def test_entity_cache_scoped_by_access_key_and_portfolio(self):
+        transactions = Transactions()
+        cache = EntityCache()
+        self.make_client(transactions, entity_cache=cache).fetch_many("transaction", ["done1"])
+        other = self.make_client(transactions, entity_cache=cache,
+                                 credentials=replace(CREDENTIALS, access_key="other-key"))
+        self.assertFalse(other.fetch_many("transaction", ["done1"])["done1"].cached)
+        client = self.make_client(transactions, entity_cache=cache)
+        self.assertFalse(client.fetch_many("transaction", ["done1"], portfolio_id="p2")["done1"].cached)
+        self.assertTrue(client.fetch_many("transaction", ["done1"])["done1"].cached)
+        self.assertEqual(len(transactions.paths), 3)
+
+    def test_default_rate_without_rate_limiter(self):
+        client = self.make_client(Transactions())
+        with mock.patch("prime_sdk.prime_client.default_bucket", lambda: TokenBucket(rate=50, capacity=1)):
+            start = time.monotonic()
+            results = client.fetch_many("transaction", [f"t{i}" for i in range(6)], concurrency=6)
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertGreaterEqual(time.monotonic() - start, 5 / 50 * 0.9)
+
+    def test_concurrency_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            self.make_client(Transactions()).fetch_many("transaction", ["t1"], concurrency=0)
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            self.make_client(Transactions()).fetch_many("fill", ["f1"])
+
+    def test_empty(self):
+        self.assertEqual(self.make_client(Transactions()).fetch_many("order", []), {})
+
+
+class TestAsyncFetchMany(unittest.IsolatedAsyncioTestCase):
+    async def test_results_by_id(self):
+        transactions = Transactions()
+
+        def handler(request):
+            status, _, payload = transactions(request.method, request.url.path, request.content)
+            return httpx.Response(status, json=payload)
+
+        cache = EntityCache()
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPrimeClient(CREDENTIALS, http_client=http_client, entity_cache=cache) as client:
+            await client.fetch_many("transaction", ["done1"], concurrency=2)
+            results = await client.fetch_many("transaction", ["done1", "t1", "missing", "t1"], concurrency=2)
+        self.assertEqual(list(results), ["done1", "t1", "missing"])
+        self.assertEqual([r.ok for r in results.values()], [True, True, False])
+        self.assertTrue(results["done1"].cached)
+        self.assertEqual(len(transactions.paths), 3)
+
+    async def test_concurrency_must_be_positive(self):
+        async with AsyncPrimeClient(CREDENTIALS) as client:
+            with self.assertRaises(ValueError):
+                await asyncio.wait_for(client.fetch_many("transaction", ["t1"], concurrency=0), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import warnings
+
+from prime_sdk.frames import FillFrame, OrderFrame, parse_scaled_column, parse_timestamp_column
+from prime_sdk.list_orders import ListOrdersResponse
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsResponse
+from prime_sdk.model import Fill, Order
+from helpers import fill_payload
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+FILLS = [fill_payload(0),
+         fill_payload(1, product_id="ETH-USD", side="SELL", filled_quantity="2", filled_value="6000", price="3000"),
+         fill_payload(2, filled_quantity="0.25", filled_value="15250", price="61000", commission="")]
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestFillFrame(unittest.TestCase):
+    def test_columns(self):
+        frame = FillFrame.from_records(FILLS)
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(frame["price"].dtype, np.float64)
+        self.assertEqual(frame["price"].tolist(), [60000.0, 3000.0, 61000.0])
+        self.assertTrue(np.isnan(frame["commission"][2]))
+        self.assertEqual(frame["time"].dtype, np.dtype("datetime64[us]"))
+        self.assertEqual(str(frame["time"][1]), "2025-01-01T00:00:01.500000")
+        self.assertEqual(frame.categories["side"].tolist(), ["BUY", "SELL"])
+        self.assertEqual(frame.codes("side").tolist(), [0, 1, 0])
+        self.assertEqual(frame["product_id"].tolist(), ["BTC-USD", "ETH-USD", "BTC-USD"])
+        self.assertEqual(frame["id"].tolist(), ["fill-0", "fill-1", "fill-2"])
+
+    def test_from_models_and_response(self):
+        from_dicts = FillFrame.from_records(FILLS)
+        from_models = FillFrame.from_records(Fill(**f) for f in FILLS)
+        from_response = FillFrame.from_response(ListPortfolioFillsResponse(fills=FILLS))
+        for frame in (from_models, from_response):
+            self.assertEqual(frame["filled_value"].tolist(), from_dicts["filled_value"].tolist())
+
+    def test_aggregations(self):
+        frame = FillFrame.from_records(FILLS)
+        self.assertEqual(frame.notional_by_product(), {"BTC-USD": 45250.0, "ETH-USD": 6000.0})
+        self.assertEqual(frame.quantity_by_product(), {"BTC-USD": 0.75, "ETH-USD": 2.0})
+        self.assertEqual(frame.sum_by("commission", "side"), {"BUY": 0.1, "SELL": 0.1})
+
+    def test_exact_scaled_columns(self):
+        fills = [fill_payload(0, filled_quantity="0.1"), fill_payload(1, filled_quantity="0.2")]
+        frame = FillFrame.from_records(fills, scale=8)
+        self.assertEqual(frame.scale, 8)
+        self.assertEqual(frame["filled_quantity"].dtype, np.int64)
+        self.assertEqual(frame.quantity_by_product(), {"BTC-USD": 30000000})
+
+    def test_parse_scaled_column(self):
+        self.assertEqual(parse_scaled_column(["1.5", "-0.25", "", None, "10", ".5", "2.500"], 2).tolist(),
+                         [150, -25, 0, 0, 1000, 50, 250])
+        with self.assertRaises(ValueError):
+            parse_scaled_column(["0.001"], 2)
+        with self.assertRaises(ValueError):
+            parse_scaled_column(["123456789012"], 8)
+
+    def test_parse_timestamp_column(self):
+        values = ["2025-01-31T12:00:00.123Z", "2025-01-31T14:00:00.5+02:00", "2025-01-31T12:00:00+00:00",
+                  "2025-01-31T12:00:00.123456789Z", "", None]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            column = parse_timestamp_column(values)
+        self.assertEqual([str(value) for value in column],
+                         ["2025-01-31T12:00:00.123000", "2025-01-31T12:00:00.500000", "2025-01-31T12:00:00.000000",
+                          "2025-01-31T12:00:00.123456", "NaT", "NaT"])
+
+    def test_empty(self):
+        frame = FillFrame.from_records([])
+        self.assertEqual(len(frame), 0)
+        self.assertEqual(frame.notional_by_product(), {})
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestOrderFrame(unittest.TestCase):
+    def test_orders(self):
+        base = {name: "" for name in Order.__dataclass_fields__}
+        orders = [dict(base, id="o1", product_id="BTC-USD", status="FILLED", filled_value="100.5",
+                       created_at="2025-01-01T00:00:00Z"),
+                  dict(base, id="o2", product_id="BTC-USD", status="OPEN", filled_value="0",
+                       created_at="2025-01-02T00:00:00Z")]
+        frame = OrderFrame.from_response(ListOrdersResponse(orders=orders))
+        self.assertEqual(frame.notional_by_product(), {"BTC-USD": 100.5})
+        self.assertEqual(frame["status"].tolist(), ["FILLED", "OPEN"])
+        self.assertTrue(np.isnat(frame["expiry_time"]).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
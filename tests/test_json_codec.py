@@ -0,0 +1,112 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+from unittest.mock import patch
+
+from prime_sdk import PrimeClient, json_codec
+from prime_sdk.credentials import Credentials
+from prime_sdk.enums import OrderSide
+from prime_sdk.get_order import GetOrderResponse
+from prime_sdk.list_portfolios import ListPortfoliosRequest, ListPortfoliosResponse
+from stub_server import StubServer
+
+PAYLOAD = {"orders": [{"id": "o1", "side": "BUY", "quantity": "0.5", "note": "é/中"}], "count": 3,
+           "ratio": 0.25, "done": False, "cursor": None}
+
+
+class TestJsonCodec(unittest.TestCase):
+    def setUp(self):
+        self.codecs = json_codec.available()
+        self.addCleanup(json_codec.use, None)
+
+    def test_stdlib_always_available(self):
+        self.assertIn("stdlib", self.codecs)
+        self.assertEqual(list(self.codecs), [name for name in json_codec.CODECS if name in self.codecs])
+        self.assertIs(type(json_codec.current()), type(next(iter(self.codecs.values()))))
+
+    def test_round_trip(self):
+        for name, codec in self.codecs.items():
+            encoded = codec.dumps(dict(PAYLOAD, side=OrderSide.SELL))
+            self.assertIsInstance(encoded, bytes, name)
+            self.assertEqual(json.loads(encoded), dict(PAYLOAD, side="SELL"), name)
+            self.assertEqual(codec.loads(json.dumps(PAYLOAD).encode()), PAYLOAD, name)
+            self.assertEqual(json.loads(codec.dumps_pretty(PAYLOAD)), PAYLOAD, name)
+            self.assertIn('\n  "orders": [', codec.dumps_pretty(PAYLOAD), name)
+
+    def test_integers_beyond_64_bits(self):
+        big = 123456789012345678901234567890
+        for name, codec in self.codecs.items():
+            decoded = codec.loads(str(big).encode())
+            if name == "orjson":
+                self.assertEqual(decoded, float(big))
+            else:
+                self.assertEqual(decoded, big, name)
+                self.assertIsInstance(decoded, int, name)
+
+    def test_invalid_json_raises_value_error(self):
+        for name, codec in self.codecs.items():
+            with self.assertRaises(ValueError, msg=name):
+                codec.loads(b'{"orders": [')
+
+    def test_use(self):
+        self.assertEqual(json_codec.use("stdlib").name, "stdlib")
+        self.assertEqual(json_codec.dumps({"a": 1}), b'{"a": 1}')
+        with self.assertRaisesRegex(ValueError, "'simplejson'; expected one of orjson, ujson, stdlib"):
+            json_codec.use("simplejson")
+        with patch.dict("os.environ", {json_codec.JSON_BACKEND_ENV_VAR: "stdlib"}):
+            self.assertEqual(json_codec.use(None).name, "stdlib")
+
+    def test_invalid_environment_variable(self):
+        with patch.dict("os.environ", {json_codec.JSON_BACKEND_ENV_VAR: "fast"}):
+            with self.assertRaisesRegex(ValueError, "PRIME_SDK_JSON value 'fast'; expected one of"):
+                json_codec.use(None)
+
+    def test_codec_is_abstract(self):
+        with self.assertRaises(TypeError):
+            json_codec.JsonCodec()
+
+        class Partial(json_codec.JsonCodec):
+            def dumps(self, value):
+                return b""
+
+        with self.assertRaises(TypeError):
+            Partial()
+
+    def test_response_str(self):
+        response = GetOrderResponse(order=None)
+        for codec in self.codecs.values():
+            json_codec.use(codec)
+            self.assertEqual(json.loads(str(response)), {"order": None})
+
+
+class TestResponseDecoding(unittest.TestCase):
+    def test_responses_decoded_with_codec(self):
+        payload = {"portfolios": [{"id": "p1", "name": "Main é", "entity_id": "e1", "organization_id": "o1",
+                                   "entity_name": "Entity"}]}
+        with StubServer() as server:
+            server.default = (200, {}, payload)
+            with PrimeClient(Credentials("key", "passphrase", "secret", "portfolio", "entity", "account")) as client:
+                client.client.http_base_url = server.base_url
+                codec = json_codec.current()
+                with patch.object(codec, "loads", wraps=codec.loads) as loads:
+                    portfolios = client.list_portfolios(ListPortfoliosRequest())
+                self.assertEqual(loads.call_count, 1)
+        self.assertEqual(portfolios, ListPortfoliosResponse(**payload))
+        self.assertEqual(portfolios.portfolios[0].name, "Main é")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import dataclasses
+import json
+import pickle
+import unittest
+from unittest.mock import Mock
+
+from prime_sdk import PrimeClient
+from prime_sdk.base_response import full_depth_decoding
+from prime_sdk.credentials import Credentials
+from prime_sdk.get_margin_information import GetMarginInformationResponse
+from prime_sdk.lazy import LazyList, lazy_decoding, lazy_decoding_enabled
+from prime_sdk.list_orders import ListOrdersRequest, ListOrdersResponse
+from prime_sdk.model import MarginCallRecord, MarginInformation, MarginSummary, Order, OrderEditHistory
+from helpers import payload_for
+
+
+def orders_payload(count):
+    return {"orders": [dict(payload_for(Order), id=f"order-{i}") for i in range(count)],
+            "pagination": {"next_cursor": "", "sort_direction": "DESC", "has_next": False}}
+
+
+class TestLazyDecoding(unittest.TestCase):
+    def test_disabled_by_default(self):
+        self.assertFalse(lazy_decoding_enabled())
+        response = ListOrdersResponse(**orders_payload(2))
+        self.assertIsInstance(response.orders, list)
+        self.assertIs(type(response.orders[0]), Order)
+
+    def test_list_items_decoded_on_access(self):
+        payload = orders_payload(3)
+        with lazy_decoding():
+            response = ListOrdersResponse(**payload)
+        orders = response.orders
+        self.assertIsInstance(orders, LazyList)
+        self.assertEqual(len(orders), 3)
+        self.assertEqual([type(item) for item in list.__iter__(orders)], [dict, dict, dict])
+        order = orders[1]
+        self.assertIs(orders[1], order)
+        self.assertIsInstance(order, Order)
+        self.assertEqual(order.id, "order-1")
+        self.assertIsInstance(list.__getitem__(orders, 0), dict)
+        self.assertNotIn("status", vars(order))
+        self.assertEqual(order.status, "status")
+        self.assertIn("status", vars(order))
+        self.assertIsInstance(order.order_edit_history[0], dict)
+        self.assertIn(order, orders)
+        self.assertEqual(orders.index(order), 1)
+        self.assertIsInstance(list.__getitem__(orders, 0), Order)
+
+    def test_lazy_records_match_eager(self):
+        payload = orders_payload(2)
+        eager = ListOrdersResponse(**json.loads(json.dumps(payload)))
+        with lazy_decoding():
+            lazy = ListOrdersResponse(**json.loads(json.dumps(payload)))
+        self.assertIsInstance(eager.orders[0].order_edit_history[0], dict)
+        self.assertEqual(lazy.orders[0].order_edit_history, eager.orders[0].order_edit_history)
+        self.assert_same_records(lazy, eager)
+
+    def test_lazy_records_match_eager_at_full_depth(self):
+        payload = orders_payload(2)
+        with full_depth_decoding():
+            eager = ListOrdersResponse(**json.loads(json.dumps(payload)))
+            with lazy_decoding():
+                lazy = ListOrdersResponse(**json.loads(json.dumps(payload)))
+        self.assertIsInstance(eager.orders[0].order_edit_history[0], OrderEditHistory)
+        self.assertIsInstance(lazy.orders[0].order_edit_history[0], OrderEditHistory)
+        self.assert_same_records(lazy, eager)
+
+    def assert_same_records(self, lazy, eager):
+        self.assertEqual(lazy.orders, eager.orders)
+        self.assertEqual(eager.orders[0], lazy.orders[0])
+        self.assertEqual(dataclasses.asdict(lazy.orders[0]), dataclasses.asdict(eager.orders[0]))
+        self.assertEqual(repr(lazy.orders[0]), repr(eager.orders[0]))
+        self.assertEqual(str(lazy), str(eager))
+        self.assertEqual(lazy.orders[1:], eager.orders[1:])
+        self.assertEqual(json.loads(str(lazy)), json.loads(str(eager)))
+
+    def test_copy_and_pickle_produce_eager_models(self):
+        with lazy_decoding():
+            order = ListOrdersResponse(**orders_payload(1)).orders[0]
+        for clone in (copy.copy(order), copy.deepcopy(order), pickle.loads(pickle.dumps(order))):
+            self.assertIs(type(clone), Order)
+            self.assertEqual(clone, order)
+        with lazy_decoding():
+            orders = ListOrdersResponse(**orders_payload(2)).orders
+        self.assertIs(type(pickle.loads(pickle.dumps(orders))), list)
+        self.assertEqual(copy.deepcopy(orders), orders)
+
+    def test_defaults_and_missing_fields(self):
+        raw = payload_for(Order)
+        del raw["post_only"]
+        del raw["status"]
+        with lazy_decoding():
+            order = ListOrdersResponse(orders=[raw]).orders[0]
+        self.assertIsNone(order.post_only)
+        with self.assertRaises(AttributeError):
+            order.status
+        order.status = "FILLED"
+        self.assertEqual(order.status, "FILLED")
+
+    def test_nested_models(self):
+        payload = {"margin_information": {"margin_call_records": [payload_for(MarginCallRecord)],
+                                          "margin_summary": payload_for(MarginSummary)}}
+        with lazy_decoding():
+            information = GetMarginInformationResponse(**copy.deepcopy(payload)).margin_information
+        self.assertIsInstance(information, MarginInformation)
+        self.assertIsInstance(information.margin_summary, dict)
+        self.assertEqual(information, GetMarginInformationResponse(**copy.deepcopy(payload)).margin_information)
+
+        with lazy_decoding(), full_depth_decoding():
+            response = GetMarginInformationResponse(**copy.deepcopy(payload))
+        information = response.margin_information
+        self.assertIsInstance(information, MarginInformation)
+        self.assertIsInstance(information.margin_call_records, LazyList)
+        self.assertIsInstance(information.margin_summary, MarginSummary)
+        self.assertEqual(information.margin_summary.entity_id, "entity_id")
+
+    def test_client_option(self):
+        session = Mock()
+        session.request.return_value = Mock(status_code=200, content=json.dumps(orders_payload(2)).encode())
+        credentials = Credentials("key", "passphrase", "secret", "portfolio", "entity", "account")
+        lazy_client = PrimeClient(credentials, http_client=session, lazy_decoding=True)
+        self.assertIsInstance(lazy_client.list_orders(ListOrdersRequest(portfolio_id="p1")).orders, LazyList)
+        eager_client = PrimeClient(credentials, http_client=session)
+        self.assertIsInstance(eager_client.list_orders(ListOrdersRequest(portfolio_id="p1")).orders, list)
+        with lazy_decoding():
+            self.assertIsInstance(eager_client.list_orders(ListOrdersRequest(portfolio_id="p1")).orders, LazyList)
+
+
+if __name__ == '__main__':
+    unittest.main()
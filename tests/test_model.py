@@ -0,0 +1,107 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import dataclasses
+import pickle
+import unittest
+import weakref
+from decimal import Decimal
+from unittest.mock import patch
+
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsResponse
+from prime_sdk import decimals
+from prime_sdk.decimals import decimal_columns, money_fields
+from prime_sdk.model import Accrual, Activity, Balance, Fill, Order, Transaction
+from helpers import fill_payload
+
+FILL = fill_payload()
+
+
+class TestSlottedModels(unittest.TestCase):
+    def test_hot_models_have_no_instance_dict(self):
+        for model in (Activity, Balance, Fill, Order, Transaction):
+            self.assertTrue(dataclasses.is_dataclass(model), model)
+            self.assertEqual(model.__slots__, tuple(f.name for f in dataclasses.fields(model)) + ('__weakref__',))
+        self.assertFalse(hasattr(Fill(**FILL), '__dict__'))
+
+    def test_dataclass_behaviour_is_unchanged(self):
+        fill = Fill(**FILL)
+        self.assertIsNone(fill.venue_fees)
+        self.assertEqual(fill, Fill(**FILL))
+        self.assertEqual(dataclasses.asdict(fill)["venue_fees"], None)
+        self.assertEqual(dataclasses.replace(fill, price="101").price, "101")
+        self.assertEqual(pickle.loads(pickle.dumps(fill)), fill)
+        self.assertEqual(copy.deepcopy(fill), fill)
+        self.assertTrue(repr(fill).startswith("Fill(id='fill-0'"))
+        with self.assertRaises(AttributeError):
+            fill.unknown = 1
+        with self.assertRaises(TypeError):
+            Fill(**dict(FILL, unknown="x"))
+
+    def test_weak_references(self):
+        fill = Fill(**FILL)
+        self.assertIs(weakref.ref(fill)(), fill)
+        self.assertEqual(pickle.loads(pickle.dumps(fill)), fill)
+
+    def test_decoded_from_response(self):
+        response = ListPortfolioFillsResponse(fills=[FILL])
+        self.assertIsInstance(response.fills[0], Fill)
+        self.assertEqual(response.fills[0].id, "fill-0")
+
+
+class TestDecimalAccessors(unittest.TestCase):
+    def test_accessors(self):
+        fill = Fill(**dict(FILL, price="61234.56", filled_quantity="0.015"))
+        self.assertEqual(fill.price_decimal, Decimal("61234.56"))
+        self.assertEqual(fill.price_decimal * fill.filled_quantity_decimal, Decimal("918.51840"))
+        self.assertIsNone(fill.venue_fees_decimal)
+        self.assertEqual(money_fields(Fill)[:3], ("filled_quantity", "filled_value", "price"))
+        self.assertEqual(money_fields(Activity), ())
+
+    def test_columns_parse_once_per_string(self):
+        fills = [Fill(**dict(FILL, price="1.23456789")) for _ in range(3)]
+        with patch.object(decimals, "Decimal", wraps=Decimal) as parse:
+            decimal_columns(fills, ["price"])
+        self.assertEqual(parse.call_count, 1)
+
+    def test_reparsed_after_assignment(self):
+        fill = Fill(**FILL)
+        self.assertEqual(fill.price_decimal, Decimal("60000"))
+        fill.price = "101.5"
+        self.assertEqual(fill.price_decimal, Decimal("101.5"))
+        with self.assertRaises(AttributeError):
+            fill.price_decimal = Decimal("1")
+
+    def test_other_models(self):
+        balance = Balance(*["1.5"] * len(dataclasses.fields(Balance)))
+        self.assertEqual(balance.withdrawable_amount_decimal, Decimal("1.5"))
+        accrual = Accrual(**{f.name: "0.05" for f in dataclasses.fields(Accrual)})
+        self.assertEqual(accrual.interest_rate_decimal, Decimal("0.05"))
+        self.assertEqual(money_fields(Transaction), ("amount", "network_fees", "fees"))
+        self.assertEqual(money_fields(Order)[:2], ("base_quantity", "quote_value"))
+
+    def test_decimal_columns(self):
+        fills = [Fill(**dict(FILL, price=price)) for price in ("1.10", "2", "1.10")]
+        columns = decimal_columns(fills)
+        self.assertEqual(list(columns), list(money_fields(Fill)))
+        self.assertEqual(columns["price"], [Decimal("1.10"), Decimal("2"), Decimal("1.10")])
+        self.assertIs(columns["price"][0], columns["price"][2])
+        self.assertEqual(columns["venue_fees"], [None, None, None])
+        self.assertEqual(decimal_columns([FILL], ["price"]), {"price": [Decimal("60000")]})
+        self.assertEqual(decimal_columns([]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from prime_sdk import PrimeClient
+from prime_sdk.credentials import Credentials
+from prime_sdk.enums import AggregationType
+from prime_sdk.errors import DeadlineExceededError
+from prime_sdk.list_entity_balances import ListEntityBalancesRequest
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsRequest, ListPortfolioFillsResponse
+from prime_sdk.pagination import aiter_items, iter_items, iter_pages
+from prime_sdk.utils import Pagination, PaginationParams
+from stub_server import CREDENTIALS, StubServer
+
+
+def balance(symbol):
+    return {"symbol": symbol, "long_amount": "1", "long_notional": "1", "short_amount": "0", "short_notional": "0"}
+
+
+class FakeEndpoint:
+    """Serves fills in pages of `limit`, using the fill index as the cursor."""
+
+    def __init__(self, total, default_limit=3):
+        self.total = total
+        self.default_limit = default_limit
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        start = int(request.pagination.cursor or 0)
+        end = min(self.total, start + int(request.pagination.limit or self.default_limit))
+        has_next = end < self.total
+        return ListPortfolioFillsResponse(
+            fills=[f"fill-{i}" for i in range(start, end)],
+            pagination=Pagination(next_cursor=str(end) if has_next else "", has_next=has_next),
+        )
+
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        self.request = ListPortfolioFillsRequest(portfolio_id="p1", start_date="2025-01-01T00:00:00Z")
+
+    def test_iter_items_follows_cursor(self):
+        endpoint = FakeEndpoint(total=7)
+        fills = list(iter_items(endpoint, self.request, "fills"))
+        self.assertEqual(fills, [f"fill-{i}" for i in range(7)])
+        self.assertEqual([r.pagination.cursor for r in endpoint.requests], ["", "3", "6"])
+        self.assertIsNone(self.request.pagination)
+
+    def test_page_size(self):
+        endpoint = FakeEndpoint(total=10)
+        pages = list(iter_pages(endpoint, self.request, page_size=5))
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(endpoint.requests[0].pagination.limit, "5")
+
+    def test_starts_from_request_cursor(self):
+        endpoint = FakeEndpoint(total=5)
+        request = ListPortfolioFillsRequest(portfolio_id="p1", start_date="2025-01-01T00:00:00Z",
+                                            pagination=PaginationParams(cursor="3", sort_direction="DESC"))
+        self.assertEqual(list(iter_items(endpoint, request, "fills")), ["fill-3", "fill-4"])
+        self.assertEqual(endpoint.requests[0].pagination.sort_direction, "DESC")
+
+    def test_max_items_stops_fetching(self):
+        endpoint = FakeEndpoint(total=100)
+        self.assertEqual(len(list(iter_items(endpoint, self.request, "fills", max_items=4))), 4)
+        self.assertEqual(len(endpoint.requests), 2)
+
+    def test_lazy(self):
+        endpoint = FakeEndpoint(total=100)
+        items = iter_items(endpoint, self.request, "fills")
+        next(items)
+        self.assertEqual(len(endpoint.requests), 1)
+
+    def test_deadline_stops_pagination(self):
+        endpoint = FakeEndpoint(total=100)
+
+        def slow(request):
+            time.sleep(0.05)
+            return endpoint(request)
+
+        with self.assertRaises(DeadlineExceededError):
+            list(iter_items(slow, self.request, "fills", deadline=0.12))
+        self.assertLess(len(endpoint.requests), 5)
+
+    def test_unified_client_iterators(self):
+        client = PrimeClient(Credentials("key", "passphrase", "secret", "portfolio", "entity", "account"))
+        endpoint = FakeEndpoint(total=5)
+        with patch("prime_sdk.list_portfolio_fills.PrimeClient.list_portfolio_fills",
+                   side_effect=endpoint, autospec=False):
+            fills = list(client.iter_list_portfolio_fills(self.request, page_size=2))
+        self.assertEqual(fills, [f"fill-{i}" for i in range(5)])
+        self.assertEqual(len(endpoint.requests), 3)
+
+    def test_entity_balances_follow_cursor(self):
+        with StubServer() as server:
+            server.enqueue(200, {"balances": [balance("BTC")], "pagination": {"next_cursor": "c1", "has_next": True}})
+            server.enqueue(200, {"balances": [balance("ETH")], "pagination": {"next_cursor": "", "has_next": False}})
+            client = PrimeClient(CREDENTIALS)
+            self.addCleanup(client.close)
+            client.client.http_base_url = server.base_url
+            request = ListEntityBalancesRequest(entity_id="e1", aggregation_type=AggregationType.TOTAL_BALANCES)
+            balances = list(client.iter_list_entity_balances(request, page_size=1))
+        self.assertEqual([b.symbol for b in balances], ["BTC", "ETH"])
+        paths = [path for _, path, *_ in server.requests]
+        self.assertTrue(all(path.startswith("/v1/entities/e1/balances?aggregation_type=") for path in paths))
+        self.assertNotIn("cursor=", paths[0])
+        self.assertIn("cursor=c1", paths[1])
+
+
+class TestPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.request = ListPortfolioFillsRequest(portfolio_id="p1", start_date="2025-01-01T00:00:00Z")
+
+    def test_prefetch_yields_same_items(self):
+        endpoint = FakeEndpoint(total=20)
+        fills = list(iter_items(endpoint, self.request, "fills", prefetch=2))
+        self.assertEqual(fills, [f"fill-{i}" for i in range(20)])
+        self.assertEqual([r.pagination.cursor for r in endpoint.requests], ["", "3", "6", "9", "12", "15", "18"])
+
+    def test_next_page_fetched_while_consumer_busy(self):
+        endpoint = FakeEndpoint(total=9)
+        second_fetch = threading.Event()
+
+        def fetch(request):
+            page = endpoint(request)
+            if len(endpoint.requests) == 2:
+                second_fetch.set()
+            return page
+
+        pages = iter_pages(fetch, self.request, prefetch=1)
+        next(pages)
+        self.assertTrue(second_fetch.wait(1))
+        pages.close()
+
+    def test_bounded_buffer(self):
+        endpoint = FakeEndpoint(total=300)
+        pages = iter_pages(endpoint, self.request, prefetch=2)
+        next(pages)
+        time.sleep(0.2)
+        # one page consumed, two buffered and one held by the blocked producer
+        self.assertLessEqual(len(endpoint.requests), 4)
+        pages.close()
+
+    def test_close_stops_producer(self):
+        endpoint = FakeEndpoint(total=300)
+        list(iter_items(endpoint, self.request, "fills", max_items=1, prefetch=1))
+        time.sleep(0.3)
+        fetched = len(endpoint.requests)
+        time.sleep(0.2)
+        self.assertEqual(len(endpoint.requests), fetched)
+        self.assertLessEqual(fetched, 3)
+
+    def test_error_propagates(self):
+        endpoint = FakeEndpoint(total=9)
+
+        def fetch(request):
+            if request.pagination.cursor == "6":
+                raise ValueError("boom")
+            return endpoint(request)
+
+        items = []
+        with self.assertRaises(ValueError):
+            for item in iter_items(fetch, self.request, "fills", prefetch=2):
+                items.append(item)
+        self.assertEqual(len(items), 6)
+
+    def test_async_prefetch(self):
+        endpoint = FakeEndpoint(total=10)
+        fetched_ahead = []
+
+        async def fetch(request):
+            await asyncio.sleep(0)
+            return endpoint(request)
+
+        async def consume():
+            items = []
+            async for item in aiter_items(fetch, self.request, "fills", prefetch=2):
+                if item == "fill-0":
+                    await asyncio.sleep(0.05)
+                    fetched_ahead.append(len(endpoint.requests))
+                items.append(item)
+            return items
+
+        items = asyncio.run(consume())
+        self.assertEqual(items, [f"fill-{i}" for i in range(10)])
+        self.assertGreaterEqual(fetched_ahead[0], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
 import unittest
 from unittest.mock import Mock, patch
 from prime_sdk import PrimeClient
@@ -46,6 +48,48 @@ class TestPrimeClient(unittest.TestCase):
         self.assertIsNotNone(self.client._create_wallet)
         self.assertIsNotNone(self.client._create_withdrawal)
 
+    def test_sub_clients_share_connection_pool(self):
+        """Test that every sub-client sends requests through the same Client"""
+        self.assertIs(self.client._list_open_orders.client, self.client.client)
+        self.assertIs(self.client._create_order.client, self.client.client)
+        self.assertIs(self.client._cancel_order.client.http_client, self.client.client.http_client)
+
+    def test_pool_configuration(self):
+        """Test that pool size and keep-alive settings reach the shared session"""
+        client = PrimeClient(self.credentials, pool_maxsize=32, keep_alive=False)
+        adapter = client.client.http_client.get_adapter("https://api.prime.coinbase.com")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(client.client.http_client.headers["Connection"], "close")
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the shared session"""
+        client = PrimeClient(self.credentials)
+        with patch.object(client.client.http_client, 'close') as mock_close:
+            with client as entered:
+                self.assertIs(entered, client)
+            mock_close.assert_called_once_with()
+
+    def test_endpoint_clients_built_lazily(self):
+        """Test that endpoint clients are only built when first used"""
+        client = PrimeClient(self.credentials)
+        self.assertNotIn('_list_orders', vars(client))
+        endpoint_client = client._list_orders
+        self.assertIs(client._list_orders, endpoint_client)
+        self.assertIn('_list_orders', vars(client))
+        with self.assertRaises(AttributeError):
+            client._not_an_endpoint
+
+    def test_endpoint_modules_imported_lazily(self):
+        """Test that importing the unified client does not import endpoint modules"""
+        code = (
+            "import sys\n"
+            "from prime_sdk import PrimeClient\n"
+            "from prime_sdk.prime_client import ListOrdersRequest\n"
+            "print(sorted(m for m in ('prime_sdk.list_orders', 'prime_sdk.get_order') if m in sys.modules))\n"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        self.assertEqual(output.strip(), "['prime_sdk.list_orders']")
+
     def test_property_access(self):
         """Test that properties return bound methods"""
         # Properties should return the bound methods of underlying clients
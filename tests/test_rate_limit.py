@@ -0,0 +1,96 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from prime_sdk.client import Client
+from prime_sdk.credentials import Credentials
+from prime_sdk.rate_limit import RateLimiter, TokenBucket, endpoint_group
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_wait(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1)
+        self.assertAlmostEqual(bucket.reserve(), 0.2)
+
+    def test_refill_capped_at_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=5, clock=clock)
+        bucket.reserve(5)
+        self.assertEqual(bucket.fill_level, 0)
+        clock.now = 0.25
+        self.assertAlmostEqual(bucket.fill_level, 0.5)
+        clock.now = 100
+        self.assertEqual(bucket.tokens, 5)
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=200, capacity=10)
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 10 tokens were available up front, the other 40 refill at 200/s
+        self.assertGreaterEqual(time.monotonic() - start, 40 / 200 - 0.01)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_endpoint_groups(self):
+        self.assertEqual(endpoint_group("POST", "/portfolios/p1/order"), "orders")
+        self.assertEqual(endpoint_group("GET", "/portfolios/p1/open_orders"), "orders")
+        self.assertEqual(endpoint_group("POST", "/portfolios/p1/orders/o1/cancel"), "orders")
+        self.assertEqual(endpoint_group("GET", "/portfolios/p1/fills"), "default")
+
+    def test_groups_have_separate_buckets(self):
+        clock = FakeClock()
+        orders = TokenBucket(rate=1, capacity=1, clock=clock)
+        limiter = RateLimiter(default=TokenBucket(rate=1, capacity=1, clock=clock), groups={"orders": orders})
+        self.assertEqual(limiter.bucket("POST", "/portfolios/p1/order"), orders)
+        limiter.acquire("GET", "/portfolios/p1/fills")
+        self.assertEqual(limiter.fill_levels(), {"orders": 1.0, "default": 0.0})
+        self.assertEqual(limiter.throttled, 0)
+
+    def test_client_waits_for_tokens(self):
+        session = Mock()
+        session.request.return_value = Mock(status_code=200)
+        limiter = RateLimiter(default=TokenBucket(rate=20, capacity=1))
+        credentials = Credentials("key", "passphrase", "secret", "portfolio", "entity", "account")
+        client = Client(credentials, http_client=session, rate_limiter=limiter)
+
+        start = time.monotonic()
+        for _ in range(3):
+            client.request("GET", "/portfolios")
+        self.assertGreaterEqual(time.monotonic() - start, 2 / 20 - 0.01)
+        self.assertEqual(session.request.call_count, 3)
+        self.assertEqual(limiter.throttled, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from dataclasses import replace
+
+import httpx
+
+from prime_sdk import AsyncPrimeClient
+from prime_sdk.get_portfolio import GetPortfolioRequest
+from prime_sdk.response_cache import ResponseCache, ResponseCacheStats
+from stub_server import CREDENTIALS, StubServerTestCase
+
+
+class Portfolios:
+    """Serves portfolios whose name is the number of times they were requested; fails while `down` is set."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.down = False
+        self.count = 0
+
+    def __call__(self, method, path, body):
+        time.sleep(self.delay)
+        if self.down:
+            return 500, {}, {"message": "unavailable"}
+        self.count += 1
+        return 200, {}, {"portfolio": {"id": path.split("/")[-1], "name": str(self.count), "entity_id": "e1",
+                                       "organization_id": "o1", "entity_name": "Entity"}}
+
+
+class TestResponseCache(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.portfolios = Portfolios()
+        self.server.handler = self.portfolios
+
+    def get(self, client, portfolio_id="p1"):
+        return client.get_portfolio(GetPortfolioRequest(portfolio_id)).portfolio.name
+
+    def test_fresh_responses_served_from_cache(self):
+        cache = ResponseCache()
+        client = self.make_client(response_cache=cache)
+        self.assertEqual([self.get(client) for _ in range(3)], ["1", "1", "1"])
+        self.assertEqual(self.get(client, "p2"), "2")
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(cache.stats(), ResponseCacheStats(hits=2, misses=2))
+        self.assertEqual(cache.stats().hit_ratio, 0.5)
+        self.assertIsNotNone(cache.get("get_portfolio", GetPortfolioRequest("p1"), CREDENTIALS.access_key))
+
+    def test_scoped_by_credentials(self):
+        cache = ResponseCache()
+        client = self.make_client(response_cache=cache)
+        other = self.make_client(credentials=replace(CREDENTIALS, access_key="other-key"), response_cache=cache)
+        self.assertEqual([self.get(client), self.get(other), self.get(client), self.get(other)], ["1", "2", "1", "2"])
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("get_portfolio", GetPortfolioRequest("p1")))
+
+    def test_uncached_endpoints_pass_through(self):
+        cache = ResponseCache(ttls={"get_portfolio": None})
+        client = self.make_client(response_cache=cache)
+        self.assertEqual([self.get(client) for _ in range(2)], ["1", "2"])
+        self.assertFalse(cache.caches("get_order"))
+        self.assertEqual(cache.stats(), ResponseCacheStats())
+
+    def test_ttl_expiry(self):
+        client = self.make_client(response_cache=ResponseCache(ttls={"get_portfolio": 0.05}))
+        self.assertEqual(self.get(client), "1")
+        time.sleep(0.06)
+        self.assertEqual(self.get(client), "2")
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        client = self.make_client(response_cache=cache)
+        for portfolio_id in ("p1", "p2", "p1", "p3"):
+            self.get(client, portfolio_id)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get("get_portfolio", GetPortfolioRequest("p1"), CREDENTIALS.access_key))
+        self.assertIsNone(cache.get("get_portfolio", GetPortfolioRequest("p2"), CREDENTIALS.access_key))
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        client = self.make_client(response_cache=cache)
+        for portfolio_id in ("p1", "p2", "p3"):
+            self.get(client, portfolio_id)
+        self.assertEqual(cache.invalidate("get_portfolio", GetPortfolioRequest("p1"), CREDENTIALS.access_key), 1)
+        self.assertEqual(self.get(client, "p1"), "4")
+        self.assertEqual(cache.invalidate("get_portfolio", GetPortfolioRequest("p1"), "other-key"), 0)
+        other = self.make_client(response_cache=cache, credentials=replace(CREDENTIALS, access_key="other-key"))
+        self.get(other, "p1")
+        self.assertEqual(cache.invalidate("get_portfolio", GetPortfolioRequest("p1")), 2)
+        self.assertEqual(cache.invalidate("get_portfolio"), 2)
+        cache.put("list_assets", "request", "response")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_stale_while_revalidate(self):
+        self.portfolios.delay = 0.1
+        cache = ResponseCache(ttls={"get_portfolio": 0.05}, stale_while_revalidate=5)
+        client = self.make_client(response_cache=cache)
+        self.assertEqual(self.get(client), "1")
+        time.sleep(0.06)
+        start = time.monotonic()
+        self.assertEqual([self.get(client) for _ in range(3)], ["1", "1", "1"])
+        self.assertLess(time.monotonic() - start, 0.1)
+        time.sleep(0.15)
+        self.assertEqual(self.get(client), "2")
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(cache.stats(), ResponseCacheStats(hits=1, stale_hits=3, misses=1, refreshes=1))
+
+    def test_failed_refresh_keeps_stale_entry(self):
+        cache = ResponseCache(ttls={"get_portfolio": 0.05}, stale_while_revalidate=5)
+        client = self.make_client(response_cache=cache)
+        self.get(client)
+        time.sleep(0.06)
+        self.portfolios.down = True
+        self.assertEqual(self.get(client), "1")
+        time.sleep(0.05)
+        self.assertEqual(self.get(client), "1")
+        time.sleep(0.05)
+        self.assertEqual(cache.stats().refresh_errors, 2)
+
+
+class TestAsyncResponseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_fresh_responses_served_from_cache(self):
+        portfolios = Portfolios()
+
+        def handler(request):
+            status, _, payload = portfolios(request.method, request.url.path, request.content)
+            return httpx.Response(status, json=payload)
+
+        cache = ResponseCache()
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPrimeClient(CREDENTIALS, http_client=http_client, response_cache=cache) as client:
+            names = [(await client.get_portfolio(GetPortfolioRequest("p1"))).portfolio.name for _ in range(3)]
+        self.assertEqual(names, ["1", "1", "1"])
+        self.assertEqual(cache.stats(), ResponseCacheStats(hits=2, misses=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import time
+import unittest
+from email.utils import formatdate
+
+import requests
+
+from prime_sdk.client import Client
+from prime_sdk.credentials import Credentials
+from prime_sdk.errors import PrimeAPIError
+from prime_sdk.retry import RetryPolicy, parse_retry_after
+from stub_server import StubServer
+
+FAST = RetryPolicy(max_attempts=4, base_delay=0.001, max_delay=0.01)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertAlmostEqual(parse_retry_after(formatdate(time.time() + 60, usegmt=True)), 60, delta=2)
+
+    def test_idempotency(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry_status("GET", 503))
+        self.assertFalse(policy.should_retry_status("POST", 503))
+        self.assertTrue(policy.should_retry_status("POST", 429))
+        self.assertFalse(policy.should_retry_status("GET", 400))
+        self.assertTrue(policy.should_retry_error("POST", request_sent=False))
+        self.assertFalse(policy.should_retry_error("POST", request_sent=True))
+        self.assertTrue(policy.should_retry_status("POST", 503, idempotent=True))
+        self.assertTrue(policy.should_retry_error("POST", request_sent=True, idempotent=True))
+
+    def test_decorrelated_jitter_bounds(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=2.0)
+        delay = policy.base_delay
+        for _ in range(100):
+            next_delay = policy.next_delay(delay)
+            self.assertGreaterEqual(next_delay, 0.1)
+            self.assertLessEqual(next_delay, min(2.0, delay * 3))
+            delay = next_delay
+
+
+class TestClientRetries(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        credentials = Credentials("key", "passphrase", "secret", "portfolio", "entity", "account")
+        self.client = Client(credentials, retry_policy=FAST)
+        self.client.http_base_url = self.server.base_url
+
+    def tearDown(self):
+        self.server.__exit__()
+        self.client.close()
+
+    def test_get_retried_until_success(self):
+        self.server.enqueue(503)
+        self.server.enqueue(502)
+        self.server.enqueue(200, {"ok": True})
+        response = self.client.request("GET", "/portfolios")
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_each_attempt_is_signed(self):
+        self.server.enqueue(503)
+        self.client.request("GET", "/portfolios")
+        for _, _, headers, _, _ in self.server.requests:
+            self.assertIn("X-CB-ACCESS-SIGNATURE", headers)
+
+    def test_post_not_retried_on_server_error(self):
+        self.server.enqueue(503, {"message": "unavailable"})
+        with self.assertRaises(PrimeAPIError) as error:
+            self.client.request("POST", "/portfolios/p1/order", body={"side": "BUY"})
+        self.assertEqual(error.exception.status_code, 503)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_post_retried_on_429(self):
+        self.server.enqueue(429)
+        self.server.enqueue(200, {"order_id": "o1"})
+        response = self.client.request("POST", "/portfolios/p1/order", body={"side": "BUY"})
+        self.assertEqual(response.json(), {"order_id": "o1"})
+        self.assertEqual(self.server.requests[0][3], self.server.requests[1][3])
+
+    def test_retry_after_honoured(self):
+        self.server.enqueue(429, headers={"Retry-After": "0.3"})
+        self.client.request("GET", "/portfolios")
+        first, second = self.server.requests
+        self.assertGreaterEqual(second[4] - first[4], 0.29)
+
+    def test_gives_up_after_max_attempts(self):
+        for _ in range(5):
+            self.server.enqueue(500, {"message": "boom"})
+        with self.assertRaisesRegex(PrimeAPIError, "status 500: boom"):
+            self.client.request("GET", "/portfolios")
+        self.assertEqual(len(self.server.requests), FAST.max_attempts)
+
+    def test_total_retry_time_capped(self):
+        self.client.retry_policy = RetryPolicy(max_attempts=10, base_delay=0.001, max_total_time=0.5)
+        self.server.enqueue(429, headers={"Retry-After": "5"})
+        start = time.monotonic()
+        with self.assertRaises(PrimeAPIError):
+            self.client.request("GET", "/portfolios")
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_allowed_status_not_retried(self):
+        self.server.enqueue(503)
+        response = self.client.request("GET", "/portfolios", allowed_status_codes=[200, 503])
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def count_attempts_to_closed_port(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        self.client.http_base_url = f"http://127.0.0.1:{port}/v1"
+        attempts = []
+        original = self.client.http_client.request
+
+        def counting_request(*args, **kwargs):
+            attempts.append(args)
+            return original(*args, **kwargs)
+
+        self.client.http_client.request = counting_request
+        return attempts
+
+    def test_connection_refused_retried(self):
+        attempts = self.count_attempts_to_closed_port()
+        with self.assertRaises(requests.ConnectionError):
+            self.client.request("GET", "/portfolios")
+        self.assertEqual(len(attempts), FAST.max_attempts)
+
+    def test_post_retried_when_connection_refused(self):
+        """Test that a POST which never reached the server is resent"""
+        attempts = self.count_attempts_to_closed_port()
+        with self.assertRaises(requests.ConnectionError):
+            self.client.request("POST", "/portfolios/p1/order", body={"side": "BUY"})
+        self.assertEqual(len(attempts), FAST.max_attempts)
+
+    def test_no_policy_means_no_retries(self):
+        self.client.retry_policy = None
+        self.server.enqueue(503)
+        with self.assertRaises(PrimeAPIError):
+            self.client.request("GET", "/portfolios")
+        self.assertEqual(len(self.server.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from prime_sdk.list_orders import ListOrdersRequest, ListOrdersResponse
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsRequest, ListPortfolioFillsResponse
+from prime_sdk.model import Fill
+from prime_sdk.sharding import TIME_RANGE_ENDPOINTS, aiter_sharded, iter_sharded, parse_time, split_windows
+from prime_sdk.utils import Pagination
+from helpers import fill_payload
+
+START = datetime(2025, 1, 1)
+
+
+def make_fill(index: int, time: datetime) -> Fill:
+    return Fill(**fill_payload(index, time=time.isoformat() + "Z"))
+
+
+class FakeFillsEndpoint:
+    """Serves fills newest first within [start_date, end_date], paged by offset cursors."""
+
+    def __init__(self, fills, limit=5, latency=0.0):
+        self.fills = sorted(fills, key=lambda fill: fill.time, reverse=True)
+        self.limit = limit
+        self.latency = latency
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        start, end = parse_time(request.start_date), parse_time(request.end_date)
+        matching = [fill for fill in self.fills if start <= parse_time(fill.time) <= end]
+        offset = int(request.pagination.cursor or 0)
+        limit = int(request.pagination.limit or self.limit)
+        page = matching[offset:offset + limit]
+        has_next = offset + limit < len(matching)
+        with self.lock:
+            self.in_flight -= 1
+        return ListPortfolioFillsResponse(
+            fills=page, pagination=Pagination(next_cursor=str(offset + limit) if has_next else "", has_next=has_next))
+
+
+class TestSharding(unittest.TestCase):
+    def setUp(self):
+        self.endpoint = TIME_RANGE_ENDPOINTS["list_portfolio_fills"]
+        self.request = ListPortfolioFillsRequest(portfolio_id="p1", start_date="2025-01-01T00:00:00Z",
+                                                 end_date="2025-01-11T00:00:00Z")
+
+    def test_parse_time(self):
+        self.assertEqual(parse_time("2025-01-31T12:00:00Z"), datetime(2025, 1, 31, 12))
+        self.assertEqual(parse_time("2025-01-31T12:00:00.5Z"), datetime(2025, 1, 31, 12, 0, 0, 500000))
+        self.assertEqual(parse_time("2025-01-31T12:00:00.123456789Z"), datetime(2025, 1, 31, 12, 0, 0, 123456))
+
+    def test_split_windows(self):
+        windows = split_windows(START, START + timedelta(days=10), 4)
+        self.assertEqual(len(windows), 4)
+        self.assertEqual(windows[0][0], START)
+        self.assertEqual(windows[-1][1], START + timedelta(days=10))
+        for (_, end), (start, _) in zip(windows, windows[1:]):
+            self.assertEqual(end, start)
+
+    def test_merged_in_time_order_without_duplicates(self):
+        # one fill per day, including fills exactly on window boundaries
+        fills = [make_fill(i, START + timedelta(days=i)) for i in range(11)]
+        fake = FakeFillsEndpoint(fills, limit=100)
+        items = list(iter_sharded(fake, self.request, self.endpoint, shards=5, max_workers=3))
+        self.assertEqual([item.id for item in items], [f"fill-{i}" for i in range(11)])
+
+    def test_windows_fetched_in_parallel(self):
+        fills = [make_fill(i, START + timedelta(hours=6 * i)) for i in range(40)]
+        fake = FakeFillsEndpoint(fills, limit=100, latency=0.02)
+        items = list(iter_sharded(fake, self.request, self.endpoint, shards=8, max_workers=4))
+        self.assertEqual(len(items), 40)
+        self.assertGreater(fake.max_in_flight, 1)
+        self.assertLessEqual(fake.max_in_flight, 4)
+
+    def test_dense_window_is_split(self):
+        sparse = [make_fill(i, START + timedelta(days=i)) for i in range(10)]
+        dense = [make_fill(100 + i, START + timedelta(days=9, minutes=i)) for i in range(30)]
+        fake = FakeFillsEndpoint(sparse + dense, limit=5)
+        items = list(iter_sharded(fake, self.request, self.endpoint, shards=2, max_workers=2,
+                                  min_window=timedelta(hours=1)))
+        self.assertEqual(len(items), 40)
+        self.assertEqual(items, sorted(items, key=lambda item: parse_time(item.time)))
+        spans = {parse_time(r.end_date) - parse_time(r.start_date) for r in fake.requests}
+        self.assertLess(min(spans), timedelta(days=1))
+
+    def test_page_size_and_min_window(self):
+        fills = [make_fill(i, START + timedelta(seconds=i)) for i in range(12)]
+        fake = FakeFillsEndpoint(fills)
+        items = list(iter_sharded(fake, self.request, self.endpoint, shards=1, page_size=5,
+                                  min_window=timedelta(days=30)))
+        self.assertEqual(len(items), 12)
+        self.assertEqual(len(fake.requests), 3)
+        self.assertEqual(fake.requests[0].pagination.limit, "5")
+
+    def test_datetime_request_fields(self):
+        requests = []
+
+        def fetch(request):
+            requests.append(request)
+            return ListOrdersResponse(orders=[], pagination=Pagination(next_cursor="", has_next=False))
+
+        request = ListOrdersRequest(portfolio_id="p1", start_date=START, end_date=START + timedelta(days=2))
+        list(iter_sharded(fetch, request, TIME_RANGE_ENDPOINTS["list_orders"], shards=2))
+        self.assertEqual(sorted((r.start_date, r.end_date) for r in requests),
+                         [(START, START + timedelta(days=1)), (START + timedelta(days=1), START + timedelta(days=2))])
+
+    def test_start_required(self):
+        with self.assertRaises(ValueError):
+            iter_sharded(lambda request: None, ListOrdersRequest(portfolio_id="p1"),
+                         TIME_RANGE_ENDPOINTS["list_orders"])
+
+    def test_async(self):
+        fills = [make_fill(i, START + timedelta(days=i)) for i in range(11)]
+        fake = FakeFillsEndpoint(fills, limit=3)
+
+        async def fetch(request):
+            await asyncio.sleep(0)
+            return fake(request)
+
+        async def collect():
+            return [item.id async for item in aiter_sharded(fetch, self.request, self.endpoint, shards=3,
+                                                            min_window=timedelta(hours=1))]
+
+        self.assertEqual(asyncio.run(collect()), [f"fill-{i}" for i in range(11)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from prime_sdk import PrimeClient
+from prime_sdk.cancel_order import CancelOrderRequest
+from prime_sdk.errors import DeadlineExceededError, PrimeAPIError
+from prime_sdk.get_portfolio import GetPortfolioRequest, GetPortfolioResponse
+from prime_sdk.single_flight import SingleFlight, SingleFlightStats
+from prime_sdk.timeouts import Deadline
+from stub_server import CREDENTIALS, StubServer
+
+
+def portfolio(portfolio_id):
+    return {"portfolio": {"id": portfolio_id, "name": "Main", "entity_id": "e1", "organization_id": "o1",
+                          "entity_name": "Entity"}}
+
+
+class TestSingleFlight(unittest.TestCase):
+    def run_together(self, count, function):
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            return [future.result() for future in [pool.submit(function) for _ in range(count)]]
+
+    def test_concurrent_calls_share_one(self):
+        flight = SingleFlight()
+        calls = []
+
+        def call():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        results = self.run_together(5, lambda: flight.do("key", call))
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats(), SingleFlightStats(sent=1, coalesced=4))
+        self.assertEqual(flight.stats().calls, 5)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = SingleFlight()
+        self.assertEqual([flight.do("key", lambda: i) for i in range(3)], [0, 1, 2])
+        self.assertEqual(flight.stats(), SingleFlightStats(sent=3))
+        flight.reset_stats()
+        self.assertEqual(flight.stats(), SingleFlightStats())
+
+    def test_error_raised_to_every_waiter(self):
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise PrimeAPIError(500, "boom")
+
+        def call():
+            try:
+                flight.do("key", fail)
+            except PrimeAPIError as e:
+                return e.status_code
+
+        self.assertEqual(self.run_together(3, call), [500] * 3)
+        self.assertEqual(flight.stats(), SingleFlightStats(sent=1, coalesced=2))
+
+    def test_waiter_deadline(self):
+        flight = SingleFlight()
+        leader = threading.Thread(target=flight.do, args=("key", lambda: time.sleep(0.2)))
+        leader.start()
+        time.sleep(0.02)
+        with self.assertRaises(DeadlineExceededError):
+            flight.do("key", lambda: None, Deadline(0.05))
+        leader.join()
+
+    def test_waiter_resends_when_leader_deadline_expires(self):
+        flight = SingleFlight()
+
+        def expire():
+            time.sleep(0.1)
+            raise DeadlineExceededError("deadline exceeded")
+
+        leader = threading.Thread(target=lambda: self.assertRaises(DeadlineExceededError, flight.do, "key", expire))
+        leader.start()
+        time.sleep(0.02)
+        self.assertEqual(flight.do("key", lambda: "fresh", Deadline(5)), "fresh")
+        leader.join()
+        self.assertEqual(flight.stats(), SingleFlightStats(sent=2, coalesced=0))
+
+
+class TestClientCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.flight = SingleFlight()
+        self.client = PrimeClient(CREDENTIALS, pool_maxsize=8, single_flight=self.flight)
+        self.client.client.http_base_url = self.server.base_url
+        self.addCleanup(self.client.close)
+
+    def handle(self, method, path, body):
+        time.sleep(0.1)
+        if method == "POST":
+            return 200, {}, {"id": "o1"}
+        return 200, {}, portfolio(path.split("/")[-1])
+
+    def test_identical_gets_send_one_request(self):
+        self.server.handler = self.handle
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(lambda i: self.client.get_portfolio(GetPortfolioRequest(f"p{i % 2}")),
+                                      range(8)))
+        self.assertTrue(all(isinstance(r, GetPortfolioResponse) for r in responses))
+        self.assertEqual([r.portfolio.id for r in responses], [f"p{i % 2}" for i in range(8)])
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.flight.stats(), SingleFlightStats(sent=2, coalesced=6))
+
+    def test_posts_are_not_coalesced(self):
+        self.server.handler = self.handle
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: self.client.cancel_order(CancelOrderRequest("p1", "o1")), range(4)))
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.flight.stats(), SingleFlightStats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+from prime_sdk import PrimeClient
+from prime_sdk.credentials import Credentials
+from prime_sdk.lazy import lazy_decoding
+from prime_sdk.list_portfolio_fills import ListPortfolioFillsRequest
+from prime_sdk.model import Fill
+from prime_sdk.streaming import iter_json_array, iter_streamed_items
+from helpers import fill_payload
+from stub_server import StubServer
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+# A non-ASCII order_id, so that chunk boundaries can fall inside a character
+ORDER_ID = "order-é中"
+
+
+class TestIterJsonArray(unittest.TestCase):
+    def test_any_chunk_size(self):
+        fills = [fill_payload(i, order_id=ORDER_ID) for i in range(5)]
+        payload = {"total": 12345, "fills": fills + [[1, {"a": []}], 678, -1.5e3, None, True],
+                   "pagination": {"next_cursor": "cé", "has_next": False}}
+        data = json.dumps(payload, ensure_ascii=False, indent=1).encode()
+        for size in (1, 2, 7, len(data)):
+            fields = {}
+            items = list(iter_json_array(chunked(data, size), "fills", fields))
+            self.assertEqual(items, payload["fills"], size)
+            self.assertEqual(fields, {"total": 12345, "pagination": payload["pagination"]}, size)
+
+    def test_empty_missing_and_null_arrays(self):
+        for body in (b'{"fills": [], "a": 1}', b'{"a": 1}', b'{"fills": null, "a": 1}'):
+            fields = {}
+            self.assertEqual(list(iter_json_array(chunked(body, 3), "fills", fields)), [])
+            self.assertEqual(fields["a"], 1)
+        self.assertEqual(list(iter_json_array([b" {} "], "fills")), [])
+
+    def test_items_yielded_before_body_ends(self):
+        def chunks():
+            yield b'{"fills": [{"id": 1}, '
+            raise AssertionError("read past the first item")
+
+        self.assertEqual(next(iter_json_array(chunks(), "fills")), {"id": 1})
+
+    def test_invalid_json(self):
+        for body in (b'[1, 2]', b'{"fills": [1 2]}', b'{"fills": [1, 2]', b'{"fills": [1, {"a": '):
+            with self.assertRaises(ValueError, msg=body):
+                list(iter_json_array(chunked(body, 4), "fills"))
+
+
+class TestStreamedPagination(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.server.handler = self.serve_fills
+        self.client = PrimeClient(Credentials("key", "passphrase", "secret", "portfolio", "entity", "account"))
+        self.client.client.http_base_url = self.server.base_url
+        self.addCleanup(self.client.close)
+        self.request = ListPortfolioFillsRequest(portfolio_id="p1", start_date="2025-01-01T00:00:00Z")
+
+    @staticmethod
+    def serve_fills(method, path, body, total=7):
+        query = parse_qs(urlparse(path).query)
+        start = int(query.get("cursor", ["0"])[0])
+        end = min(total, start + int(query.get("limit", ["3"])[0]))
+        has_next = end < total
+        return 200, {}, {"fills": [fill_payload(i, order_id=ORDER_ID) for i in range(start, end)],
+                         "pagination": {"next_cursor": str(end) if has_next else "", "has_next": has_next}}
+
+    def test_same_items_as_buffered(self):
+        streamed = list(self.client.iter_list_portfolio_fills(self.request, page_size=2, stream=True))
+        self.assertEqual(streamed, list(self.client.iter_list_portfolio_fills(self.request, page_size=2)))
+        self.assertEqual([f.id for f in streamed], [f"fill-{i}" for i in range(7)])
+        self.assertIsInstance(streamed[0], Fill)
+        self.assertEqual(len(self.server.requests), 8)
+
+    def test_small_chunks(self):
+        fills = iter_streamed_items(self.client.client, "list_portfolio_fills", "list_portfolio_fills",
+                                    self.request, "fills", chunk_size=5)
+        self.assertEqual([f.order_id for f in fills], [ORDER_ID] * 7)
+
+    def test_max_items(self):
+        fills = list(self.client.iter_list_portfolio_fills(self.request, max_items=4, stream=True))
+        self.assertEqual(len(fills), 4)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_lazy_decoding(self):
+        with lazy_decoding():
+            fills = list(self.client.iter_list_portfolio_fills(self.request, stream=True))
+        self.assertIsInstance(fills[0], Fill)
+        self.assertIsNot(type(fills[0]), Fill)
+        self.assertEqual(fills[0], Fill(**fill_payload(0, order_id=ORDER_ID)))
+
+    def test_prefetch_not_supported(self):
+        with self.assertRaises(ValueError):
+            self.client.iter_list_portfolio_fills(self.request, prefetch=2, stream=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
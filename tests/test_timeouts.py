@@ -0,0 +1,97 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import requests
+
+from prime_sdk.errors import DeadlineExceededError, PrimeAPIError
+from prime_sdk.list_portfolios import ListPortfoliosRequest
+from prime_sdk.rate_limit import RateLimiter, TokenBucket
+from prime_sdk.retry import RetryPolicy
+from prime_sdk.timeouts import Deadline, call_options, clamp_timeout, current_call_options
+from stub_server import StubServerTestCase
+
+
+class TestCallOptions(unittest.TestCase):
+    def test_clamp_timeout(self):
+        self.assertEqual(clamp_timeout((3, 30), None), (3, 30))
+        self.assertEqual(clamp_timeout(5, None), (5, 5))
+        connect, read = clamp_timeout((3, 30), Deadline(1))
+        self.assertLessEqual(connect, 1)
+        self.assertLessEqual(read, 1)
+        self.assertGreater(read, 0.9)
+
+    def test_nested_deadline_cannot_extend(self):
+        with call_options(deadline=1) as outer:
+            with call_options(deadline=60) as inner:
+                self.assertIs(inner.deadline, outer.deadline)
+            with call_options(deadline=0.5) as inner:
+                self.assertLess(inner.deadline.expires_at, outer.deadline.expires_at)
+        self.assertIsNone(current_call_options().deadline)
+
+
+class TestTimeoutsAndDeadlines(StubServerTestCase):
+    def slow_server(self, seconds):
+        def handler(method, path, body):
+            time.sleep(seconds)
+            return 200, {}, {"portfolios": []}
+        self.server.handler = handler
+
+    def test_read_timeout(self):
+        self.slow_server(0.5)
+        client = self.make_client(timeout=(1, 0.1))
+        with self.assertRaises(requests.ReadTimeout):
+            client.list_portfolios(ListPortfoliosRequest())
+
+    def test_endpoint_timeout(self):
+        self.slow_server(0.5)
+        client = self.make_client(endpoint_timeouts={"list_portfolios": 0.1})
+        with self.assertRaises(requests.ReadTimeout):
+            client.list_portfolios(ListPortfoliosRequest())
+
+    def test_deadline_bounds_slow_request(self):
+        self.slow_server(1)
+        client = self.make_client()
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            client.list_portfolios(ListPortfoliosRequest(), deadline=0.2)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_deadline_stops_retries(self):
+        self.server.default = (503, {}, {"message": "unavailable"})
+        client = self.make_client(retry_policy=RetryPolicy(max_attempts=100, base_delay=0.05, max_delay=0.05))
+        start = time.monotonic()
+        with self.assertRaises(PrimeAPIError):
+            client.list_portfolios(ListPortfoliosRequest(), deadline=0.3)
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertLess(len(self.server.requests), 10)
+
+    def test_deadline_bounds_rate_limit_wait(self):
+        limiter = RateLimiter(default=TokenBucket(rate=1, capacity=1))
+        client = self.make_client(rate_limiter=limiter)
+        client.list_portfolios(ListPortfoliosRequest())
+        with self.assertRaises(DeadlineExceededError):
+            client.list_portfolios(ListPortfoliosRequest(), deadline=0.2)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_no_deadline_succeeds(self):
+        client = self.make_client()
+        self.server.enqueue(200, {"portfolios": []})
+        self.assertEqual(client.list_portfolios(ListPortfoliosRequest()).portfolios, [])
+
+
+if __name__ == '__main__':
+    unittest.main()